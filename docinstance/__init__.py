@@ -1,3 +1,4 @@
 """Module for representing a docstring as an instance of a Docstring class."""
 # pylint: disable=C0103
 name = 'docinstance'
+__version__ = '0.0.1'
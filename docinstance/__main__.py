@@ -0,0 +1,52 @@
+"""Command line interface of docinstance.
+
+Usage: python -m docinstance bake [--width WIDTH] [--tabsize TABSIZE] [--jobs JOBS] PATH [PATH ...]
+
+"""
+import argparse
+import sys
+from docinstance import bake
+
+
+def main(args=None):
+    """Run the command line interface.
+
+    Parameters
+    ----------
+    args : {list of str, None}
+        Command line arguments.
+        If None, then the arguments are taken from `sys.argv`.
+
+    Returns
+    -------
+    exit_code : int
+
+    """
+    parser = argparse.ArgumentParser(prog='python -m docinstance')
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.required = True
+
+    bake_parser = subparsers.add_parser(
+        'bake', help='Render the docstrings of the Docstring instances into the source files.'
+    )
+    bake_parser.add_argument('paths', nargs='+', metavar='PATH',
+                             help='Source files or directories that contain them.')
+    bake_parser.add_argument('--width', type=int, default=100,
+                             help='Maximum number of characters in each line.')
+    bake_parser.add_argument('--tabsize', type=int, default=4,
+                             help='Number of spaces that corresponds to one tab.')
+    bake_parser.add_argument('--jobs', type=int, default=1, help='Number of processes.')
+
+    args = parser.parse_args(args)
+    results = bake.bake(args.paths, width=args.width, tabsize=args.tabsize, jobs=args.jobs)
+    for result in results:
+        if result.changed:
+            print('baked {0} ({1} docstrings)'.format(result.path, result.baked))
+        for qualname in result.skipped:
+            print('skipped {0}: {1} has no docstring literal'.format(result.path, qualname),
+                  file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,251 @@
+"""Ahead-of-time rendering of the docstrings into the source files.
+
+The docstrings of the objects with a `_docinstance` attribute are rendered and written over the
+docstring literals in the source files, so that the modules carry their final docstrings and do not
+need to be wrapped (e.g. by `docstring_modify_import`) when they are imported.
+
+Each module is imported to evaluate its Docstring instances, so the modules must be importable (e.g.
+their dependencies must be installed). The docstring literals are located with `ast` and rewritten
+in place, so the rest of the source file (e.g. comments and formatting) is left untouched.
+
+"""
+import ast
+import hashlib
+import io
+import os
+import sys
+import importlib
+import importlib.util
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import tokenize
+from docinstance.utils import _same_file, _check_jobs
+from docinstance.wrapper import collect_members_recursive, _member_key, _render
+from docinstance.scan import _module_name, _docstring_nodes, find_sources
+
+
+class BakeResult(namedtuple('BakeResult', ['path', 'baked', 'skipped', 'changed'])):
+    """Result of baking the docstrings of a source file.
+
+    Attributes
+    ----------
+    path : str
+        Path to the source file.
+    baked : int
+        Number of docstrings that were rendered into the source file.
+    skipped : tuple of str
+        Qualified names of the objects with a Docstring instance but without a docstring literal in
+        the source file (or that could not be located).
+    changed : bool
+        True if the source file was modified.
+
+    """
+
+    __slots__ = ()
+
+
+def _import_file(path):
+    """Import the module of the source file.
+
+    Parameters
+    ----------
+    path : str
+        Path to the source file.
+
+    Returns
+    -------
+    module : module
+        Module that is created from the source file.
+
+    Notes
+    -----
+    The module is imported by its name, so that its package and relative imports are resolved as
+    usual. If a different module is imported under that name (e.g. a module with the same name was
+    already imported from another directory, or the name is shadowed by the standard library), then
+    the source file is loaded by its path under a name that is unique to the path.
+
+    """
+    name, root = _module_name(path)
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    module = importlib.import_module(name)
+    module_file = getattr(module, '__file__', None)
+    if module_file is not None and _same_file(module_file, path):
+        return module
+
+    path = os.path.abspath(path)
+    unique_name = '_docinstance_bake_{0}'.format(
+        hashlib.blake2b(path.encode('utf-8'), digest_size=8).hexdigest()
+    )
+    spec = importlib.util.spec_from_file_location(unique_name, path)
+    module = importlib.util.module_from_spec(spec)
+    # NOTE: relative imports are resolved against the package of the module
+    module.__package__ = name.rpartition('.')[0]
+    # NOTE: module is registered so that its members can be traced back to the source file
+    sys.modules[unique_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[unique_name]
+        raise
+    return module
+
+
+def _make_literal(doc):
+    """Return the string literal of the docstring.
+
+    Parameters
+    ----------
+    doc : str
+        Docstring.
+
+    Returns
+    -------
+    literal : str
+        Triple quoted string literal.
+        Raw string is used if the docstring contains backslashes and can be represented as one.
+
+    """
+    if '\\' in doc and '"""' not in doc and not doc.endswith(('\\', '"')):
+        return 'r"""{0}"""'.format(doc)
+    doc = doc.replace('\\', '\\\\').replace('"""', '\\"\\"\\"')
+    if doc.endswith('"'):
+        doc = doc[:-1] + '\\"'
+    return '"""{0}"""'.format(doc)
+
+
+def bake_source(source, module, width=100, tabsize=4):
+    """Return the source code in which the docstrings of the module are rendered.
+
+    Parameters
+    ----------
+    source : str
+        Source code of the module.
+    module : module
+        Module that is created from the source code.
+    width : {int, 100}
+        Maximum number of characters allowed in each line.
+        Default is 100.
+    tabsize : {int, 4}
+        Number of spaces that corresponds to one tab.
+        Default is 4.
+
+    Returns
+    -------
+    source : str
+        Source code with the rendered docstrings.
+    baked : int
+        Number of docstrings that were rendered.
+    skipped : tuple of str
+        Qualified names of the objects whose docstring literal could not be found.
+
+    """
+    nodes = _docstring_nodes(ast.parse(source))
+    # NOTE: unlike str.splitlines, lines are split only at the line endings recognized by ast
+    lines = io.StringIO(source, newline='').readlines()
+    replacements = []
+    skipped = []
+    # pylint: disable=W0212
+    for member, _ in collect_members_recursive(module):
+        if not hasattr(member, '_docinstance'):
+            continue
+        key = _member_key(member)
+        node, depth = nodes.get(key, (None, None))
+        if node is None:
+            skipped.append(key)
+            continue
+        doc = _render(member._docinstance, width, depth, tabsize)
+        # NOTE: docstring without newlines ends with the indentation of the closing quotes
+        if '\n' not in doc:
+            doc = doc.rstrip()
+        replacements.append((node, _make_literal(doc)))
+
+    def char_col(lineno, col_offset):
+        """Convert the offset in UTF-8 bytes (used by ast) into the offset in characters."""
+        return len(lines[lineno - 1].encode('utf-8')[:col_offset].decode('utf-8'))
+
+    # replace from the end of the file so that the earlier positions remain valid
+    replacements.sort(key=lambda i: (i[0].lineno, i[0].col_offset), reverse=True)
+    for node, literal in replacements:
+        start = char_col(node.lineno, node.col_offset)
+        end = char_col(node.end_lineno, node.end_col_offset)
+        new_line = lines[node.lineno - 1][:start] + literal + lines[node.end_lineno - 1][end:]
+        lines[node.lineno - 1:node.end_lineno] = [new_line]
+    return ''.join(lines), len(replacements), tuple(skipped)
+
+
+def bake_file(path, width=100, tabsize=4):
+    """Render the docstrings of the source file into the file.
+
+    Parameters
+    ----------
+    path : str
+        Path to the source file.
+    width : {int, 100}
+        Maximum number of characters allowed in each line.
+        Default is 100.
+    tabsize : {int, 4}
+        Number of spaces that corresponds to one tab.
+        Default is 4.
+
+    Returns
+    -------
+    result : BakeResult
+        Result of baking the file.
+
+    Notes
+    -----
+    The module is imported (and is kept in `sys.modules`) to evaluate its Docstring instances. The
+    encoding and the line endings of the file are preserved.
+
+    """
+    with open(path, 'rb') as source_file:
+        data = source_file.read()
+    encoding, _ = tokenize.detect_encoding(iter(data.splitlines(keepends=True)).__next__)
+    source = data.decode(encoding)
+
+    module = _import_file(path)
+    new_source, baked, skipped = bake_source(source, module, width=width, tabsize=tabsize)
+    changed = new_source != source
+    if changed:
+        with open(path, 'wb') as source_file:
+            source_file.write(new_source.encode(encoding))
+    return BakeResult(path, baked, skipped, changed)
+
+
+def bake(paths, width=100, tabsize=4, jobs=1):
+    """Render the docstrings of the source files into the files.
+
+    Parameters
+    ----------
+    paths : list of str
+        Source files and directories in which the source files are searched recursively.
+    width : {int, 100}
+        Maximum number of characters allowed in each line.
+        Default is 100.
+    tabsize : {int, 4}
+        Number of spaces that corresponds to one tab.
+        Default is 4.
+    jobs : {int, 1}
+        Number of processes that bake the files.
+        If 1, then the files are baked in the current process.
+        Default is 1.
+
+    Returns
+    -------
+    results : list of BakeResult
+        Result of baking each file.
+
+    Raises
+    ------
+    ValueError
+        If `jobs` is not a positive integer.
+
+    """
+    _check_jobs(jobs)
+    sources = [source for path in paths for source in find_sources(path)]
+    if jobs == 1:
+        return [bake_file(path, width=width, tabsize=tabsize) for path in sources]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(bake_file, sources, [width] * len(sources),
+                             [tabsize] * len(sources)))
@@ -0,0 +1,155 @@
+"""Process-wide cache for the rendered docstrings of the docstring contents.
+
+The cache is disabled by default, since fingerprinting the contents costs more than it saves when
+most of the contents are unique. It can be enabled by setting the maximum size of `render_cache`,
+e.g. `render_cache.maxsize = 4096`, when many objects share the same contents.
+
+"""
+from collections import OrderedDict
+import threading
+
+
+class RenderCache:
+    """Least recently used cache of the rendered docstrings of DocContent instances.
+
+    Contents that are structurally identical (e.g. the same `Raises` section or the same `tabsize`
+    parameter used in multiple objects) are rendered only once for the given style, width,
+    indentation, and tab size. Contents are identified by their classes and fingerprints.
+
+    Attributes
+    ----------
+    maxsize : int
+        Maximum number of rendered docstrings that are stored.
+    hits : int
+        Number of times that a rendered docstring was found in the cache.
+    misses : int
+        Number of times that a rendered docstring was not found in the cache.
+
+    Methods
+    -------
+    __init__(self, maxsize=4096)
+        Initialize.
+    render(self, content, docstring_func, width, indent_level, tabsize)
+        Return the docstring of the content using the cache.
+    clear(self)
+        Remove all of the stored docstrings and reset the statistics.
+    info(self)
+        Return the statistics of the cache.
+
+    """
+
+    def __init__(self, maxsize=4096):
+        """Initialize.
+
+        Parameters
+        ----------
+        maxsize : {int, 4096}
+            Maximum number of rendered docstrings that are stored.
+            If zero, then the cache is disabled, i.e. the docstrings are rendered directly without
+            looking them up in the cache (or updating the statistics).
+            Default is 4096.
+
+        Raises
+        ------
+        TypeError
+            If maxsize is not an integer.
+        ValueError
+            If maxsize is negative.
+
+        """
+        if not isinstance(maxsize, int):
+            raise TypeError('Maximum size of the cache must be given as an integer.')
+        if maxsize < 0:
+            raise ValueError('Maximum size of the cache must be greater than or equal to zero.')
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def hit_rate(self):
+        """Return the fraction of the lookups that were found in the cache.
+
+        Returns
+        -------
+        hit_rate : float
+            Number of hits divided by the number of lookups.
+            Zero if there were no lookups.
+
+        """
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+    def render(self, content, docstring_func, width, indent_level, tabsize):
+        """Return the docstring of the content using the cache.
+
+        Parameters
+        ----------
+        content : DocContent
+            Content whose docstring is rendered.
+        docstring_func : str
+            Name of the method of the content that renders the docstring, e.g.
+            'make_numpy_docstring'.
+        width : int
+            Maximum number of characters allowed in a line.
+        indent_level : int
+            Number of indents (tabs) that are needed for the docstring.
+        tabsize : int
+            Number of spaces that corresponds to a tab.
+
+        Returns
+        -------
+        content_docstring : str
+            Docstring of the given content.
+
+        """
+        if self.maxsize == 0:
+            return getattr(content, docstring_func)(width, indent_level, tabsize)
+        key = (type(content), content.fingerprint, docstring_func, width, indent_level, tabsize)
+        with self._lock:
+            try:
+                output = self._cache[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return output
+
+        output = getattr(content, docstring_func)(width, indent_level, tabsize)
+
+        with self._lock:
+            if self.maxsize > 0:
+                self._cache[key] = output
+                if len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+        return output
+
+    def clear(self):
+        """Remove all of the stored docstrings and reset the statistics."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        """Return the statistics of the cache.
+
+        Returns
+        -------
+        info : dict
+            Dictionary with the number of hits ('hits'), the number of misses ('misses'), the
+            fraction of the lookups that were hits ('hit_rate'), the maximum size ('maxsize'), and
+            the current size ('size') of the cache.
+
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'hit_rate': self.hit_rate,
+                    'maxsize': self.maxsize, 'size': len(self._cache)}
+
+
+# pylint: disable=C0103
+render_cache = RenderCache(maxsize=0)
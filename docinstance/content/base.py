@@ -1,4 +1,485 @@
 """Base class for docstring contents."""
+import hashlib
+import weakref
+
+# NOTE: each docstring, content, and ContentList keeps track of the objects whose cached values
+#       (e.g. fingerprint) were derived from it (i.e. its dependents). When it is modified, its
+#       own cached values and the cached values of its dependents (and of their dependents) are
+#       discarded, so the modification of one docstring does not affect the cached values of the
+#       others. The bookkeeping is created only when a value is first cached (e.g. the fingerprint
+#       or the index is requested), so parsing and rendering do not pay for it. Objects without
+#       any cached values or dependents store None, so they are skipped quickly. Otherwise, they
+#       store an empty tuple, a weak reference to their only dependent (most contents belong to a
+#       single docstring), or a dict of the weak references to their dependents.
+
+
+def _iter_dependents(dependents):
+    """Return the weak references to the dependents.
+
+    Parameters
+    ----------
+    dependents : {tuple, weakref.ref, dict}
+        Dependents stored in the attribute `_dependents`.
+
+    Returns
+    -------
+    refs : iterable of weakref.ref
+
+    """
+    # pylint: disable=C0123
+    if type(dependents) is dict:
+        return dependents.values()
+    if type(dependents) is weakref.ref:
+        return (dependents,)
+    return dependents
+
+
+def _invalidate(node):
+    """Discard the cached values of the object and of the objects that depend on it.
+
+    Parameters
+    ----------
+    node : {DocContent, Docstring, ContentList}
+        Object that was modified.
+
+    """
+    if getattr(node, '_dependents', None) is None:
+        return
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        dependents = getattr(node, '_dependents', None)
+        if dependents is None:
+            continue
+        object.__setattr__(node, '_dependents', None)
+        for name in node._cache_slots:  # pylint: disable=W0212
+            object.__setattr__(node, name, None)
+        stack.extend(i for i in (ref() for ref in _iter_dependents(dependents)) if i is not None)
+
+
+def _add_dependent(node, dependent):
+    """Record that the cached values of the dependent are derived from the given object.
+
+    Parameters
+    ----------
+    node : object
+        Object from which the cached values are derived.
+        Objects whose modifications are not tracked (e.g. strings and frozen contents) are ignored.
+    dependent : {DocContent, Docstring}
+        Object whose cached values are derived from the node.
+
+    """
+    # pylint: disable=C0123,W0212
+    if not (type(node) is ContentList or getattr(type(node), '_mutable', False)):
+        return
+    # NOTE: weak references without callbacks to the same object are shared, so the dependents
+    #       do not keep separate references for each of their contents
+    ref = weakref.ref(dependent)
+    dependents = getattr(node, '_dependents', None)
+    if not dependents:
+        dependents = ref
+    elif type(dependents) is weakref.ref:
+        if dependents is ref:
+            return
+        if dependents() is None:
+            dependents = ref
+        else:
+            dependents = {id(dependents()): dependents, id(dependent): ref}
+    else:
+        dependents[id(dependent)] = ref
+        return
+    object.__setattr__(node, '_dependents', dependents)
+
+
+def _add_dependents(value, dependent):
+    """Record that the cached values of the dependent are derived from the given value.
+
+    Parameters
+    ----------
+    value : object
+        Value of an attribute of the dependent.
+        Items of ContentList and tuples (and of the ContentList and tuples within them) are also
+        recorded, since their modifications change the cached values of the dependent.
+    dependent : {DocContent, Docstring}
+        Object whose cached values are derived from the value.
+
+    """
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        _add_dependent(value, dependent)
+        # pylint: disable=C0123
+        if type(value) is ContentList or isinstance(value, tuple):
+            stack.extend(value)
+
+
+def _make_tracked_method(name):
+    """Return a method of list that discards the cached values after it is executed.
+
+    Parameters
+    ----------
+    name : str
+        Name of the method of list.
+
+    Returns
+    -------
+    method : function
+        Method that modifies the list.
+
+    """
+    list_method = getattr(list, name)
+
+    def method(self, *args, **kwargs):
+        """Modify the list and then discard the cached values that depend on it."""
+        output = list_method(self, *args, **kwargs)
+        _invalidate(self)
+        return output
+
+    method.__name__ = name
+    method.__doc__ = list_method.__doc__
+    return method
+
+
+class ContentList(list):
+    """List of the contents of a docstring that keeps track of its modifications.
+
+    Any in-place modification of the list invalidates the cached values (e.g. fingerprint) of the
+    docstrings and the contents that contain the list.
+
+    """
+
+    # NOTE: lists are never dependents of other objects, so they are not weakly referenced
+    __slots__ = ('_dependents',)
+    _cache_slots = ()
+
+    def __reduce_ex__(self, protocol):
+        """Return the items of the list for pickling.
+
+        Parameters
+        ----------
+        protocol : int
+            Version of the pickle protocol.
+
+        Returns
+        -------
+        reduced : tuple
+            Class and the items of the list (without the objects that depend on the list).
+
+        """
+        return (ContentList, (list(self),))
+
+
+for _name in ['__setitem__', '__delitem__', '__iadd__', '__imul__', 'append', 'extend', 'insert',
+              'pop', 'remove', 'clear', 'sort', 'reverse']:
+    setattr(ContentList, _name, _make_tracked_method(_name))
+
+
+def _setattr_tracked(self, name, value):
+    """Set the attribute and discard the cached values if the contents are changed.
+
+    Lists and tuples are converted to ContentList so that their modifications (and the
+    modifications of the contents within them) are also tracked, as they are when they are given
+    to the constructors. Attributes whose names start with an underscore are not treated as
+    contents.
+
+    Parameters
+    ----------
+    name : str
+        Name of the attribute.
+    value : object
+        Value of the attribute.
+
+    """
+    # pylint: disable=C0123
+    if type(value) is list or type(value) is tuple:
+        value = ContentList(value)
+    object.__setattr__(self, name, value)
+    if not name.startswith('_'):
+        _invalidate(self)
+
+
+def _delattr_tracked(self, name):
+    """Delete the attribute and discard the cached values.
+
+    Parameters
+    ----------
+    name : str
+        Name of the attribute.
+
+    """
+    object.__delattr__(self, name)
+    _invalidate(self)
+
+
+def _reduce_ex(self, protocol):
+    """Return the compact representation of the docstring or its content for pickling.
+
+    Parameters
+    ----------
+    protocol : int
+        Version of the pickle protocol.
+
+    Returns
+    -------
+    reduced : tuple
+        Function that reconstructs the object and the compact representation of the object (see
+        `docinstance.serialize.encode`).
+        If the object or any of its contents is not an instance of a class of docinstance (e.g.
+        custom DocContent or subclasses with additional attributes), or it contains a locally
+        defined class, then the default reduction of the object.
+
+    """
+    # pylint: disable=C0415,W0212
+    from docinstance import serialize
+    try:
+        return serialize._reduce(self)
+    except TypeError:
+        return object.__reduce_ex__(self, protocol)
+
+
+def _copy(self):
+    """Return a shallow copy of the object.
+
+    Returns
+    -------
+    copied : {DocContent, Docstring}
+        Object of the same class whose attributes are the attributes of the object (not their
+        copies).
+        Cached values are not copied.
+
+    """
+    cls = type(self)
+    copied = cls.__new__(cls)
+    _setstate(copied, _getstate(self))
+    return copied
+
+
+def _getstate(self):
+    """Return the attributes of the object for the default reduction.
+
+    Returns
+    -------
+    state : 2-tuple of {dict, None}
+        Attributes stored in `__dict__` and the attributes stored in the slots.
+        Cached values and the objects that depend on the object are not included.
+
+    """
+    cls = type(self)
+    # pylint: disable=W0212
+    excluded = cls._cache_slots + ('_dependents', '__dict__', '__weakref__')
+    slots = {}
+    for i in cls.__mro__:
+        for name in i.__dict__.get('__slots__', ()):
+            if name not in excluded and hasattr(self, name):
+                slots[name] = getattr(self, name)
+    return (getattr(self, '__dict__', None) or None, slots)
+
+
+def _setstate(self, state):
+    """Restore the attributes of the object that was reduced with the default reduction.
+
+    Parameters
+    ----------
+    state : {dict, 2-tuple of dict}
+        Attributes stored in `__dict__`, or the attributes stored in `__dict__` and in the slots.
+
+    Notes
+    -----
+    Attributes are set without `__setattr__` so that the frozen instances can also be restored.
+
+    """
+    if not isinstance(state, tuple):
+        state = (state, None)
+    for attrs in state:
+        for name, value in (attrs or {}).items():
+            object.__setattr__(self, name, value)
+
+
+# values that cannot be modified (in addition to strings, classes, and tuples)
+_immutable_types = (int, float, complex, bytes, type(None))
+
+
+def _update_fingerprint(hasher, value):
+    """Update the hash with the given value.
+
+    Parameters
+    ----------
+    hasher : hashlib.blake2b
+        Hash object.
+    value : {DocContent, Docstring, list/tuple, str, class, object}
+        Value that is added to the hash.
+        Objects with a `fingerprint` attribute are added through their fingerprint.
+        Objects that are not strings, classes, lists or tuples are added through their `repr`.
+
+    Returns
+    -------
+    is_tracked : bool
+        True if all modifications of the value are tracked, i.e. the value is immutable, or it is a
+        ContentList, a docstring, or a content whose values are all tracked.
+        False if the value can be modified without being detected (e.g. dict or set), in which case
+        the fingerprints that include the value are not cached.
+
+    """
+    # pylint: disable=C0123,W0212
+    if hasattr(value, 'fingerprint'):
+        hasher.update(b'C' + value.fingerprint.encode('ascii'))
+        mutable = getattr(type(value), '_mutable', None)
+        return mutable is False or (mutable is True and
+                                    getattr(value, '_fingerprint', None) is not None)
+    if isinstance(value, str):
+        encoded = value.encode('utf-8', 'surrogatepass')
+        hasher.update(b'S' + str(len(encoded)).encode('ascii') + b':' + encoded)
+        return True
+    if isinstance(value, type):
+        name = '{0}.{1}'.format(value.__module__, value.__qualname__).encode('utf-8')
+        hasher.update(b'T' + str(len(name)).encode('ascii') + b':' + name)
+        return True
+    if isinstance(value, (list, tuple)):
+        hasher.update(b'L' + str(len(value)).encode('ascii') + b':')
+        is_tracked = isinstance(value, tuple) or type(value) is ContentList
+        for item in value:
+            is_tracked &= _update_fingerprint(hasher, item)
+        return is_tracked
+    encoded = repr(value).encode('utf-8', 'surrogatepass')
+    hasher.update(b'R' + str(len(encoded)).encode('ascii') + b':' + encoded)
+    return isinstance(value, _immutable_types)
+
+
+def _store_cached(obj, name, value):
+    """Store the value that is derived from the contents of the given object.
+
+    Parameters
+    ----------
+    obj : {DocContent, Docstring}
+        Object with the attribute `name`.
+    name : str
+        Name of the attribute in which the value is cached.
+    value : object
+        Value that is cached.
+
+    Notes
+    -----
+    When the first value is cached for a mutable object, the object is recorded as a dependent of
+    its ContentList attributes and of the docstrings and the contents stored in its attributes
+    (including the ones within ContentList and tuples), so that their modifications discard the
+    cached value.
+
+    """
+    # pylint: disable=W0212
+    if obj._mutable:
+        if getattr(obj, '_dependents', None) is None:
+            object.__setattr__(obj, '_dependents', ())
+        if all(getattr(obj, i, None) is None for i in obj._cache_slots):
+            for field in obj._fields().values():
+                _add_dependents(field, obj)
+    object.__setattr__(obj, name, value)
+
+
+def _get_fingerprint(obj):
+    """Return the (cached) fingerprint of the given docstring or docstring content.
+
+    Parameters
+    ----------
+    obj : {DocContent, Docstring}
+        Object with the methods `_fields` and the attribute `_fingerprint`.
+
+    Returns
+    -------
+    fingerprint : str
+        Hexadecimal digest of the contents of the object.
+
+    Notes
+    -----
+    Fingerprint is not cached if the object contains a value whose modifications are not tracked
+    (e.g. dict or set).
+
+    """
+    fingerprint = getattr(obj, '_fingerprint', None)
+    if fingerprint is not None:
+        return fingerprint
+
+    hasher = hashlib.blake2b(digest_size=16)
+    fields = obj._fields()  # pylint: disable=W0212
+    is_tracked = True
+    for name in sorted(fields):
+        _update_fingerprint(hasher, name)
+        is_tracked &= _update_fingerprint(hasher, fields[name])
+    fingerprint = hasher.hexdigest()
+
+    if is_tracked:
+        _store_cached(obj, '_fingerprint', fingerprint)
+    return fingerprint
+
+
+def _get_cached(obj, name, func):
+    """Return the (cached) value that is derived from the contents of the given object.
+
+    Parameters
+    ----------
+    obj : {DocContent, Docstring}
+        Object with the attribute `name`.
+    name : str
+        Name of the attribute in which the value is cached.
+    func : function
+        Function without arguments that computes the value.
+
+    Returns
+    -------
+    value : object
+        Value returned by `func`.
+
+    Notes
+    -----
+    Similar to the fingerprint, the value is computed again only if the object, one of its
+    ContentList attributes, or one of the docstrings and contents stored in its attributes was
+    modified after the value was computed.
+
+    """
+    value = getattr(obj, name, None)
+    if value is not None:
+        return value
+    value = func()
+    _store_cached(obj, name, value)
+    return value
+
+
+def _get_index(obj, items, key_attr):
+    """Return the (cached) index of the given items by their keys.
+
+    Parameters
+    ----------
+    obj : {DocSection, Docstring}
+        Object that owns the items and has the attribute `_index`.
+    items : list
+        Items that are indexed.
+        Items without the attribute `key_attr` are not indexed.
+    key_attr : {'header', 'name'}
+        Attribute of the items that is used as the key.
+        Headers are indexed in lower case.
+
+    Returns
+    -------
+    index : dict
+        Key to the first item with the key.
+
+    """
+    def make_index():
+        """Return the index of the items."""
+        index = {}
+        for item in items:
+            key = getattr(item, key_attr, None)
+            if key is None:
+                continue
+            if key_attr == 'header':
+                key = key.lower()
+            index.setdefault(key, item)
+        return index
+
+    return _get_cached(obj, '_index', make_index)
+
+
+# names of the slots (that describe the contents) for each class
+_slot_names = {}
 
 
 class DocContent:
@@ -22,8 +503,36 @@ class DocContent:
     make_rst_docstring(self, width, indent_level, tabsize)
         Return the docstring of the content in rst style.
 
+    Attributes
+    ----------
+    fingerprint : str
+        Hexadecimal digest of the contents.
+        Contents that are equal have the same fingerprint, regardless of their classes.
+        Fingerprint is stable across processes and is cached until the content (or any of the
+        contents within it) is modified.
+
+    Notes
+    -----
+    Child classes should declare their attributes in `__slots__` so that the instances do not
+    carry a `__dict__`. Slots whose names start with an underscore are not treated as contents.
+    Slots that store the cached values should also be listed in `_cache_slots`.
+
+    Lists and tuples that are assigned as attributes are converted to ContentList so that their
+    modifications can be tracked. Modifications of other mutable attributes (e.g. dict or set) are
+    not tracked, so the fingerprints of the contents with such attributes are not cached.
+
     """
 
+    __slots__ = ('_fingerprint', '_dependents', '__weakref__')
+    _cache_slots = ('_fingerprint',)
+    _mutable = True
+    __setattr__ = _setattr_tracked
+    __delattr__ = _delattr_tracked
+    __reduce_ex__ = _reduce_ex
+    __getstate__ = _getstate
+    __setstate__ = _setstate
+    __copy__ = _copy
+
     def __init__(self):
         """Initialize.
 
@@ -47,7 +556,11 @@ class DocContent:
         bool
 
         """
-        return isinstance(other, DocContent) and self.__dict__ == other.__dict__
+        if self is other:
+            return True
+        if not isinstance(other, DocContent) or self.fingerprint != other.fingerprint:
+            return False
+        return self._fields() == other._fields()
 
     def __ne__(self, other):
         """Return False if other is DocContent instance with the same contents. True otherwise.
@@ -72,6 +585,45 @@ class DocContent:
         """
         return not self == other
 
+    @property
+    def fingerprint(self):
+        """Return the fingerprint of the contents.
+
+        Returns
+        -------
+        fingerprint : str
+            Hexadecimal digest of the contents.
+
+        """
+        return _get_fingerprint(self)
+
+    def _fields(self):
+        """Return the attributes that describe the contents.
+
+        Returns
+        -------
+        fields : dict of str to object
+            Name of the attribute to its value.
+            Includes the attributes stored in the slots (except for the ones that start with an
+            underscore) and the attributes stored in `__dict__`, if it exists.
+
+        """
+        cls = type(self)
+        try:
+            names = _slot_names[cls]
+        except KeyError:
+            names = tuple(name for i in cls.__mro__ for name in i.__dict__.get('__slots__', ())
+                          if not name.startswith('_'))
+            _slot_names[cls] = names
+        fields = {}
+        for name in names:
+            try:
+                fields[name] = getattr(self, name)
+            except AttributeError:
+                pass
+        fields.update(getattr(self, '__dict__', {}))
+        return fields
+
     def make_numpy_docstring(self, width, indent_level, tabsize):
         """Return the docstring of the content in numpy style.
 
@@ -1,7 +1,8 @@
 """Class for representing a description of objects/errors in the docstring."""
 from docinstance.utils import wrap, wrap_indent_subsequent
-from docinstance.content.base import DocContent
+from docinstance.content.base import DocContent, ContentList, _get_cached
 from docinstance.content.equation import DocEquation
+from docinstance.type_expr import TypeName, parse_type
 
 
 class DocDescription(DocContent):
@@ -25,6 +26,10 @@ class DocDescription(DocContent):
         Allowed types of the given object.
         If multiple classes are given, then the last one is assumed to be the default value.
         Used to describe types of a parameter and of the value returned by a method.
+    types_str : list of str
+        Types where the classes are converted to their names.
+    type_exprs : list of {TypeName, TypeChoice, TypeContainer, TypeMapping}
+        Types as structured type expressions.
     descs : list of {str, DocEquation}
         Descriptions of the given object.
         If multiple descriptions are given, then each string in the list/tuple provides a
@@ -43,6 +48,9 @@ class DocDescription(DocContent):
 
     """
 
+    __slots__ = ('name', 'signature', 'types', 'descs', '_types_str', '_type_exprs')
+    _cache_slots = ('_fingerprint', '_types_str', '_type_exprs')
+
     def __init__(self, name, signature='', types=None, descs=None):
         """Initialize the object.
 
@@ -90,7 +98,7 @@ class DocDescription(DocContent):
                   all(isinstance(i, (type, str)) for i in types)):
             raise TypeError("Types of allowed objects must be given as a class or list/tuple of "
                             "classes/strings.")
-        self.types = list(types)
+        self.types = ContentList(types)
 
         if descs is None:
             descs = []
@@ -100,7 +108,44 @@ class DocDescription(DocContent):
                   all(isinstance(i, (str, DocEquation)) for i in descs)):
             raise TypeError("Descriptions of the object/error must be given as a string or "
                             "list/tuple of strings")
-        self.descs = list(descs)
+        self.descs = ContentList(descs)
+
+    @classmethod
+    def _from_parts(cls, name, signature, types, descs):
+        """Return the description from its parts without checking them.
+
+        Parameters
+        ----------
+        name : str
+            Name of the described object/error.
+        signature : str
+            Signature of the described object.
+        types : list of classes/str
+            Allowed types of the given object.
+            If a ContentList is given, then it is used without being copied.
+        descs : list of {str, DocEquation}
+            Descriptions of the given object.
+            If a ContentList is given, then it is used without being copied.
+
+        Returns
+        -------
+        description : cls
+
+        Notes
+        -----
+        Used by the parser and the deserializer, whose results are already known to be valid. The
+        parts are not checked, so invalid parts will result in an invalid description.
+
+        """
+        desc = cls.__new__(cls)
+        object.__setattr__(desc, 'name', name)
+        object.__setattr__(desc, 'signature', signature)
+        # pylint: disable=C0123
+        object.__setattr__(desc, 'types', types if type(types) is ContentList else
+                           ContentList(types))
+        object.__setattr__(desc, 'descs', descs if type(descs) is ContentList else
+                           ContentList(descs))
+        return desc
 
     @property
     def types_str(self):
@@ -111,8 +156,57 @@ class DocDescription(DocContent):
         types_str : list of str
             Types where the classes are converted to its __name__ attribute.
 
+        Notes
+        -----
+        Strings are cached until the types are modified.
+
+        """
+        return list(_get_cached(self, '_types_str', self._get_types_str))
+
+    def _get_types_str(self):
+        """Return the types as strings.
+
+        Returns
+        -------
+        types_str : tuple of str
+            Types where the classes are converted to its __name__ attribute.
+            Cached strings are used if they exist.
+
+        Notes
+        -----
+        Renderers use the strings without caching them, so that rendering a docstring does not
+        keep track of the modifications of its contents.
+
+        """
+        types_str = getattr(self, '_types_str', None)
+        if types_str is None:
+            types_str = tuple(i.__name__ if isinstance(i, type) else i for i in self.types)
+        return types_str
+
+    @property
+    def type_exprs(self):
+        """Return types as structured type expressions.
+
+        Returns
+        -------
+        type_exprs : list of {TypeName, TypeChoice, TypeContainer, TypeMapping}
+            Types where the classes are converted to TypeName of its __name__ attribute and the
+            strings are parsed into type expressions.
+
+        Raises
+        ------
+        ValueError
+            If a type string is not a valid type expression.
+
+        Notes
+        -----
+        Each distinct type string is parsed once, and the expressions are cached until the types
+        are modified.
+
         """
-        return [i.__name__ if isinstance(i, type) else i for i in self.types]
+        return list(_get_cached(self, '_type_exprs',
+                                lambda: tuple(TypeName(i.__name__) if isinstance(i, type) else
+                                              parse_type(i) for i in self.types)))
 
     def make_numpy_docstring(self, width, indent_level, tabsize):
         """Return the docstring in numpy style.
@@ -157,7 +251,7 @@ class DocDescription(DocContent):
             output += wrap(self.name, width=width, indent_level=indent_level, tabsize=tabsize)[0]
         # var_name : var_type
         elif len(self.types) == 1:
-            name_type = wrap('{0} : {1}'.format(self.name, self.types_str[0]),
+            name_type = wrap('{0} : {1}'.format(self.name, self._get_types_str()[0]),
                              width=width, indent_level=indent_level, tabsize=tabsize)
             # check that the both the name and the type can fit in the given width and indentation
             if len(name_type) > 1:
@@ -167,14 +261,15 @@ class DocDescription(DocContent):
             output += name_type[0]
         # var_name : {var_type1, var_type2, default_type}
         else:
-            name_types = wrap('{0} : {{{1}}}'.format(self.name, ', '.join(self.types_str)),
+            types_str = self._get_types_str()
+            name_types = wrap('{0} : {{{1}}}'.format(self.name, ', '.join(types_str)),
                               width=width, indent_level=indent_level, tabsize=tabsize)
             # if there are too many types to fit into one line, the remaining lines should be
             # indented to line up after "var_name : {"
             wrap_point = len('{0} : {{'.format(self.name))
             # check that the name and first type can fit into the first line
             if not name_types[0].startswith('{0}{1} : {{{2}'.format(' ' * indent_level * tabsize,
-                                                                    self.name, self.types_str[0])):
+                                                                    self.name, types_str[0])):
                 # FIXME: need a better message
                 raise ValueError('The name and the first type of the variable are too long to fit '
                                  'into the given width and indentation.')
@@ -248,7 +343,7 @@ class DocDescription(DocContent):
         else:
             # FIXME: optional parameters need to be specified within google doc
             types_str = [i if isinstance(i, str) else ':obj:`{0}`'.format(j)
-                         for i, j in zip(self.types, self.types_str)]
+                         for i, j in zip(self.types, self._get_types_str())]
             text = '{0} ({1}):'.format(self.name, ', '.join(types_str))
             # if there are too many types to fit into one line, the remaining lines should be
             # indented to line up after "var_name ("
@@ -323,7 +418,7 @@ class DocDescription(DocContent):
             output += '\n'
 
         types_str = [i if isinstance(i, str) else ':obj:`{0}`'.format(j)
-                     for i, j in zip(self.types, self.types_str)]
+                     for i, j in zip(self.types, self._get_types_str())]
         if self.types:
             text = ':type {0}: {1}'.format(self.name, ', '.join(types_str))
             block = [' ' * indent_level * tabsize + line for line in
@@ -20,6 +20,8 @@ class DocEquation(DocContent):
 
     """
 
+    __slots__ = ('equations',)
+
     def __init__(self, equations):
         """Initialize.
 
@@ -36,9 +38,10 @@ class DocEquation(DocContent):
         """
         if not isinstance(equations, str):
             raise TypeError('Equations must be given as one string.')
-        self.equations = equations.split('\n')
-        if self.equations[-1] == '':
-            self.equations = self.equations[:-1]
+        equations = equations.split('\n')
+        if equations[-1] == '':
+            equations = equations[:-1]
+        self.equations = equations
 
     def make_numpy_docstring(self, width, indent_level, tabsize):
         """Return the docstring in numpy style.
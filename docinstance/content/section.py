@@ -1,6 +1,7 @@
 """Class for representing a section in the docstring."""
 from docinstance.utils import wrap, wrap_indent_subsequent
-from docinstance.content.base import DocContent
+from docinstance.cache import render_cache
+from docinstance.content.base import DocContent, ContentList, _get_index
 from docinstance.content.description import DocDescription
 
 
@@ -18,6 +19,10 @@ class DocSection(DocContent):
     -------
     __init__(self, header, contents)
         Initialize.
+    __getitem__(self, name)
+        Return the description with the given name.
+    __contains__(self, name)
+        Return True if the section has a description with the given name. False otherwise.
     make_numpy_docstring(self, width, indent_level, tabsize, include_signature=False)
         Return the docstring in numpy style.
     make_numpy_docstring_signature(self, width, indent_level, tabsize)
@@ -25,6 +30,12 @@ class DocSection(DocContent):
 
     """
 
+    __slots__ = ('header', 'contents', '_index')
+    _cache_slots = ('_fingerprint', '_index')
+    # NOTE: __getitem__ looks up the descriptions by their names, so iterating over the section
+    #       must not fall back to the sequence protocol
+    __iter__ = None
+
     def __init__(self, header, contents):
         """Initialize.
 
@@ -64,7 +75,79 @@ class DocSection(DocContent):
             raise TypeError("The parameter `contents` must be a string, a list/tuple of "
                             "DocDescription, or a list/tuple of strings/DocContent (not "
                             "DocDescription).")
-        self.contents = list(contents)
+        self.contents = ContentList(contents)
+
+    @classmethod
+    def _from_parts(cls, header, contents):
+        """Return the section from its parts without checking them.
+
+        Parameters
+        ----------
+        header : str
+            Name of the section.
+        contents : {list of str/DocContent, list of DocDescription}
+            Contents of the section.
+            If a ContentList is given, then it is used without being copied.
+
+        Returns
+        -------
+        section : cls
+
+        Notes
+        -----
+        Used by the parser and the deserializer, whose results are already known to be valid. The
+        parts are not checked, so invalid parts will result in an invalid section.
+
+        """
+        section = cls.__new__(cls)
+        object.__setattr__(section, 'header', header)
+        # pylint: disable=C0123
+        object.__setattr__(section, 'contents', contents if type(contents) is ContentList else
+                           ContentList(contents))
+        return section
+
+    def __getitem__(self, name):
+        """Return the description with the given name.
+
+        Parameters
+        ----------
+        name : str
+            Name of the description.
+
+        Returns
+        -------
+        description : DocDescription
+            First description in the section with the given name.
+
+        Raises
+        ------
+        TypeError
+            If the name is not a string.
+        KeyError
+            If the section does not have a description with the given name.
+
+        """
+        if not isinstance(name, str):
+            raise TypeError('Name of the description must be a string.')
+        return _get_index(self, self.contents, 'name')[name]
+
+    def __contains__(self, name):
+        """Return True if the section has a description with the given name. False otherwise.
+
+        Parameters
+        ----------
+        name : str
+            Name of the description.
+
+        Returns
+        -------
+        bool
+            False if the name is not a string.
+
+        """
+        if not isinstance(name, str):
+            return False
+        return name in _get_index(self, self.contents, 'name')
 
     # pylint: disable=W0221
     # the extra argument is used in the make_numpy_docstring_signature
@@ -115,9 +198,11 @@ class DocSection(DocContent):
                 output += '\n\n'
             # if isinstance(paragraph, DocContent)
             elif include_signature and hasattr(paragraph, 'make_numpy_docstring_signature'):
-                output += paragraph.make_numpy_docstring_signature(width, indent_level, tabsize)
+                output += render_cache.render(paragraph, 'make_numpy_docstring_signature', width,
+                                              indent_level, tabsize)
             else:
-                output += paragraph.make_numpy_docstring(width, indent_level, tabsize)
+                output += render_cache.render(paragraph, 'make_numpy_docstring', width,
+                                              indent_level, tabsize)
         # pylint: disable=W0120
         # following block clause should always be executed
         else:
@@ -198,7 +283,8 @@ class DocSection(DocContent):
                 output += '\n\n'
             # if isinstance(paragraph, DocContent)
             else:
-                output += paragraph.make_google_docstring(width, indent_level+1, tabsize)
+                output += render_cache.render(paragraph, 'make_google_docstring', width,
+                                              indent_level+1, tabsize)
         # pylint: disable=W0120
         # following block clause should always be executed
         else:
@@ -254,9 +340,8 @@ class DocSection(DocContent):
                 else:
                     output += header
                     output += '\n'
-                    output += paragraph.make_rst_docstring(width=width,
-                                                           indent_level=indent_level+1,
-                                                           tabsize=tabsize)
+                    output += render_cache.render(paragraph, 'make_rst_docstring', width,
+                                                  indent_level+1, tabsize)
                 # indent all susequent content
                 indent_level += 1
             elif isinstance(paragraph, str):
@@ -266,7 +351,8 @@ class DocSection(DocContent):
                 # recognize text that is more than one newline away)
                 output += '\n\n'
             else:
-                output += paragraph.make_rst_docstring(width, indent_level, tabsize)
+                output += render_cache.render(paragraph, 'make_rst_docstring', width,
+                                              indent_level, tabsize)
         # pylint: disable=W0120
         # following block clause should always be executed
         else:
@@ -299,6 +385,8 @@ class Summary(DocSection):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, contents):
         """Initialize.
 
@@ -434,4 +522,6 @@ for class_name, section_header in dict_classname_headers.items():
 
     # globals is the dictionary of the current module for the symbols
     # types is used to instantiate a class (because all classes are instances of type)
-    globals()[class_name] = type(class_name, (DocSection,), {'__init__': make_init(section_header)})
+    # empty __slots__ is given so that the instances do not carry a __dict__
+    globals()[class_name] = type(class_name, (DocSection,), {'__init__': make_init(section_header),
+                                                             '__slots__': ()})
@@ -1,6 +1,6 @@
 """Test docinstance.content.base."""
 import pytest
-from docinstance.content.base import DocContent
+from docinstance.content.base import DocContent, ContentList
 
 
 class ModDocContent(DocContent):
@@ -35,6 +35,173 @@ def test_base_eq():
     assert not test1 == test2
 
 
+def test_base_eq_slots():
+    """Test DocContent.__eq__ on DocContent with __slots__."""
+    class SlotDocContent(DocContent):
+        """DocContent with __slots__."""
+        __slots__ = ('x', '_y')
+
+        def __init__(self, x, y):
+            self.x = x
+            self._y = y
+
+    assert not hasattr(SlotDocContent(1, 2), '__dict__')
+    assert SlotDocContent(1, 2)._fields() == {'x': 1}
+    assert SlotDocContent(1, 2) == SlotDocContent(1, 3)
+    assert SlotDocContent(1, 2) != SlotDocContent(2, 2)
+    test1 = ModDocContent()
+    test1.x = 1
+    assert SlotDocContent(1, 2) == test1
+    test1.y = 1
+    assert SlotDocContent(1, 2) != test1
+
+
+def test_base_fingerprint():
+    """Test DocContent.fingerprint."""
+    test1 = ModDocContent()
+    test1.x = 1
+    test2 = ModDocContent()
+    test2.x = 1
+    assert isinstance(test1.fingerprint, str)
+    assert len(test1.fingerprint) == 32
+    assert test1.fingerprint == test2.fingerprint
+    # cached
+    assert test1._fingerprint == test1.fingerprint
+    # new attribute
+    test2.y = 2
+    assert test1.fingerprint != test2.fingerprint
+    # changed attribute
+    test1.y = 3
+    assert test1.fingerprint != test2.fingerprint
+    test1.y = 2
+    assert test1.fingerprint == test2.fingerprint
+    # deleted attribute
+    del test1.y
+    assert test1.fingerprint != test2.fingerprint
+    # different types of values
+    test1.y = '2'
+    assert test1.fingerprint != test2.fingerprint
+    test1.y = [2]
+    test2.y = (2,)
+    assert test1.fingerprint == test2.fingerprint
+    test1.y = int
+    test2.y = 'int'
+    assert test1.fingerprint != test2.fingerprint
+    # nested
+    test1.y = [ModDocContent()]
+    test2.y = [ModDocContent()]
+    assert test1 == test2
+    test1.y[0].z = 1
+    assert test1.fingerprint != test2.fingerprint
+    assert test1 != test2
+    test2.y[0].z = 1
+    assert test1 == test2
+    # mutation of lists
+    test1.y.append('a')
+    assert test1.fingerprint != test2.fingerprint
+    assert test1 != test2
+    test2.y += ['a']
+    assert test1.fingerprint == test2.fingerprint
+    assert test1 == test2
+
+
+def test_base_fingerprint_invalidation():
+    """Test that only the fingerprints that depend on the modified content are discarded."""
+    shared = ModDocContent()
+    shared.x = 1
+    test1 = ModDocContent()
+    test1.y = [shared]
+    test2 = ModDocContent()
+    test2.y = [shared, 'a']
+    test3 = ModDocContent()
+    test3.y = ['b']
+    fingerprints = [test1.fingerprint, test2.fingerprint, test3.fingerprint]
+    # unrelated modification
+    test3.y.append('c')
+    assert test1._fingerprint is fingerprints[0]
+    assert test2._fingerprint is fingerprints[1]
+    assert test3._fingerprint is None
+    # modification of the shared content
+    shared.x = 2
+    assert test1._fingerprint is None
+    assert test2._fingerprint is None
+    assert test1.fingerprint != fingerprints[0]
+    assert test2.fingerprint != fingerprints[1]
+    # modification of the list that is no longer used
+    old_list = test1.y
+    fingerprint = test1.fingerprint
+    test1.y = ['d']
+    assert test1.fingerprint != fingerprint
+    fingerprint = test1.fingerprint
+    old_list.append('e')
+    assert test1.fingerprint == fingerprint
+    # dependents that no longer exist are replaced
+    shared = ModDocContent()
+    shared.x = 1
+    test1 = ModDocContent()
+    test1.y = [shared]
+    test1.fingerprint  # pylint: disable=W0104
+    del test1
+    test2 = ModDocContent()
+    test2.y = [shared]
+    test2.fingerprint  # pylint: disable=W0104
+    assert shared._dependents() is test2
+    shared.x = 2
+    assert test2._fingerprint is None
+    # contents within tuples
+    test1 = ModDocContent()
+    test1.y = (shared,)
+    assert isinstance(test1.y, ContentList)
+    test1.z = [(shared, 'a')]
+    fingerprint = test1.fingerprint
+    assert test1._fingerprint == fingerprint
+    shared.x = 3
+    assert test1._fingerprint is None
+    assert test1.fingerprint != fingerprint
+
+
+def test_base_fingerprint_untracked():
+    """Test DocContent.fingerprint with values whose modifications are not tracked."""
+    test = ModDocContent()
+    test.x = {'a': 1}
+    parent = ModDocContent()
+    parent.y = [test]
+    fingerprints = (test.fingerprint, parent.fingerprint)
+    assert getattr(test, '_fingerprint', None) is None
+    assert getattr(parent, '_fingerprint', None) is None
+    test.x['a'] = 2
+    assert test.fingerprint != fingerprints[0]
+    assert parent.fingerprint != fingerprints[1]
+    # nested lists are not tracked
+    test.x = [[1]]
+    fingerprint = test.fingerprint
+    test.x[0].append(2)
+    assert test.fingerprint != fingerprint
+    # immutable values
+    test.x = (1, 'a', 1.0, None, int)
+    assert test.fingerprint == test._fingerprint
+
+
+def test_content_list():
+    """Test docinstance.content.base.ContentList."""
+    test = ModDocContent()
+    test.x = [1, 2, 3]
+    assert isinstance(test.x, ContentList)
+    assert test.x == [1, 2, 3]
+    for modify in [lambda x: x.__setitem__(0, 4), lambda x: x.__delitem__(0),
+                   lambda x: x.append(4), lambda x: x.extend([4]), lambda x: x.insert(0, 4),
+                   lambda x: x.pop(), lambda x: x.remove(1), lambda x: x.clear(),
+                   lambda x: x.sort(reverse=True), lambda x: x.reverse()]:
+        test.x = [1, 2, 3]
+        fingerprint = test.fingerprint
+        modify(test.x)
+        assert test.fingerprint != fingerprint
+    test.x = [1, 2, 3]
+    fingerprint = test.fingerprint
+    test.x *= 2
+    assert test.fingerprint != fingerprint
+
+
 def test_base_ne():
     """Test DocContent.__ne__."""
     test1 = ModDocContent()
@@ -1,6 +1,8 @@
 """Test docinstance.content.description."""
 import pytest
+from docinstance.content.base import ContentList
 from docinstance.content.description import DocDescription
+from docinstance.type_expr import TypeName, TypeChoice, TypeMapping
 
 
 def test_init():
@@ -33,6 +35,7 @@ def test_init():
     assert test.signature == ''
     assert test.types == []
     assert test.descs == []
+    assert not hasattr(test, '__dict__')
     test = DocDescription('test', signature='1')
     assert test.signature == '1'
     test = DocDescription('test', types=str)
@@ -45,10 +48,43 @@ def test_init():
     assert test.descs == ['2']
 
 
+def test_from_parts():
+    """Test DocDescription._from_parts."""
+    types = ContentList([int, 'str'])
+    test = DocDescription._from_parts('x', '(a, b)', types, ['desc'])
+    assert test == DocDescription('x', '(a, b)', [int, 'str'], 'desc')
+    assert test.types is types
+    assert isinstance(test.descs, ContentList)
+
+
 def test_types_str():
     """Test DocDescription.types_str."""
     test = DocDescription('test', types=[str, int, 'list of str'])
     assert test.types_str == ['str', 'int', 'list of str']
+    # cached until modified
+    assert test._get_types_str() is test._get_types_str()
+    test.types_str.append('float')
+    assert test.types_str == ['str', 'int', 'list of str']
+    test.types.append(float)
+    assert test.types_str == ['str', 'int', 'list of str', 'float']
+    # rendering does not cache the strings or keep track of the modifications
+    test = DocDescription('test', types=[str, int])
+    test.make_numpy_docstring(100, 0, 4)
+    assert getattr(test, '_types_str', None) is None
+    assert getattr(test, '_dependents', None) is None
+    assert getattr(test.types, '_dependents', None) is None
+
+
+def test_type_exprs():
+    """Test DocDescription.type_exprs."""
+    test = DocDescription('test', types=[str, '{int, 100}', 'dict of str to object'])
+    assert test.type_exprs == [TypeName('str'),
+                               TypeChoice((TypeName('int'), TypeName('100'))),
+                               TypeMapping(('dict',), TypeName('str'), TypeName('object'))]
+    assert test.type_exprs[1] is DocDescription('x', types='{int, 100}').type_exprs[0]
+    test.types[0] = 'list of'
+    with pytest.raises(ValueError):
+        test.type_exprs  # pylint: disable=W0104
 
 
 def test_make_numpy_docstring():
@@ -11,6 +11,7 @@ def test_init():
         DocEquation(['x + 1', 'y + 2'])
     test = DocEquation('a + b = 2')
     assert test.equations == ['a + b = 2']
+    assert not hasattr(test, '__dict__')
     test = DocEquation('a + b &= 2\\\\\nc + d &= 3')
     assert test.equations == ['a + b &= 2\\\\', 'c + d &= 3']
     test = DocEquation('a + b &= 2\\\\\nc + d &= 3\\\\\n')
@@ -4,6 +4,7 @@ from docinstance.content.section import (DocSection, Summary, ExtendedSummary, P
                                          Attributes, Methods, Returns, Yields, OtherParameters,
                                          Raises, Warns, Warnings, SeeAlso, Notes, References,
                                          Examples)
+from docinstance.content.base import ContentList
 from docinstance.content.description import DocDescription
 
 
@@ -25,6 +26,7 @@ def test_init():
     test = DocSection('header name', 'hello')
     assert test.header == 'header name'
     assert test.contents == ['hello']
+    assert not hasattr(test, '__dict__')
     test = DocSection('header name', ['hello', 'i am'])
     assert test.header == 'header name'
     assert test.contents == ['hello', 'i am']
@@ -38,6 +40,52 @@ def test_init():
     assert test.contents == [doc1, doc2]
 
 
+def test_from_parts():
+    """Test DocSection._from_parts."""
+    contents = ContentList([DocDescription('x')])
+    test = Parameters._from_parts('parameters', contents)
+    assert type(test) is Parameters
+    assert test == Parameters(DocDescription('x'))
+    assert test.contents is contents
+    assert isinstance(DocSection._from_parts('x', ['a']).contents, ContentList)
+
+
+def test_getitem():
+    """Test DocSection.__getitem__ and DocSection.__contains__."""
+    test = DocSection('parameters', [DocDescription('x', types=int), DocDescription('y'),
+                                     DocDescription('x', types=str)])
+    assert test['x'] is test.contents[0]
+    assert test['y'] is test.contents[1]
+    assert 'y' in test
+    assert 'z' not in test
+    with pytest.raises(KeyError):
+        test['z']  # pylint: disable=W0104
+    test.contents.append(DocDescription('z'))
+    assert test['z'] is test.contents[3]
+    del test.contents[0]
+    assert test['x'].types == [str]
+    # contents assigned as a tuple
+    desc = DocDescription('x')
+    test.contents = (desc,)
+    assert 'x' in test
+    fingerprint = test.fingerprint
+    desc.name = 'renamed'
+    assert test.fingerprint != fingerprint
+    assert 'x' not in test
+    assert test['renamed'] is desc
+    assert test == DocSection('parameters', [DocDescription('renamed')])
+    test = DocSection('notes', ['x', 'y'])
+    assert 'x' not in test
+    with pytest.raises(KeyError):
+        test['x']  # pylint: disable=W0104
+    # keys must be strings and the section is not iterable
+    with pytest.raises(TypeError):
+        test[0]  # pylint: disable=W0104
+    assert 0 not in test
+    with pytest.raises(TypeError):
+        iter(test)
+
+
 def test_make_numpy_docstring():
     """Test DocSection.make_numpy_docstring."""
     # string content
@@ -216,6 +264,7 @@ def test_section_parameters():
     test = Parameters([desc1, desc2])
     assert test.header == 'parameters'
     assert test.contents == [desc1, desc2]
+    assert not hasattr(test, '__dict__')
 
 
 def test_section_attributes():
@@ -0,0 +1,283 @@
+"""Differences between two docstrings.
+
+The difference between two docstrings is given as an edit script, a list of edits at the level of
+the sections and the descriptions. Sections are matched by their headers and descriptions are
+matched by their names. Since multiple sections (descriptions) can have the same header (name),
+e.g. the summary and the extended summary, each section (description) is identified by a key,
+(header, n) or (name, n), where n is the number of preceding sections (descriptions) with the same
+header (name).
+
+Each edit is a tuple whose first element is the name of the operation:
+
+- ('set_default_style', style)
+- ('remove_section', key)
+- ('replace_section', key, section)
+- ('add_section', index, key, section)
+- ('reorder_sections', keys)
+- ('remove_description', section_key, key)
+- ('replace_description', section_key, key, description)
+- ('add_description', section_key, index, key, description)
+- ('reorder_descriptions', section_key, keys)
+
+Within a list of sections (descriptions), the removed items are removed first, the replaced items
+are replaced, the added items are inserted at their indices in the final list, and then, if the
+order of the remaining items changed, all items are reordered according to the given keys.
+
+"""
+from docinstance.content.description import DocDescription
+
+
+def _keyed(items, key_attr):
+    """Return the keys of the given sections or descriptions.
+
+    Parameters
+    ----------
+    items : list of {DocSection, DocDescription}
+        Sections or descriptions.
+    key_attr : {'header', 'name'}
+        Attribute that is used to identify the items.
+
+    Returns
+    -------
+    keyed : list of 2-tuple
+        Key and the corresponding item for each item.
+
+    """
+    counts = {}
+    keyed = []
+    for item in items:
+        name = getattr(item, key_attr)
+        count = counts.get(name, 0)
+        counts[name] = count + 1
+        keyed.append(((name, count), item))
+    return keyed
+
+
+def _is_description_section(section):
+    """Check if the contents of the given section are all descriptions.
+
+    Parameters
+    ----------
+    section : DocSection
+
+    Returns
+    -------
+    bool
+
+    """
+    return bool(section.contents) and all(isinstance(i, DocDescription) for i in section.contents)
+
+
+def _diff_items(old_items, new_items, key_attr, prefix, diff_item):
+    """Return the edits that convert the old sections or descriptions into the new ones.
+
+    Parameters
+    ----------
+    old_items : list of {DocSection, DocDescription}
+        Original items.
+    new_items : list of {DocSection, DocDescription}
+        Modified items.
+    key_attr : {'header', 'name'}
+        Attribute that is used to identify the items.
+    prefix : tuple
+        Arguments that are inserted after the name of the operation, e.g. key of the section that
+        contains the descriptions.
+    diff_item : function
+        Function that returns the edits between two items with the same key.
+
+    Returns
+    -------
+    edits : list of tuple
+        Edit script.
+
+    """
+    kind = 'section' if key_attr == 'header' else 'description'
+    old_keyed = _keyed(old_items, key_attr)
+    new_keyed = _keyed(new_items, key_attr)
+    new_lookup = dict(new_keyed)
+    old_lookup = dict(old_keyed)
+
+    edits = []
+    for key, _ in old_keyed:
+        if key not in new_lookup:
+            edits.append(('remove_' + kind,) + prefix + (key,))
+    for key, item in old_keyed:
+        if key in new_lookup:
+            edits.extend(diff_item(key, item, new_lookup[key]))
+    for index, (key, item) in enumerate(new_keyed):
+        if key not in old_lookup:
+            edits.append(('add_' + kind,) + prefix + (index, key, item))
+
+    old_order = [key for key, _ in old_keyed if key in new_lookup]
+    new_order = [key for key, _ in new_keyed if key in old_lookup]
+    if old_order != new_order:
+        edits.append(('reorder_{0}s'.format(kind),) + prefix + ([key for key, _ in new_keyed],))
+    return edits
+
+
+def diff(old_docstring, new_docstring):
+    """Return the edit script that converts the old docstring into the new docstring.
+
+    Parameters
+    ----------
+    old_docstring : Docstring
+        Original docstring.
+    new_docstring : Docstring
+        Modified docstring.
+
+    Returns
+    -------
+    edits : list of tuple
+        Edit script where each edit is a tuple of the name of the operation and its arguments.
+        See the module docstring for the operations.
+        Empty if the docstrings are equal.
+
+    Notes
+    -----
+    Sections and descriptions are compared using their fingerprints, so the time taken is linear
+    with respect to the number of sections and descriptions.
+
+    """
+    edits = []
+    if old_docstring.default_style != new_docstring.default_style:
+        edits.append(('set_default_style', new_docstring.default_style))
+
+    def diff_description(section_key):
+        """Return the function that compares the descriptions of the given section."""
+        def diff_item(key, old_desc, new_desc):
+            """Return the edits between two descriptions with the same name."""
+            if old_desc.fingerprint == new_desc.fingerprint:
+                return []
+            return [('replace_description', section_key, key, new_desc)]
+        return diff_item
+
+    def diff_section(key, old_section, new_section):
+        """Return the edits between two sections with the same header."""
+        if old_section.fingerprint == new_section.fingerprint:
+            return []
+        if _is_description_section(old_section) and _is_description_section(new_section):
+            return _diff_items(old_section.contents, new_section.contents, 'name', (key,),
+                               diff_description(key))
+        return [('replace_section', key, new_section)]
+
+    edits.extend(_diff_items(old_docstring.sections, new_docstring.sections, 'header', (),
+                             diff_section))
+    return edits
+
+
+def _patch_items(items, key_attr, removes, replaces, adds, order):
+    """Return the sections or descriptions after applying the edits.
+
+    Parameters
+    ----------
+    items : list of {DocSection, DocDescription}
+        Original items.
+    key_attr : {'header', 'name'}
+        Attribute that is used to identify the items.
+    removes : set of tuple
+        Keys of the items that are removed.
+    replaces : dict of tuple to {DocSection, DocDescription}
+        Keys of the items that are replaced to the new items.
+    adds : list of 3-tuple
+        Index, key, and the item that are added.
+    order : {list of tuple, None}
+        Keys of all of the items in the final order.
+        If None, then the order is not changed.
+
+    Returns
+    -------
+    new_items : list of {DocSection, DocDescription}
+        Items after applying the edits.
+
+    Raises
+    ------
+    KeyError
+        If the edits refer to an item that does not exist.
+
+    """
+    keyed = _keyed(items, key_attr)
+    existing = set(key for key, _ in keyed)
+    for key in list(removes) + list(replaces):
+        if key not in existing:
+            raise KeyError('Cannot find {0}, {1}.'.format(key_attr, key))
+    kept = [(key, replaces.get(key, item)) for key, item in keyed if key not in removes]
+
+    adds = sorted(adds, key=lambda add: add[0])
+    result = []
+    kept_iter = iter(kept)
+    add_index = 0
+    for index in range(len(kept) + len(adds)):
+        if add_index < len(adds) and adds[add_index][0] == index:
+            result.append(adds[add_index][1:])
+            add_index += 1
+        else:
+            result.append(next(kept_iter))
+
+    if order is not None:
+        lookup = dict(result)
+        result = [(key, lookup[key]) for key in order]
+    return [item for _, item in result]
+
+
+def patch(docstring, edits):
+    """Apply the edit script to the docstring.
+
+    Parameters
+    ----------
+    docstring : Docstring
+        Docstring that is modified in place.
+        Frozen docstrings cannot be patched.
+    edits : list of tuple
+        Edit script created by `diff`.
+
+    Returns
+    -------
+    docstring : Docstring
+        Given docstring after applying the edits.
+
+    Raises
+    ------
+    KeyError
+        If the edits refer to a section or a description that does not exist.
+    ValueError
+        If the edit has an unknown operation.
+
+    """
+    section_edits = {'removes': set(), 'replaces': {}, 'adds': [], 'order': None}
+    description_edits = {}
+    for edit in edits:
+        operation, args = edit[0], edit[1:]
+        if operation == 'set_default_style':
+            docstring.default_style = args[0]
+            continue
+        if operation.endswith('_section') or operation == 'reorder_sections':
+            target = section_edits
+        elif operation.endswith('_description') or operation == 'reorder_descriptions':
+            target = description_edits.setdefault(args[0], {'removes': set(), 'replaces': {},
+                                                            'adds': [], 'order': None})
+            args = args[1:]
+        else:
+            raise ValueError('Unknown operation, {0}.'.format(operation))
+
+        if operation.startswith('remove_'):
+            target['removes'].add(args[0])
+        elif operation.startswith('replace_'):
+            target['replaces'][args[0]] = args[1]
+        elif operation.startswith('add_'):
+            target['adds'].append(args)
+        elif operation.startswith('reorder_'):
+            target['order'] = args[0]
+        else:
+            raise ValueError('Unknown operation, {0}.'.format(operation))
+
+    keyed_sections = dict(_keyed(docstring.sections, 'header'))
+    for section_key, edits_desc in description_edits.items():
+        if section_key not in keyed_sections:
+            raise KeyError('Cannot find header, {0}.'.format(section_key))
+        section = keyed_sections[section_key]
+        section.contents = _patch_items(section.contents, 'name', **edits_desc)
+
+    if (section_edits['removes'] or section_edits['replaces'] or section_edits['adds'] or
+            section_edits['order'] is not None):
+        docstring.sections = _patch_items(docstring.sections, 'header', **section_edits)
+    return docstring
@@ -0,0 +1,155 @@
+"""On-disk cache of the rendered docstrings of the modules.
+
+Similar to `__pycache__`, the rendered docstrings of the objects in a module are stored in the
+directory `__docinstance_cache__` next to the source file of the module, so that the docstrings do
+not need to be rendered again when the module is imported in another process.
+
+Each module is stored as a JSON file whose name is the name of its source file. The stored
+docstrings are used only if the source file has the same modification time and size, and the
+docstrings were rendered by the same version of docinstance with the same parameters.
+
+"""
+import json
+import os
+from docinstance import __version__
+
+CACHE_DIRNAME = '__docinstance_cache__'
+# version of the layout of the cache files
+FORMAT_VERSION = 1
+
+
+def cache_path(source_path):
+    """Return the path of the cache file of the given source file.
+
+    Parameters
+    ----------
+    source_path : str
+        Path to the source file of the module.
+
+    Returns
+    -------
+    cache_path : str
+        Path to the cache file.
+
+    """
+    directory, filename = os.path.split(source_path)
+    return os.path.join(directory, CACHE_DIRNAME, filename + '.json')
+
+
+def _source_stamp(source_path):
+    """Return the modification time and the size of the source file.
+
+    Parameters
+    ----------
+    source_path : str
+        Path to the source file.
+
+    Returns
+    -------
+    stamp : list of int
+        Modification time (in nanoseconds) and the size (in bytes) of the file.
+
+    Raises
+    ------
+    OSError
+        If the file cannot be accessed.
+
+    """
+    stat = os.stat(source_path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _header(source_path, params):
+    """Return the information that must match for the cached docstrings to be used.
+
+    Parameters
+    ----------
+    source_path : str
+        Path to the source file.
+    params : dict
+        Parameters used to render the docstrings.
+
+    Returns
+    -------
+    header : dict
+
+    Raises
+    ------
+    OSError
+        If the source file cannot be accessed.
+
+    """
+    return {'format': FORMAT_VERSION, 'version': __version__,
+            'source': os.path.abspath(source_path), 'stamp': _source_stamp(source_path),
+            'params': params}
+
+
+def load(source_path, params):
+    """Return the cached docstrings of the module.
+
+    Parameters
+    ----------
+    source_path : str
+        Path to the source file of the module.
+    params : dict
+        Parameters used to render the docstrings, e.g. width and tab size.
+        Values must be supported by JSON.
+
+    Returns
+    -------
+    docs : {dict of str to str, None}
+        Key of each object (see `docinstance.wrapper`) to its rendered docstring.
+        None if the cache does not exist, cannot be read, or is stale.
+
+    """
+    try:
+        header = _header(source_path, params)
+        with open(cache_path(source_path), 'r', encoding='utf-8') as cache_file:
+            data = json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get('header') != header:
+        return None
+    return data.get('docs')
+
+
+def save(source_path, params, docs):
+    """Store the docstrings of the module in the cache.
+
+    Parameters
+    ----------
+    source_path : str
+        Path to the source file of the module.
+    params : dict
+        Parameters used to render the docstrings.
+        Values must be supported by JSON.
+    docs : dict of str to str
+        Key of each object to its rendered docstring.
+
+    Returns
+    -------
+    saved : bool
+        True if the cache was written.
+        False if it could not be written (e.g. the directory is read-only).
+
+    Notes
+    -----
+    The file is written to a temporary file and then moved into place, so that other processes
+    never read a partially written cache.
+
+    """
+    path = cache_path(source_path)
+    tmp_path = '{0}.{1}.tmp'.format(path, os.getpid())
+    try:
+        data = {'header': _header(source_path, params), 'docs': docs}
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as cache_file:
+            json.dump(data, cache_file, separators=(',', ':'))
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+    return True
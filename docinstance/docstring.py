@@ -1,5 +1,8 @@
 """Class for representing the docstring."""
-from docinstance.content.base import DocContent
+from docinstance.cache import render_cache
+from docinstance.content.base import (DocContent, ContentList, _setattr_tracked, _delattr_tracked,
+                                      _reduce_ex, _getstate, _setstate, _copy, _get_fingerprint,
+                                      _get_index)
 from docinstance.content.section import DocSection, Summary
 
 
@@ -12,16 +15,54 @@ class Docstring:
         Sections of the docstring.
     default_style : str
         Default style of the docstring.
+    fingerprint : str
+        Hexadecimal digest of the contents of the docstring.
+        Fingerprint is stable across processes and is cached until the docstring or any of its
+        content is modified.
 
     Methods
     -------
     __init__(self, sections, default_style)
         Initialize.
+    __eq__(self, other)
+        Return True if other is Docstring instance with the same contents. False otherwise.
+    __ne__(self, other)
+        Return False if other is Docstring instance with the same contents. True otherwise.
+    __getitem__(self, header)
+        Return the section with the given header.
+    __contains__(self, header)
+        Return True if the docstring has a section with the given header. False otherwise.
+    to_bytes(self)
+        Return the compact representation of the docstring as bytes.
+    from_bytes(cls, data)
+        Return the docstring from its compact representation as bytes.
+    to_json(self)
+        Return the compact representation of the docstring as a JSON string.
+    from_json(cls, data)
+        Return the docstring from its compact representation as a JSON string.
     make_docstring(self, style='numpy', width=100, indent_level=0, tabsize=4)
         Return the docstring in the given style.
 
     """
 
+    __slots__ = ('sections', 'default_style', '_fingerprint', '_index', '_dependents',
+                 '__weakref__')
+    _cache_slots = ('_fingerprint', '_index')
+    _mutable = True
+    __setattr__ = _setattr_tracked
+    __delattr__ = _delattr_tracked
+    __reduce_ex__ = _reduce_ex
+    __getstate__ = _getstate
+    __setstate__ = _setstate
+    __copy__ = _copy
+    # NOTE: __getitem__ looks up the sections by their headers, so iterating over the docstring
+    #       must not fall back to the sequence protocol
+    __iter__ = None
+    # NOTE: docstrings are hashed by their identity (as they were before __eq__ was defined) so
+    #       that they can still be stored in sets and used as keys. FrozenDocstring is hashed by
+    #       its contents.
+    __hash__ = object.__hash__
+
     def __init__(self, sections, default_style='numpy'):
         """Initialize.
 
@@ -51,14 +92,230 @@ class Docstring:
         # NOTE: should the empty sections be allowed?
         elif not sections:
             raise ValueError('At least one section must be provided.')
-        self.sections = [section if isinstance(section, DocSection) else DocSection('', section)
-                         for section in sections]
+        self.sections = ContentList([section if isinstance(section, DocSection) else
+                                     DocSection('', section) for section in sections])
 
         if default_style not in ['numpy', 'numpy with signature', 'google', 'rst']:
             raise ValueError("Default style must be one of 'numpy', 'numpy with signature', "
                              "'google', 'rst'.")
         self.default_style = default_style
 
+    @classmethod
+    def _from_parts(cls, sections, default_style='numpy'):
+        """Return the docstring from its parts without checking them.
+
+        Parameters
+        ----------
+        sections : list of DocSection
+            Sections of the docstring.
+            If a ContentList is given, then it is used without being copied.
+        default_style : {'numpy with signature', 'google', 'rst', 'numpy'}
+            Style of the docstring.
+
+        Returns
+        -------
+        docstring : cls
+
+        Notes
+        -----
+        Used by the parser and the deserializer, whose results are already known to be valid. The
+        parts are not checked, so invalid parts will result in an invalid docstring.
+
+        """
+        docstring = cls.__new__(cls)
+        # pylint: disable=C0123
+        object.__setattr__(docstring, 'sections', sections if type(sections) is ContentList else
+                           ContentList(sections))
+        object.__setattr__(docstring, 'default_style', default_style)
+        return docstring
+
+    def __eq__(self, other):
+        """Return True if other is Docstring instance with the same contents. False otherwise.
+
+        Parameters
+        ----------
+        other : Docstring
+
+        Returns
+        -------
+        bool
+
+        """
+        if self is other:
+            return True
+        if not isinstance(other, Docstring) or self.fingerprint != other.fingerprint:
+            return False
+        return (list(self.sections) == list(other.sections) and
+                self.default_style == other.default_style)
+
+    def __ne__(self, other):
+        """Return False if other is Docstring instance with the same contents. True otherwise.
+
+        Parameters
+        ----------
+        other : Docstring
+
+        Returns
+        -------
+        bool
+
+        """
+        return not self == other
+
+    def __getitem__(self, header):
+        """Return the section with the given header.
+
+        Parameters
+        ----------
+        header : str
+            Header of the section.
+            Case is ignored.
+
+        Returns
+        -------
+        section : DocSection
+            First section in the docstring with the given header.
+
+        Raises
+        ------
+        TypeError
+            If the header is not a string.
+        KeyError
+            If the docstring does not have a section with the given header.
+
+        Notes
+        -----
+        Sections are indexed by their headers so that the lookup does not go through all of the
+        sections. Index is rebuilt only if the docstring or its content was modified.
+
+        """
+        if not isinstance(header, str):
+            raise TypeError('Header of the section must be a string.')
+        return _get_index(self, self.sections, 'header')[header.lower()]
+
+    def __contains__(self, header):
+        """Return True if the docstring has a section with the given header. False otherwise.
+
+        Parameters
+        ----------
+        header : str
+            Header of the section.
+            Case is ignored.
+
+        Returns
+        -------
+        bool
+            False if the header is not a string.
+
+        """
+        if not isinstance(header, str):
+            return False
+        return header.lower() in _get_index(self, self.sections, 'header')
+
+    def to_bytes(self):
+        """Return the compact representation of the docstring as bytes.
+
+        Returns
+        -------
+        data : bytes
+            Marshalled tagged tuples that represent the docstring.
+            Bytes should only be loaded by the same version of Python.
+
+        """
+        # pylint: disable=C0415
+        from docinstance import serialize
+        return serialize.dumps(self)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Return the docstring from its compact representation as bytes.
+
+        Parameters
+        ----------
+        data : bytes
+            Bytes created by `to_bytes`.
+
+        Returns
+        -------
+        docstring : Docstring
+
+        Raises
+        ------
+        TypeError
+            If the data does not represent an instance of this class.
+
+        """
+        # pylint: disable=C0415
+        from docinstance import serialize
+        docstring = serialize.loads(data)
+        if not isinstance(docstring, cls):
+            raise TypeError('Given data does not represent an instance of {0}.'
+                            ''.format(cls.__name__))
+        return docstring
+
+    def to_json(self):
+        """Return the compact representation of the docstring as a JSON string.
+
+        Returns
+        -------
+        data : str
+            JSON of the tagged tuples that represent the docstring.
+
+        """
+        # pylint: disable=C0415
+        from docinstance import serialize
+        return serialize.dumps_json(self)
+
+    @classmethod
+    def from_json(cls, data):
+        """Return the docstring from its compact representation as a JSON string.
+
+        Parameters
+        ----------
+        data : str
+            JSON string created by `to_json`.
+
+        Returns
+        -------
+        docstring : Docstring
+
+        Raises
+        ------
+        TypeError
+            If the data does not represent an instance of this class.
+
+        """
+        # pylint: disable=C0415
+        from docinstance import serialize
+        docstring = serialize.loads_json(data)
+        if not isinstance(docstring, cls):
+            raise TypeError('Given data does not represent an instance of {0}.'
+                            ''.format(cls.__name__))
+        return docstring
+
+    @property
+    def fingerprint(self):
+        """Return the fingerprint of the docstring.
+
+        Returns
+        -------
+        fingerprint : str
+            Hexadecimal digest of the contents of the docstring.
+
+        """
+        return _get_fingerprint(self)
+
+    def _fields(self):
+        """Return the attributes that describe the docstring.
+
+        Returns
+        -------
+        fields : dict of str to object
+            Name of the attribute to its value.
+
+        """
+        return {'sections': self.sections, 'default_style': self.default_style}
+
     # pylint: disable=R0912
     def make_docstring(self, width=100, indent_level=0, tabsize=4, style=None):
         """Return the docstring in the given style.
@@ -148,11 +405,13 @@ class Docstring:
         # add remaining summary
         if len(self.sections[0].contents) > 1:
             summary = DocSection('', self.sections[0].contents[1:])
-            output += getattr(summary, docstring_func)(width, indent_level, tabsize)
+            output += render_cache.render(summary, docstring_func, width, indent_level, tabsize)
         # add other sections
+        # NOTE: sections that are repeated across many docstrings are rendered only once
         if len(self.sections) > 1:
             for section in self.sections[1:]:
-                output += getattr(section, docstring_func)(width, indent_level, tabsize)
+                output += render_cache.render(section, docstring_func, width, indent_level,
+                                              tabsize)
         # add whitespace to indent the triple quotation
         output += ' ' * indent_level * tabsize
         return output
@@ -0,0 +1,585 @@
+"""Immutable and hashable variants of the docstring and its contents.
+
+Frozen instances can be shared freely (e.g. across threads or between different docstrings)
+because they cannot be modified after they are initialized. The function `freeze` converts a
+docstring (or its content) into its frozen variant such that structurally identical contents are
+represented by the same instance.
+
+"""
+import sys
+import threading
+import weakref
+from docinstance.docstring import Docstring
+from docinstance.content.base import DocContent
+from docinstance.content.description import DocDescription
+from docinstance.content.equation import DocEquation
+from docinstance.content.section import DocSection
+
+
+def _intern(text):
+    """Return the interned version of the given string.
+
+    Parameters
+    ----------
+    text : str
+        String to intern.
+
+    Returns
+    -------
+    text : str
+        Interned string.
+        Instances of a child class of str are converted to str before interning.
+
+    """
+    return sys.intern(str(text))
+
+
+def _setattr_frozen(self, name, value):
+    """Set the attribute only if the instance has not finished initializing.
+
+    Parameters
+    ----------
+    name : str
+        Name of the attribute.
+    value : object
+        Value of the attribute.
+
+    Raises
+    ------
+    AttributeError
+        If the instance has finished initializing.
+
+    """
+    if hasattr(self, '_hash'):
+        raise AttributeError('{0} instance cannot be modified.'.format(type(self).__name__))
+    object.__setattr__(self, name, value)
+
+
+def _delattr_frozen(self, name):
+    """Prevent deleting the attributes.
+
+    Parameters
+    ----------
+    name : str
+        Name of the attribute.
+
+    Raises
+    ------
+    AttributeError
+        Always.
+
+    """
+    raise AttributeError('{0} instance cannot be modified.'.format(type(self).__name__))
+
+
+class FrozenEquation(DocEquation):
+    """Immutable and hashable block of equations.
+
+    Attributes
+    ----------
+    equations : tuple of str
+        Multi-line string that consists of multiple equations.
+
+    Methods
+    -------
+    __init__(self, equations)
+        Initialize.
+    __hash__(self)
+        Return the hash of the equations.
+
+    """
+
+    __slots__ = ('_hash',)
+    _mutable = False
+    __setattr__ = _setattr_frozen
+    __delattr__ = _delattr_frozen
+
+    def __init__(self, equations):
+        """Initialize.
+
+        Parameters
+        ----------
+        equations : str
+           Multi-line string that consists of multiple equations.
+
+        Raises
+        ------
+        TypeError
+            If given equations are not string.
+
+        """
+        super().__init__(equations)
+        self.equations = tuple(self.equations)
+        self._hash = hash(self.equations)
+
+    def __eq__(self, other):
+        """Return True if other is DocContent instance with the same contents. False otherwise.
+
+        Parameters
+        ----------
+        other : DocContent
+
+        Returns
+        -------
+        bool
+
+        """
+        return self is other or super().__eq__(other)
+
+    def __hash__(self):
+        """Return the hash of the equations.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._hash
+
+    def _fields(self):
+        """Return the attributes that describe the contents.
+
+        Returns
+        -------
+        fields : dict of str to object
+            Name of the attribute to its value.
+            Tuples are converted to lists so that the instance is equal to its mutable variant.
+
+        """
+        return {'equations': list(self.equations)}
+
+    def _consing_key(self):
+        """Return the key that identifies the structure of the instance.
+
+        Returns
+        -------
+        key : tuple
+
+        """
+        return (FrozenEquation, self.equations)
+
+
+class FrozenDescription(DocDescription):
+    """Immutable and hashable description of objects or errors raised in a docstring.
+
+    Attributes
+    ----------
+    name : str
+        Name of the described object/error.
+        String is interned.
+    signature : str
+        Signature of the described object.
+    types : tuple of classes/str
+        Allowed types of the given object.
+        Strings are interned.
+    descs : tuple of {str, FrozenEquation}
+        Descriptions of the given object.
+
+    Methods
+    -------
+    __init__(self, name, signature='', types=None, descs=None)
+        Initialize.
+    __hash__(self)
+        Return the hash of the description.
+
+    """
+
+    __slots__ = ('_hash',)
+    _mutable = False
+    __setattr__ = _setattr_frozen
+    __delattr__ = _delattr_frozen
+
+    def __init__(self, name, signature='', types=None, descs=None):
+        """Initialize the object.
+
+        Parameters
+        ----------
+        name : str
+            Name of the described object/error.
+        signture : {str, ''}
+            Signature of the described object.
+            Default is no signature (i.e. empty string).
+        types : {class, list/tuple of classes, str, list/tuple of str, None}
+            Allowed types of the given object.
+            Default is no types.
+        descs : {str, list/tuple of str/DocEquation, None}
+            Descriptions of the given object.
+            Equations are converted to FrozenEquation.
+            Default is no descriptions.
+
+        Raises
+        ------
+        TypeError
+            If the name of the described object/error is not a string.
+            If the signature of the described object/error is not a string.
+            If the allowed types of the described object/error is not a class or a list/tuple of
+            classes/strings.
+            If the descriptions of the described object/error is not a string or a list/tuple of
+            strings.
+
+        """
+        super().__init__(name, signature=signature, types=types, descs=descs)
+        self.name = _intern(self.name)
+        self.types = tuple(_intern(i) if isinstance(i, str) else i for i in self.types)
+        self.descs = tuple(freeze(i) for i in self.descs)
+        self._hash = hash((self.name, self.signature, self.types, self.descs))
+
+    @classmethod
+    def _from_parts(cls, name, signature, types, descs):
+        """Return the description from its parts.
+
+        Parts are checked and frozen, unlike the mutable variant, because the hash must be computed.
+
+        Returns
+        -------
+        desc : cls
+
+        """
+        return cls(name, signature, types, descs)
+
+    def __eq__(self, other):
+        """Return True if other is DocContent instance with the same contents. False otherwise.
+
+        Parameters
+        ----------
+        other : DocContent
+
+        Returns
+        -------
+        bool
+
+        """
+        return self is other or super().__eq__(other)
+
+    def __hash__(self):
+        """Return the hash of the description.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._hash
+
+    def _fields(self):
+        """Return the attributes that describe the contents.
+
+        Returns
+        -------
+        fields : dict of str to object
+            Name of the attribute to its value.
+            Tuples are converted to lists so that the instance is equal to its mutable variant.
+
+        """
+        return {'name': self.name, 'signature': self.signature, 'types': list(self.types),
+                'descs': list(self.descs)}
+
+    def _consing_key(self):
+        """Return the key that identifies the structure of the instance.
+
+        Returns
+        -------
+        key : tuple
+
+        """
+        return (FrozenDescription, self.name, self.signature, self.types,
+                tuple(id(i) if isinstance(i, DocContent) else i for i in self.descs))
+
+
+class FrozenSection(DocSection):
+    """Immutable and hashable section within a docstring.
+
+    Attributes
+    ----------
+    header : str
+        Name of the section to be used within the docstring.
+        String is interned.
+    contents : {tuple of str, tuple of FrozenDescription}
+        Contents within the section.
+
+    Methods
+    -------
+    __init__(self, header, contents)
+        Initialize.
+    __hash__(self)
+        Return the hash of the section.
+
+    """
+
+    __slots__ = ('_hash',)
+    _mutable = False
+    __setattr__ = _setattr_frozen
+    __delattr__ = _delattr_frozen
+
+    def __init__(self, header, contents):
+        """Initialize.
+
+        Parameters
+        ----------
+        header : str
+            Name of the section.
+        contents : {str, list/tuple of str, list/tuple of DocDescription}
+            Contents of the section.
+            Instances of DocContent are converted to their frozen variants.
+
+        Raises
+        ------
+        TypeError
+            If `header` is not a string.
+            If `contents` is not a string, a list/tuple of DocDescription, or a list/tuple of
+            string/DocContent where none of the DocContent instances are also instances of
+            DocDescription.
+
+        """
+        super().__init__(header, contents)
+        self.header = _intern(self.header)
+        self.contents = tuple(freeze(i) for i in self.contents)
+        self._hash = hash((self.header, self.contents))
+
+    @classmethod
+    def _from_parts(cls, header, contents):
+        """Return the section from its parts.
+
+        Parts are checked and frozen, unlike the mutable variant, because the hash must be computed.
+
+        Returns
+        -------
+        section : cls
+
+        """
+        return cls(header, contents)
+
+    def __eq__(self, other):
+        """Return True if other is DocContent instance with the same contents. False otherwise.
+
+        Parameters
+        ----------
+        other : DocContent
+
+        Returns
+        -------
+        bool
+
+        """
+        return self is other or super().__eq__(other)
+
+    def __hash__(self):
+        """Return the hash of the section.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._hash
+
+    def _fields(self):
+        """Return the attributes that describe the contents.
+
+        Returns
+        -------
+        fields : dict of str to object
+            Name of the attribute to its value.
+            Tuples are converted to lists so that the instance is equal to its mutable variant.
+
+        """
+        return {'header': self.header, 'contents': list(self.contents)}
+
+    def _consing_key(self):
+        """Return the key that identifies the structure of the instance.
+
+        Returns
+        -------
+        key : tuple
+
+        """
+        return (FrozenSection, self.header,
+                tuple(id(i) if isinstance(i, DocContent) else i for i in self.contents))
+
+
+class FrozenDocstring(Docstring):
+    """Immutable and hashable docstring.
+
+    Attributes
+    ----------
+    sections : tuple of FrozenSection
+        Sections of the docstring.
+    default_style : str
+        Default style of the docstring.
+
+    Methods
+    -------
+    __init__(self, sections, default_style)
+        Initialize.
+    __hash__(self)
+        Return the hash of the docstring.
+
+    """
+
+    __slots__ = ('_hash',)
+    _mutable = False
+    __setattr__ = _setattr_frozen
+    __delattr__ = _delattr_frozen
+
+    def __init__(self, sections, default_style='numpy'):
+        """Initialize.
+
+        Parameters
+        ----------
+        sections : {str, list/tuple of str, list/tuple of DocSection}
+            Sections of the docstring.
+            Sections are converted to FrozenSection.
+        default_style : {'numpy with signature', 'google', 'rst', 'numpy'}
+            Style of the docstring.
+
+        Raises
+        ------
+        TypeError
+            If sections is not a string, list/tuple of strings, or list/tuple of DocSection
+            instances.
+        ValueError
+            If there are no sections.
+            If style is not one of 'numpy', 'numpy with signature', 'google', 'rst'.
+
+        """
+        super().__init__(sections, default_style=default_style)
+        self.sections = tuple(freeze(i) for i in self.sections)
+        self._hash = hash((self.sections, self.default_style))
+
+    @classmethod
+    def _from_parts(cls, sections, default_style='numpy'):
+        """Return the docstring from its parts.
+
+        Parts are checked and frozen, unlike the mutable variant, because the hash must be computed.
+
+        Returns
+        -------
+        docstring : cls
+
+        """
+        return cls(sections, default_style=default_style)
+
+    def __eq__(self, other):
+        """Return True if other is Docstring instance with the same contents. False otherwise.
+
+        Parameters
+        ----------
+        other : Docstring
+
+        Returns
+        -------
+        bool
+
+        """
+        return self is other or super().__eq__(other)
+
+    def __hash__(self):
+        """Return the hash of the docstring.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._hash
+
+    def _consing_key(self):
+        """Return the key that identifies the structure of the instance.
+
+        Returns
+        -------
+        key : tuple
+
+        """
+        return (FrozenDocstring, tuple(id(i) for i in self.sections), self.default_style)
+
+
+# table of the frozen instances that are in use, keyed by their structure
+# NOTE: the keys contain the ids of the (canonical) children, which are kept alive by the
+# corresponding values. An entry is removed only when its value is garbage collected.
+_consing_table = weakref.WeakValueDictionary()
+_consing_lock = threading.Lock()
+
+
+def freeze(obj):
+    """Return the frozen variant of the given docstring or docstring content.
+
+    Structurally identical contents are represented by the same instance, e.g. every `self`
+    parameter that is frozen is the same instance of FrozenDescription.
+
+    Parameters
+    ----------
+    obj : {Docstring, DocSection, DocDescription, DocEquation, str}
+        Docstring or its content.
+
+    Returns
+    -------
+    frozen : {FrozenDocstring, FrozenSection, FrozenDescription, FrozenEquation, str}
+        Frozen variant of the given object that is shared with all other frozen objects that have
+        the same structure.
+        Strings are returned as they are.
+
+    Raises
+    ------
+    TypeError
+        If the given object is not a Docstring, DocSection, DocDescription, DocEquation, or str.
+
+    """
+    if isinstance(obj, str):
+        return obj
+    if isinstance(obj, (FrozenDocstring, FrozenSection, FrozenDescription, FrozenEquation)):
+        frozen = obj
+    elif isinstance(obj, Docstring):
+        frozen = FrozenDocstring(obj.sections, obj.default_style)
+    elif isinstance(obj, DocSection):
+        frozen = FrozenSection(obj.header, obj.contents)
+    elif isinstance(obj, DocDescription):
+        frozen = FrozenDescription(obj.name, obj.signature, obj.types, obj.descs)
+    elif isinstance(obj, DocEquation):
+        frozen = FrozenEquation('\n'.join(obj.equations))
+    else:
+        raise TypeError('Only Docstring, DocSection, DocDescription, DocEquation, and str can be '
+                        'frozen.')
+
+    # pylint: disable=W0212
+    key = frozen._consing_key()
+    with _consing_lock:
+        canonical = _consing_table.get(key)
+        if canonical is None:
+            _consing_table[key] = frozen
+            canonical = frozen
+    return canonical
+
+
+def thaw(obj):
+    """Return the mutable variant of the given docstring or docstring content.
+
+    Parameters
+    ----------
+    obj : {Docstring, DocSection, DocDescription, DocEquation, str}
+        Docstring or its content.
+
+    Returns
+    -------
+    thawed : {Docstring, DocSection, DocDescription, DocEquation, str}
+        Mutable copy of the given object.
+
+    Raises
+    ------
+    TypeError
+        If the given object is not a Docstring, DocSection, DocDescription, DocEquation, or str.
+
+    """
+    if isinstance(obj, str):
+        return obj
+    if isinstance(obj, Docstring):
+        return Docstring([thaw(i) for i in obj.sections], obj.default_style)
+    if isinstance(obj, DocSection):
+        return DocSection(obj.header, [thaw(i) for i in obj.contents])
+    if isinstance(obj, DocDescription):
+        return DocDescription(obj.name, obj.signature, list(obj.types),
+                              [thaw(i) for i in obj.descs])
+    if isinstance(obj, DocEquation):
+        return DocEquation('\n'.join(obj.equations))
+    raise TypeError('Only Docstring, DocSection, DocDescription, DocEquation, and str can be '
+                    'thawed.')
@@ -1 +1,4 @@
 """Parser for docstrings."""
+from docinstance.parser.detect import detect_style, parse
+
+__all__ = ['detect_style', 'parse']
@@ -0,0 +1,86 @@
+"""Detection of the style of a docstring."""
+import re
+from docinstance.parser.numpy import parse_numpy
+
+# NOTE: the markers of the different styles are matched in a single pass over the docstring:
+#       numpy sections are headers underlined with dashes, google sections are headers that end
+#       with a colon (and are alone in the line), and rst uses field lists (e.g. :param x:).
+_re_style = re.compile(
+    r'^[ \t]*(?:'
+    r'(?P<numpy>\S[^\n]*\n[ \t]*-{3,}[ \t]*$)'
+    r'|(?P<google>(?:Args|Arguments|Attributes|Example|Examples|Keyword Args|Keyword Arguments'
+    r'|Methods|Note|Notes|Other Parameters|Parameters|Raises|References|Return|Returns|See Also'
+    r'|Todo|Warning|Warnings|Warns|Yield|Yields):[ \t]*$)'
+    r'|(?P<rst>:(?:param|parameter|arg|argument|key|keyword|type|raises?|except|exception|var'
+    r'|ivar|cvar|vartype|returns?|rtype|yields?|ytype)(?:[ \t][^:\n]*)?:)'
+    r')',
+    re.MULTILINE,
+)
+
+# parsers of the docstring styles
+_parsers = {'numpy': parse_numpy}
+
+
+def detect_style(docstring):
+    """Return the style of the given docstring.
+
+    The style is determined by the first section header (or field) in the docstring. Numpy
+    sections are underlined with dashes, google sections end with a colon (e.g. Args:), and rst
+    fields start and end with a colon (e.g. :param x:).
+
+    Parameters
+    ----------
+    docstring : str
+        Docstring, with or without its indentation.
+
+    Returns
+    -------
+    style : {'numpy', 'google', 'rst', None}
+        Style of the docstring.
+        None if the docstring does not have any sections (e.g. summary only), in which case it is
+        valid in any style.
+
+    """
+    match = _re_style.search(docstring)
+    if match is None:
+        return None
+    return match.lastgroup
+
+
+def parse(docstring, style='auto', contains_quotes=False):
+    """Parse a docstring of the given style into a Docstring instance.
+
+    Parameters
+    ----------
+    docstring : str
+        Docstring.
+    style : {'auto', 'numpy'}
+        Style of the docstring.
+        If 'auto', then the style is detected with `detect_style`, and docstrings without any
+        sections are parsed as numpy docstrings.
+        Default is 'auto'.
+    contains_quotes : bool
+        True if docstring is given as a string literal, i.e. with its quotes and its prefix, as in
+        the source code.
+
+    Returns
+    -------
+    docstring : Docstring
+       Instance of Docstring that contains the necessary information.
+
+    Raises
+    ------
+    ValueError
+        If style is not one of 'auto' and 'numpy'.
+        If the detected style is not one of the styles that can be parsed (e.g. google and rst).
+        If the docstring cannot be parsed in the given style.
+
+    """
+    if style == 'auto':
+        detected = detect_style(docstring) or 'numpy'
+        if detected not in _parsers:
+            raise ValueError('Docstring is in {0} style, which cannot be parsed.'.format(detected))
+        style = detected
+    elif style not in _parsers:
+        raise ValueError("Given docstring style must be one of 'auto' and 'numpy'.")
+    return _parsers[style](docstring, contains_quotes=contains_quotes)
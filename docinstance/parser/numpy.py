@@ -1,6 +1,9 @@
 """Parser for numpy docstring."""
+import ast
+import io
 import re
 import inspect
+import tokenize
 from docinstance.parser.latex import parse_equation
 from docinstance.docstring import Docstring
 from docinstance.content.description import DocDescription
@@ -8,10 +11,47 @@ from docinstance.content.section import (DocSection, Summary, ExtendedSummary, P
                                          Attributes, Methods, Returns, Yields, OtherParameters,
                                          Raises, Warns, Warnings, SeeAlso, Notes, References,
                                          Examples)
+from docinstance.content.base import ContentList
 from docinstance.content.equation import DocEquation
 
 
-# pylint: disable=R0912,R0914,R0915
+def _eval_literal(literal):
+    r"""Return the value of the string literal.
+
+    Parameters
+    ----------
+    literal : str
+        String literal as it is given in the source code (including its prefix and quotes), e.g.
+        `r\"\"\"docstring\"\"\"`. Indentation before the literal is ignored and adjacent literals
+        are concatenated.
+
+    Returns
+    -------
+    value : str
+        Value of the string literal, after processing its escape sequences (if it is not raw).
+
+    Raises
+    ------
+    ValueError
+        If the given string is not a string literal.
+
+    """
+    values = []
+    try:
+        for token in tokenize.generate_tokens(io.StringIO(literal.strip()).readline):
+            if token.type == tokenize.STRING:
+                values.append(ast.literal_eval(token.string))
+            elif token.type not in (tokenize.NEWLINE, tokenize.NL, tokenize.COMMENT,
+                                    tokenize.ENDMARKER):
+                raise ValueError
+    except (ValueError, SyntaxError, tokenize.TokenError):
+        raise ValueError('Given string, {0}, is not a string literal.'.format(literal))
+    if not values or not all(isinstance(value, str) for value in values):
+        raise ValueError('Given string, {0}, is not a string literal.'.format(literal))
+    return ''.join(values)
+
+
+# pylint: disable=R0912,R0914,R0915,W0212
 def parse_numpy(docstring, contains_quotes=False):
     r"""Parse a docstring in numpy format into a Docstring instance.
 
@@ -24,7 +64,8 @@ def parse_numpy(docstring, contains_quotes=False):
     docstring : str
         Numpy docstring.
     contains_quotes : bool
-        True if docstring contains \"\"\" or \'\'\'.
+        True if docstring is given as a string literal, i.e. with its quotes (e.g. \"\"\" or \'\'\')
+        and its prefix (e.g. r for raw strings), as in the source code.
 
     Returns
     -------
@@ -39,38 +80,29 @@ def parse_numpy(docstring, contains_quotes=False):
         If number of '-' does not match the number of characters in the header.
         If given entry of the tabbed information (parameters, attributes, methods, returns, yields,
         raises, see also) had an unexpected pattern.
-    NotImplementedError
-        If quotes corresponds to a raw string, i.e. r\"\"\".
+        If docstring is not a string literal when `contains_quotes` is True.
 
     Notes
     -----
     Copied from https://github.com/kimt33/pydocstring.
 
     """
-    docstring = inspect.cleandoc('\n' * contains_quotes + docstring)
-
-    # remove quotes from docstring
     if contains_quotes:
-        quotes = r'[\'\"]{3}'
-        if re.search(r'^r{0}'.format(quotes), docstring):
-            raise NotImplementedError('A raw string quotation, i.e. r""" cannot be given as a '
-                                      'string, i.e. from reading a python file as a string, '
-                                      'because the backslashes belonging to escape sequences '
-                                      'cannot be distinguished from those of normal backslash.'
-                                      'You either need to change existing raw string to normal '
-                                      'i.e. convert all occurences of \\ to \\\\, or import the '
-                                      'docstring from the instance through `__doc__` attribute.')
+        # NOTE: the literal is evaluated with tokenize and ast so that its prefix (e.g. raw strings)
+        #       and escape sequences are processed exactly as python would. The quotes are
+        #       replaced with placeholders so that inspect.cleandoc treats the docstring as it would
+        #       with the quotes, e.g. the blank lines at the start of the docstring are not removed
+        #       (i.e. the summary must follow the quotes).
+        docstring = inspect.cleandoc('"{0}"'.format(_eval_literal(docstring)))[1:-1]
     else:
-        quotes = r''
-    docstring = re.sub(r'^{0}'.format(quotes), '', docstring)
-    docstring = re.sub(r'{0}$'.format(quotes), '', docstring)
+        docstring = inspect.cleandoc(docstring)
 
     sections = []
     # summary
     for regex in [r'^\n?(.+?)\n\n+', r'^\n?(.*?)\n*$']:
         re_summary = re.compile(regex)
         try:
-            sections.append(Summary(re_summary.search(docstring).group(1)))
+            sections.append(Summary._from_parts('', [re_summary.search(docstring).group(1)]))
             break
         except AttributeError:
             pass
@@ -80,7 +112,7 @@ def parse_numpy(docstring, contains_quotes=False):
     # remove summary from docstring
     docstring = re_summary.sub('', docstring)
     if docstring == '':
-        return Docstring(sections)
+        return Docstring._from_parts(sections)
 
     # if headers do not exist
     re_header = re.compile(r'\n*(.+)\n(-+)\n+')
@@ -96,15 +128,13 @@ def parse_numpy(docstring, contains_quotes=False):
             # if block == '':
             #     continue
             if not isinstance(block, DocEquation):
-                # remove quotes
-                block = re.sub(r'\n*{0}$'.format(quotes), '', block)
                 # remove trailing newlines
                 block = re.sub(r'\n+$', '', block)
                 # replace newlines
                 block = block.replace('\n', ' ')
             extended_contents.append(block)
-        sections.append(ExtendedSummary(extended_contents))
-        return Docstring(sections)
+        sections.append(ExtendedSummary._from_parts('', extended_contents))
+        return Docstring._from_parts(sections)
 
     # split docstring by the headers
     split_docstring = re_header.split(docstring)
@@ -124,8 +154,6 @@ def parse_numpy(docstring, contains_quotes=False):
         # if block == '':
         #     continue
         if not isinstance(block, DocEquation):
-            # remove quotes
-            block = re.sub(r'\n*{0}$'.format(quotes), '', block)
             # remove trailing newlines
             block = re.sub(r'\n+$', '', block)
             # replace newlines
@@ -133,7 +161,7 @@ def parse_numpy(docstring, contains_quotes=False):
         processed_extended.append(block)
 
     if processed_extended != []:
-        sections.append(ExtendedSummary(processed_extended))
+        sections.append(ExtendedSummary._from_parts('', processed_extended))
 
     headers_sections = {'parameters': Parameters, 'other parameters': OtherParameters,
                         'attributes': Attributes, 'methods': Methods, 'returns': Returns,
@@ -172,12 +200,15 @@ def parse_numpy(docstring, contains_quotes=False):
                 if types is None:
                     types = []
                 elif re.search(r'\{.+\}', types):
-                    types = re.search(r'^\{((?:(.+?),\s*)*(.+?))\}$', types).group(1)
-                    types = re.split(r',\s*', types)
+                    choices = re.search(r'^\{((?:(.+?),\s*)*(.+?))\}$', types)
+                    if choices is None:
+                        raise ValueError('Types of the entry, {0}, had an unexpected pattern.'
+                                         ''.format(types))
+                    types = re.split(r',\s*', choices.group(1))
                 else:
                     types = re.search(r'^((?:(.+?),\s*)*(.+?))$', types).group(1)
                     types = re.split(r',\s*', types)
-                types = [i for i in types if i is not None]
+                types = ContentList([i for i in types if i is not None])
 
                 # process documentation
                 descs = inspect.cleandoc('\n' + descs)
@@ -190,16 +221,158 @@ def parse_numpy(docstring, contains_quotes=False):
                 descs = [line for lines in descs for line in parse_equation(lines)]
                 # non math blocks will replace newlines with spaces.
                 # math blocks will add newline at the end
-                descs = [line if isinstance(line, DocEquation) else line.replace('\n', ' ')
-                         for line in descs]
+                descs = ContentList([line if isinstance(line, DocEquation) else
+                                     line.replace('\n', ' ') for line in descs])
 
                 # store
-                header_contents.append(DocDescription(name, signature=signature, types=types,
-                                                      descs=descs))
+                header_contents.append(DocDescription._from_parts(name, signature, types, descs))
         else:
             header_contents = [i for i in re.split(r'\n\n+', contents) if i != '']
-        try:
-            sections.append(headers_sections[header](header_contents))
-        except KeyError:
-            sections.append(DocSection(header, header_contents))
-    return Docstring(sections)
+        section_class = headers_sections.get(header) or DocSection
+        sections.append(section_class._from_parts(header, header_contents))
+    return Docstring._from_parts(sections)
+
+
+def _try_parse_numpy(docstring, contains_quotes=False):
+    """Parse a docstring in numpy format, if it is one.
+
+    Parameters
+    ----------
+    docstring : str
+        Docstring.
+    contains_quotes : bool
+        True if docstring is given as a string literal, i.e. with its quotes and its prefix, as in
+        the source code.
+
+    Returns
+    -------
+    docstring : {Docstring, None}
+        Instance of Docstring that contains the necessary information.
+        None if the docstring is not in numpy format.
+
+    """
+    try:
+        return parse_numpy(docstring, contains_quotes=contains_quotes)
+    # NOTE: docstrings are arbitrary text so a docstring that cannot be parsed is not in numpy
+    #       format
+    except ValueError:
+        return None
+
+
+def docstring_literals(readline):
+    """Yield the string literals of the docstrings in the source code.
+
+    The docstrings of the module, classes, and functions are found in a single pass over the tokens
+    of the source code, so the source code is neither parsed into a syntax tree nor executed.
+
+    Parameters
+    ----------
+    readline : function
+        Function that returns the next line of the source code as a string, e.g.
+        `io.StringIO(source).readline`.
+
+    Yields
+    ------
+    qualname : str
+        Qualified name of the object within the module, as in its `__qualname__`.
+        The module is identified by an empty string.
+    lineno : int
+        Line number at which the docstring starts.
+    literal : str
+        String literal of the docstring as it is given in the source code, including its prefix and
+        quotes. Adjacent literals are joined with a space.
+
+    Raises
+    ------
+    tokenize.TokenError
+        If the source code cannot be tokenized.
+
+    """
+    skipped = (tokenize.NL, tokenize.NEWLINE, tokenize.INDENT, tokenize.COMMENT,
+               getattr(tokenize, 'ENCODING', None))
+    # docstring is expected at the start of the module and the body of a class or function
+    expect_docstring = True
+    in_header = False
+    depth = 0
+    strings = []
+    # qualified name of the object whose docstring is expected
+    qualname = ''
+    # definitions whose (indented) bodies contain the current token, as their prefixes of the
+    # qualified names of the nested objects and their indentation levels
+    scopes = [('', 0)]
+    indent = 0
+    # prefix of the definition whose header was last completed, until its body is indented
+    body_prefix = None
+    for token in tokenize.generate_tokens(readline):
+        if strings:
+            if token.type == tokenize.STRING:
+                strings.append(token)
+                continue
+            if token.type in (tokenize.NEWLINE, tokenize.ENDMARKER) or (
+                    token.type == tokenize.OP and token.string == ';'):
+                yield qualname, strings[0].start[0], ' '.join(i.string for i in strings)
+            strings = []
+        if token.type == tokenize.INDENT:
+            indent += 1
+            if body_prefix is not None:
+                scopes.append((body_prefix, indent))
+                body_prefix = None
+        elif token.type == tokenize.DEDENT:
+            indent -= 1
+            while scopes[-1][1] > indent:
+                scopes.pop()
+        elif token.type not in skipped:
+            # body in the same line as the header cannot contain definitions
+            body_prefix = None
+        if expect_docstring:
+            if token.type in skipped:
+                continue
+            expect_docstring = False
+            if token.type == tokenize.STRING:
+                strings = [token]
+                continue
+        if token.type == tokenize.NAME and token.string in ('def', 'class') and depth == 0:
+            in_header = True
+            kind = token.string
+            qualname = None
+        elif token.type == tokenize.NAME and in_header and qualname is None:
+            qualname = scopes[-1][0] + token.string
+        elif token.type == tokenize.OP:
+            if token.string in '([{':
+                depth += 1
+            elif token.string in ')]}':
+                depth -= 1
+            elif token.string == ':' and in_header and depth == 0:
+                in_header = False
+                expect_docstring = True
+                body_prefix = qualname + ('.' if kind == 'class' else '.<locals>.')
+
+
+def parse_numpy_file(path):
+    """Parse the docstrings of the module, classes, and functions in the source file.
+
+    Docstrings are found with `tokenize` and their string literals are given to `parse_numpy`, so
+    the raw strings (e.g. with equations) are parsed correctly without importing the module.
+
+    Parameters
+    ----------
+    path : str
+        Path to the source file.
+
+    Returns
+    -------
+    docstrings : list of 3-tuple of {str, int, Docstring}
+        Qualified name of the object within the module (empty string for the module), line number
+        at which its docstring starts, and its Docstring instance, in the order in which they
+        appear in the file.
+        Docstrings that are not in numpy format are given as None.
+
+    Raises
+    ------
+    tokenize.TokenError
+        If the source file cannot be tokenized.
+
+    """
+    with tokenize.open(path) as source_file:
+        return [(qualname, lineno, _try_parse_numpy(literal, contains_quotes=True))
+                for qualname, lineno, literal in docstring_literals(source_file.readline)]
@@ -0,0 +1,43 @@
+"""Tests for docinstance.parser.detect."""
+import pytest
+from docinstance.docstring import Docstring
+from docinstance.content.section import Summary, ExtendedSummary
+from docinstance.parser import detect_style, parse
+from docinstance.parser.numpy import parse_numpy
+
+
+def test_detect_style():
+    """Test docinstance.parser.detect.detect_style."""
+    assert detect_style('summary') is None
+    assert detect_style('summary\n\nextended summary: with colon.\n') is None
+    assert detect_style(parse_numpy.__doc__) == 'numpy'
+    assert detect_style('summary\n\n    Parameters\n    ----------\n    x : int\n') == 'numpy'
+    assert detect_style('summary\n\nArgs:\n    x (int): X.\n') == 'google'
+    assert detect_style('summary\n\n    Returns:  \n        int: X.\n    ') == 'google'
+    assert detect_style('summary\n\nArgs: x\n') is None
+    assert detect_style('summary\n\n:param x: X.\n:type x: int\n') == 'rst'
+    assert detect_style('summary\n\n    :returns:\n        X.\n') == 'rst'
+    assert detect_style('summary\n\n:class:`x` is used.\n') is None
+    # first section determines the style
+    assert detect_style('summary\n\nArgs:\n    x: :param y: Y.\n\nNotes\n-----\n') == 'google'
+    assert detect_style('summary\n\nNotes\n-----\n:param x: X.\n') == 'numpy'
+
+
+def test_parse():
+    """Test docinstance.parser.detect.parse."""
+    assert parse('summary') == Docstring([Summary('summary')])
+    assert parse('"""summary\n\nextended"""', contains_quotes=True) == Docstring(
+        [Summary('summary'), ExtendedSummary('extended')]
+    )
+    assert parse(parse_numpy.__doc__) == parse_numpy(parse_numpy.__doc__)
+    assert parse(parse_numpy.__doc__, style='numpy') == parse_numpy(parse_numpy.__doc__)
+    with pytest.raises(ValueError):
+        parse('summary\n\nArgs:\n    x (int): X.\n')
+    with pytest.raises(ValueError):
+        parse('summary\n\n:param x: X.\n')
+    with pytest.raises(ValueError):
+        parse('summary', style='rst')
+    with pytest.raises(ValueError):
+        parse('summary', style='google')
+    with pytest.raises(ValueError):
+        parse('summary', style='numpy with signature')
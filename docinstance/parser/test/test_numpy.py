@@ -1,10 +1,13 @@
 """Tests for docinstance.parser.numpy."""
+import io
 import pytest
 from docinstance.docstring import Docstring
+from docinstance.content.base import ContentList
 from docinstance.content.section import (DocSection, Summary, ExtendedSummary, Parameters)
 from docinstance.content.description import DocDescription
 from docinstance.content.equation import DocEquation
-from docinstance.parser.numpy import parse_numpy
+from docinstance.parser.numpy import (parse_numpy, parse_numpy_file, docstring_literals,
+                                      _eval_literal, _try_parse_numpy)
 
 
 def test_compare_docinstances():
@@ -36,13 +39,11 @@ def test_compare_docinstances():
             Docstring(DocSection('a', DocDescription('x', 'y', 'z', '1'))))
     assert (Docstring(DocSection('a', DocDescription('x', 'y', 'z', DocEquation('k')))) !=
             Docstring(DocSection('a', DocDescription('x', 'y', 'z', DocEquation('1')))))
-    assert doc1.__dict__ == doc2.__dict__
+    assert doc1 == doc2
 
 
 def test_parse_numpy():
     """Tests docinstance.numpy.parse_numpy."""
-    # monkeypatch equality for Docstring
-    Docstring.__eq__ = lambda self, other: self.__dict__ == other.__dict__
     # summary
     docstring = 'summary'
     assert parse_numpy(docstring) == Docstring(Summary('summary'))
@@ -91,7 +92,7 @@ def test_parse_numpy():
         parse_numpy(docstring)
 
     for header in ['parameters', 'attributes', 'methods', 'returns', 'yields', 'raises',
-                   'other parameters', 'see also']:
+                   'other parameters', 'see also', 'properties', 'abstract methods']:
         # name + multiple descriptions
         docstring = ('summary\n\nblock1\n\nblock2\n\n{0}\n{1}\nabc\n    description1.\n'
                      '    description2.'.format(header.title(), '-'*len(header)))
@@ -154,14 +155,154 @@ def test_parse_numpy():
                                                            DocDescription('def', types='int')])]))
 
 
+def test_parse_numpy_types():
+    """Test that docinstance.numpy.parse_numpy creates the same instances as the constructors."""
+    docstring = ('summary\n\nextended\n\nParameters\n----------\nabc : str\n    description1.\n'
+                 'Custom\n------\nnote\n\nProperties\n----------\nx : int')
+    parsed = parse_numpy(docstring)
+    assert [type(i) for i in parsed.sections] == [Summary, ExtendedSummary, Parameters, DocSection,
+                                                  DocSection]
+    assert parsed == Docstring([Summary('summary'), ExtendedSummary('extended'),
+                                Parameters(DocDescription('abc', types='str',
+                                                          descs='description1.')),
+                                DocSection('custom', 'note'),
+                                DocSection('properties', DocDescription('x', types='int'))])
+    assert all(isinstance(i, ContentList) for i in
+               [parsed.sections, parsed.sections[2].contents, parsed.sections[2].contents[0].types,
+                parsed.sections[2].contents[0].descs])
+    # parsed docstring keeps track of its modifications
+    fingerprint = parsed.fingerprint
+    parsed.sections[2].contents[0].descs.append('description2.')
+    assert parsed.fingerprint != fingerprint
+
+
 def test_parse_numpy_raw():
     """Test pydocstring.numpy_docstring.parse_numpy with raw strings."""
     docstring = '"""summary\n\nextended"""'
     assert (parse_numpy(docstring, contains_quotes=True) ==
             Docstring([Summary('summary'), ExtendedSummary('extended')]))
     docstring = 'r"""summary\n\nextended"""'
-    with pytest.raises(NotImplementedError):
+    assert (parse_numpy(docstring, contains_quotes=True) ==
+            Docstring([Summary('summary'), ExtendedSummary('extended')]))
+    # backslashes of raw strings are kept
+    docstring = 'r"""summary\n\n.. math::\n\n    \\frac{1}{2}\n"""'
+    assert (parse_numpy(docstring, contains_quotes=True) ==
+            Docstring([Summary('summary'), ExtendedSummary([DocEquation('\\frac{1}{2}')])]))
+    # escape sequences of normal strings are processed
+    docstring = '    """summary\n\n    \\\\frac{1}{2} \\u03b1\n    """'
+    assert (parse_numpy(docstring, contains_quotes=True) ==
+            Docstring([Summary('summary'), ExtendedSummary('\\frac{1}{2} \u03b1')]))
+    # other prefixes and quotes
+    docstring = "U'''summary'''"
+    assert parse_numpy(docstring, contains_quotes=True) == Docstring([Summary('summary')])
+    docstring = "Rb'''summary'''"
+    with pytest.raises(ValueError):
+        parse_numpy(docstring, contains_quotes=True)
+    docstring = '"""summary""" + x'
+    with pytest.raises(ValueError):
         parse_numpy(docstring, contains_quotes=True)
+    docstring = '"""summary'
+    with pytest.raises(ValueError):
+        parse_numpy(docstring, contains_quotes=True)
+
+
+def test_try_parse_numpy():
+    """Test docinstance.parser.numpy._try_parse_numpy."""
+    assert _try_parse_numpy('summary\n\nextended') == Docstring([Summary('summary'),
+                                                                 ExtendedSummary('extended')])
+    assert _try_parse_numpy('summary\n\nParameters\n---\nx\n') is None
+    docstring = 'summary\n\nParameters\n----------\nx : {int} or dict\n    X.\n'
+    with pytest.raises(ValueError):
+        parse_numpy(docstring)
+    assert _try_parse_numpy(docstring) is None
+
+
+def test_eval_literal():
+    """Test docinstance.parser.numpy._eval_literal."""
+    assert _eval_literal('"a"') == 'a'
+    assert _eval_literal('  r"\\a"  # comment') == '\\a'
+    assert _eval_literal('"a" \'b\'') == 'ab'
+    assert _eval_literal('"""a\n    b"""') == 'a\n    b'
+    with pytest.raises(ValueError):
+        _eval_literal('')
+    with pytest.raises(ValueError):
+        _eval_literal('x')
+    with pytest.raises(ValueError):
+        _eval_literal('b"a"')
+
+
+def test_docstring_literals():
+    """Test docinstance.parser.numpy.docstring_literals."""
+    source = ('#!/usr/bin/env python\n'
+              '"""Module."""\n'
+              'import os\n'
+              '\n'
+              '\n'
+              '@decorator(x=lambda: 1)\n'
+              'class A(B, metaclass=M):\n'
+              '    r"""Class \\alpha."""\n'
+              '    x: int = 1\n'
+              '\n'
+              '    def f(self, a: int = {"a": 1}) -> dict:\n'
+              '        # comment\n'
+              '        "one" \'two\'\n'
+              '\n'
+              '    async def g(self): """Inline."""\n'
+              '\n'
+              '    def h(self):\n'
+              '        x = """Not a docstring."""\n'
+              '        return x\n'
+              '\n'
+              '\n'
+              'def k(): pass\n'
+              'def m():\n'
+              '    "first"; x = 1\n'
+              'def n():\n'
+              '    "not a docstring".strip()\n'
+              's = """Not a docstring."""\n')
+    assert list(docstring_literals(io.StringIO(source).readline)) == [
+        ('', 2, '"""Module."""'), ('A', 8, 'r"""Class \\alpha."""'),
+        ('A.f', 13, '"one" \'two\''), ('A.g', 15, '"""Inline."""'), ('m', 24, '"first"')
+    ]
+    # nested objects
+    source = ('class A:\n'
+              '    class B:\n'
+              '        def f(self):\n'
+              '            """A.B.f."""\n'
+              '            def g():\n'
+              '                """A.B.f.<locals>.g."""\n'
+              '\n'
+              '    if True:\n'
+              '        def h(self): """A.h."""\n'
+              '    def k(self):\n'
+              '        """A.k."""\n'
+              'def m():\n'
+              '    """m."""\n')
+    assert list(docstring_literals(io.StringIO(source).readline)) == [
+        ('A.B.f', 4, '"""A.B.f."""'), ('A.B.f.<locals>.g', 6, '"""A.B.f.<locals>.g."""'),
+        ('A.h', 9, '"""A.h."""'), ('A.k', 11, '"""A.k."""'), ('m', 13, '"""m."""'),
+    ]
+    source = 'x = 1\n"""Not a docstring."""\n'
+    assert list(docstring_literals(io.StringIO(source).readline)) == []
+
+
+def test_parse_numpy_file(tmp_path):
+    """Test docinstance.parser.numpy.parse_numpy_file."""
+    path = tmp_path / 'dummy.py'
+    path.write_text('r"""Module.\n\n.. math::\n\n    \\alpha\n\n"""\n\n\n'
+                    'def f():\n    """Function.\n\n    Returns\n    -------\n    x : int\n'
+                    '        X.\n\n    """\n\n\n'
+                    'class A:\n    """Class.\n\n    Returns\n    ---\n    """\n\n'
+                    '    def g(self):\n        """Method."""\n')
+    docstrings = parse_numpy_file(str(path))
+    assert len(docstrings) == 4
+    assert docstrings[0] == ('', 1, Docstring([Summary('Module.'),
+                                               ExtendedSummary([DocEquation('\\alpha')])]))
+    assert docstrings[1][:2] == ('f', 11)
+    assert docstrings[1][2].sections[1].contents[0].name == 'x'
+    # docstrings that are not in numpy format do not stop the parsing of the rest of the file
+    assert docstrings[2] == ('A', 22, None)
+    assert docstrings[3] == ('A.g', 29, Docstring('Method.'))
 
 
 def test_parse_numpy_self():
@@ -191,7 +332,8 @@ def test_parse_numpy_self():
     assert (parse_numpy(docstring, contains_quotes=False).sections[2].contents[1].types ==
             ['bool'])
     assert (parse_numpy(docstring, contains_quotes=False).sections[2].contents[1].descs ==
-            [r'True if docstring contains \"\"\" or \'\'\'.'])
+            [r'True if docstring is given as a string literal, i.e. with its quotes (e.g. '
+             r'\"\"\" or \'\'\') and its prefix (e.g. r for raw strings), as in the source code.'])
     # returns
     assert (parse_numpy(docstring, contains_quotes=False).sections[3].header ==
             'returns')
@@ -211,17 +353,13 @@ def test_parse_numpy_self():
              'If summary is now followed with a blank line.',
              'If number of \'-\' does not match the number of characters in the header.',
              'If given entry of the tabbed information (parameters, attributes, methods, returns, '
-             'yields, raises, see also) had an unexpected pattern.'])
-    assert (parse_numpy(docstring, contains_quotes=False).sections[4].contents[1].name ==
-            'NotImplementedError')
-    assert (parse_numpy(docstring, contains_quotes=False).sections[4].contents[1].descs ==
-            [r'If quotes corresponds to a raw string, i.e. r\"\"\".'])
+             'yields, raises, see also) had an unexpected pattern.',
+             'If docstring is not a string literal when `contains_quotes` is True.'])
+    assert len(parse_numpy(docstring, contains_quotes=False).sections[4].contents) == 1
 
 
 def test_parse_numpy_equations():
     """Test pydocstring.numpy_docstring.parse_numpy with equations."""
-    # monkeypatch equality for Docstring
-    Docstring.__eq__ = lambda self, other: self.__dict__ == other.__dict__
     # equation in extended
     docstring = ('summary\n\n.. math::\n\n    \\frac{1}{2}')
     assert (parse_numpy(docstring) ==
@@ -0,0 +1,616 @@
+"""Static scanning of the docstrings in the source files.
+
+Docstrings of the modules, classes, and functions are extracted from the syntax trees of the source
+files (with `ast`), so the modules are never imported. This avoids the side effects and the
+dependencies of importing the modules, and allows the docstrings of large source trees to be
+analyzed (e.g. parsed with `parse_numpy`) in parallel.
+
+Docstrings can also be extracted from the compiled files (`.pyc`) by walking the constants of their
+code objects, e.g. for packages that are installed without their source files, and from the source
+files within wheels and zip archives, without extracting them.
+
+Since most files only have docstrings without any structure (e.g. a summary), the files can be
+prefiltered by searching their raw bytes (through `mmap`) for the markers of the structured
+docstrings, i.e. the dashed lines underneath the headers of numpy docstrings and `.. math::`, so
+that only the files that contain them are parsed.
+
+Each docstring is reported as a ScanRecord.
+
+"""
+import ast
+import dis
+import importlib.util
+import inspect
+import marshal
+import mmap
+import os
+import re
+import sys
+import zipfile
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from docinstance.parser.numpy import _try_parse_numpy
+from docinstance.utils import _check_jobs
+
+# markers of the structured docstrings: dashed lines underneath the headers and math blocks
+_re_structured = re.compile(rb'\n[ \t]*-{3,}[ \t]*\r?\n|\.\. math::')
+
+
+class ScanRecord(namedtuple('ScanRecord', ['qualname', 'docstring', 'path', 'lineno', 'text'])):
+    """Docstring of a module, class, or function found in a source file.
+
+    Attributes
+    ----------
+    qualname : str
+        Name of the module, or the qualified name of the object with the name of its module.
+    docstring : {Docstring, None}
+        Docstring instance parsed from the docstring.
+        None if the docstring could not be parsed.
+    path : str
+        Path to the source file.
+        Files within archives are given as the path to the archive joined with the path within the
+        archive.
+    lineno : int
+        Line number at which the docstring starts.
+        For the compiled files, line number at which the definition of the object starts.
+    text : str
+        Docstring as it is given in the source code (i.e. value of its string literal).
+
+    """
+
+    __slots__ = ()
+
+
+def _module_name(path):
+    """Return the name of the module and the directory from which it can be imported.
+
+    Parameters
+    ----------
+    path : str
+        Path to the source file.
+
+    Returns
+    -------
+    name : str
+        Full name of the module, including its packages.
+    root : str
+        Directory that contains the top-level package (or the module).
+
+    """
+    directory, filename = os.path.split(os.path.abspath(path))
+    parts = [] if filename == '__init__.py' else [os.path.splitext(filename)[0]]
+    while os.path.isfile(os.path.join(directory, '__init__.py')):
+        directory, package = os.path.split(directory)
+        parts.insert(0, package)
+    return '.'.join(parts), directory
+
+
+def _docstring_nodes(tree):
+    """Return the docstring literals of the module, classes, and functions in the syntax tree.
+
+    Parameters
+    ----------
+    tree : ast.Module
+        Syntax tree of the module.
+
+    Returns
+    -------
+    nodes : dict of str to 2-tuple of {ast.Constant, int}
+        Qualified name of each object to its docstring literal and the number of objects in which
+        it is nested. The module is identified by an empty string.
+        Objects without a docstring literal are mapped to None.
+
+    """
+    def literal(node):
+        """Return the docstring literal of the node."""
+        body = node.body
+        # NOTE: string literals are parsed into ast.Constant (rather than ast.Str) since Python 3.8
+        if (body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant) and
+                isinstance(body[0].value.value, str)):
+            return body[0].value
+        return None
+
+    nodes = {'': (literal(tree), 0)}
+    stack = [(tree, '', 0)]
+    while stack:
+        node, prefix, depth = stack.pop()
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+                qualname = prefix + child.name
+                # later definitions replace the earlier ones, as they do in the module
+                nodes[qualname] = (literal(child), depth + 1)
+                if isinstance(child, ast.ClassDef):
+                    stack.append((child, qualname + '.', depth + 1))
+                else:
+                    stack.append((child, qualname + '.<locals>.', depth + 1))
+            elif not isinstance(child, ast.expr):
+                # e.g. definitions within if statements
+                stack.append((child, prefix, depth))
+    return nodes
+
+
+def scan_source(source, module_name, path='<unknown>', parse=True):
+    """Return the docstrings in the source code.
+
+    Parameters
+    ----------
+    source : {str, bytes}
+        Source code of the module.
+    module_name : str
+        Name of the module.
+    path : {str, '<unknown>'}
+        Path to the source file.
+    parse : {bool, True}
+        True if the docstrings are parsed with `parse_numpy`.
+        Default is True.
+
+    Returns
+    -------
+    records : list of ScanRecord
+        Docstrings in the order in which they appear in the source code.
+
+    Raises
+    ------
+    SyntaxError
+        If the source code cannot be parsed.
+
+    """
+    records = []
+    for qualname, (node, _) in _docstring_nodes(ast.parse(source, filename=path)).items():
+        if node is None:
+            continue
+        if qualname:
+            qualname = '{0}.{1}'.format(module_name, qualname)
+        else:
+            qualname = module_name
+        docstring = _try_parse_numpy(node.value) if parse else None
+        records.append(ScanRecord(qualname, docstring, path, node.lineno, node.value))
+    records.sort(key=lambda record: record.lineno)
+    return records
+
+
+def has_structured_docstrings(path):
+    """Check if the file may contain structured docstrings.
+
+    Parameters
+    ----------
+    path : str
+        Path to the source file or the compiled file.
+
+    Returns
+    -------
+    bool
+        True if the file contains a dashed line (e.g. underneath the header of a numpy section) or
+        `.. math::`.
+        False if the file is empty or cannot be read.
+
+    Notes
+    -----
+    The file is memory mapped and searched as bytes, so it is neither decoded nor copied into
+    memory. False positives (e.g. dashed lines in strings that are not docstrings) are possible,
+    but any file that contains a structured docstring is found.
+
+    """
+    try:
+        with open(path, 'rb') as source_file:
+            with mmap.mmap(source_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return _re_structured.search(data) is not None
+    # NOTE: empty files cannot be memory mapped
+    except (OSError, ValueError):
+        return False
+
+
+def scan_file(path, parse=True, prefilter=False):
+    """Return the docstrings in the source file.
+
+    Parameters
+    ----------
+    path : str
+        Path to the source file, the compiled file (`.pyc`), or the wheel or zip archive (`.whl`,
+        `.zip`).
+    parse : {bool, True}
+        True if the docstrings are parsed with `parse_numpy`.
+        Default is True.
+    prefilter : {bool, False}
+        True if only the files that may contain structured docstrings are scanned.
+        See `has_structured_docstrings`.
+        Default is False.
+
+    Returns
+    -------
+    records : list of ScanRecord
+        Docstrings in the order in which they appear in the source file.
+        Empty if the file cannot be read or parsed, or if it is filtered out.
+
+    """
+    try:
+        if path.endswith(('.whl', '.zip')):
+            return scan_archive(path, parse=parse, prefilter=prefilter)
+        if prefilter and not has_structured_docstrings(path):
+            return []
+        if path.endswith('.pyc'):
+            return scan_pyc(path, parse=parse)
+        with open(path, 'rb') as source_file:
+            source = source_file.read()
+        return scan_source(source, _module_name(path)[0], path=path, parse=parse)
+    except (OSError, SyntaxError, ValueError, EOFError, TypeError, zipfile.BadZipFile):
+        return []
+
+
+def _archive_module_name(member):
+    """Return the name of the module of the source file within a wheel or a zip archive.
+
+    Parameters
+    ----------
+    member : str
+        Path to the source file within the archive.
+
+    Returns
+    -------
+    name : {str, None}
+        Name of the module, assuming that the root of the archive is in the search path.
+        Modules within the `purelib` and `platlib` directories of the `.data` directory of a wheel
+        are installed in the search path.
+        None if the source file is not installed as a module (e.g. scripts).
+
+    """
+    parts = member.split('/')
+    if parts[0].endswith('.data'):
+        if len(parts) < 3 or parts[1] not in ('purelib', 'platlib'):
+            return None
+        parts = parts[2:]
+    parts[-1] = parts[-1][:-3]
+    if parts[-1] == '__init__':
+        parts.pop()
+    if not parts:
+        return None
+    return '.'.join(parts)
+
+
+def scan_archive(path, parse=True, max_size=2 ** 24, prefilter=False):
+    """Return the docstrings in the source files within the wheel or zip archive.
+
+    Each source file is read from the archive (one at a time), so the archive is never extracted.
+
+    Parameters
+    ----------
+    path : str
+        Path to the archive.
+    parse : {bool, True}
+        True if the docstrings are parsed with `parse_numpy`.
+        Default is True.
+    max_size : {int, 16777216}
+        Maximum size (in bytes, after decompression) of the source files that are scanned.
+        Larger files are skipped so that the memory used for each file is bounded.
+        Default is 16 MiB.
+    prefilter : {bool, False}
+        True if only the source files that may contain structured docstrings are scanned.
+        See `has_structured_docstrings`.
+        Default is False.
+
+    Returns
+    -------
+    records : list of ScanRecord
+        Docstrings in the order of the source files within the archive and then the order in which
+        they appear in the source file.
+
+    Raises
+    ------
+    zipfile.BadZipFile
+        If the file is not a zip archive.
+
+    """
+    records = []
+    with zipfile.ZipFile(path) as archive:
+        for info in sorted(archive.infolist(), key=lambda info: info.filename):
+            if info.is_dir() or not info.filename.endswith('.py') or info.file_size > max_size:
+                continue
+            module_name = _archive_module_name(info.filename)
+            if module_name is None:
+                continue
+            with archive.open(info) as source_file:
+                source = source_file.read()
+            if prefilter and _re_structured.search(source) is None:
+                continue
+            try:
+                records.extend(scan_source(source, module_name,
+                                           path=os.path.join(path, info.filename), parse=parse))
+            except (SyntaxError, ValueError):
+                continue
+    return records
+
+
+def _stored_docstring(code):
+    """Return the docstring that is stored in `__doc__` by the code of a module or class body.
+
+    Parameters
+    ----------
+    code : code
+        Code object of the module or the class body.
+
+    Returns
+    -------
+    docstring : {str, None}
+        Docstring of the module or class.
+        None if the code does not store a constant string in `__doc__`.
+
+    """
+    previous = None
+    for instruction in dis.get_instructions(code):
+        if instruction.opname == 'STORE_NAME' and instruction.argval == '__doc__':
+            if (previous is not None and previous.opname == 'LOAD_CONST' and
+                    isinstance(previous.argval, str)):
+                return previous.argval
+            return None
+        previous = instruction
+    return None
+
+
+def _code_docstrings(code, module_name):
+    """Return the docstrings of the module, classes, and functions within the module code.
+
+    Parameters
+    ----------
+    code : code
+        Code object of the module.
+    module_name : str
+        Name of the module.
+
+    Returns
+    -------
+    docstrings : list of 3-tuple of {str, int, str}
+        Qualified name (with the name of the module), line number of the definition, and the
+        docstring of each object, in the order of the line numbers.
+
+    Notes
+    -----
+    Docstrings of the functions rely on the convention of CPython that the first constant of the
+    code object of a function is its docstring (or None, if it does not have one). The code objects
+    of the class bodies are distinguished from the functions using the flag `CO_OPTIMIZED`.
+
+    """
+    docstrings = []
+    doc = _stored_docstring(code)
+    if doc is not None:
+        docstrings.append((module_name, 1, doc))
+    # stack of the code objects and their qualified names (for Python < 3.11)
+    stack = [(code, '')]
+    while stack:
+        parent, prefix = stack.pop()
+        for const in parent.co_consts:
+            if not inspect.iscode(const) or const.co_name.startswith('<'):
+                continue
+            qualname = getattr(const, 'co_qualname', prefix + const.co_name)
+            if const.co_flags & inspect.CO_OPTIMIZED:
+                doc = const.co_consts[0] if const.co_consts else None
+                stack.append((const, qualname + '.<locals>.'))
+            else:
+                doc = _stored_docstring(const)
+                stack.append((const, qualname + '.'))
+            if isinstance(doc, str):
+                docstrings.append(('{0}.{1}'.format(module_name, qualname), const.co_firstlineno,
+                                   doc))
+    docstrings.sort(key=lambda docstring: docstring[1])
+    return docstrings
+
+
+def _pyc_module_name(path):
+    """Return the name of the module of the compiled file.
+
+    Parameters
+    ----------
+    path : str
+        Path to the compiled file, either within `__pycache__` or next to the (missing) source file.
+
+    Returns
+    -------
+    name : str
+
+    """
+    try:
+        source_path = importlib.util.source_from_cache(path)
+    except ValueError:
+        source_path = os.path.splitext(path)[0] + '.py'
+    return _module_name(source_path)[0]
+
+
+def scan_pyc(path, parse=True):
+    """Return the docstrings in the compiled file.
+
+    The code object of the module is unmarshalled and its constants are walked recursively, so the
+    module is never executed.
+
+    Parameters
+    ----------
+    path : str
+        Path to the compiled file (`.pyc`).
+    parse : {bool, True}
+        True if the docstrings are parsed with `parse_numpy`.
+        Default is True.
+
+    Returns
+    -------
+    records : list of ScanRecord
+        Docstrings in the order of the definitions in the source file.
+
+    Raises
+    ------
+    ValueError
+        If the file was compiled by a different version of Python.
+
+    """
+    with open(path, 'rb') as pyc_file:
+        data = pyc_file.read()
+    if data[:4] != importlib.util.MAGIC_NUMBER:
+        raise ValueError('{0} was compiled by a different version of Python.'.format(path))
+    # NOTE: header consists of the magic number, flags, and either the modification time and size
+    # or the hash of the source file (PEP 552)
+    code = marshal.loads(data[16:])
+    return [ScanRecord(qualname, _try_parse_numpy(doc) if parse else None, path, lineno, doc)
+            for qualname, lineno, doc in _code_docstrings(code, _pyc_module_name(path))]
+
+
+def _list_directory(directory, bytecode=False):
+    """Return the modules and the subdirectories of the directory.
+
+    Parameters
+    ----------
+    directory : str
+        Directory that is listed.
+    bytecode : {bool, False}
+        True if the compiled files are returned in place of the source files, when they exist.
+        Default is False.
+
+    Returns
+    -------
+    files : list of str
+        Paths to the source (or compiled) files, in the order of the names of the modules.
+    subdirectories : list of str
+        Paths to the subdirectories, in sorted order, except for the hidden directories and the
+        directories whose names start with two underscores (e.g. `__pycache__`).
+
+    """
+    modules = {}
+    subdirectories = []
+    has_cache = False
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if name == '__pycache__':
+                    has_cache = True
+                elif not name.startswith(('.', '__')):
+                    subdirectories.append(entry.path)
+            elif name.endswith('.py'):
+                modules.setdefault(name[:-3], entry.path)
+            elif bytecode and name.endswith('.pyc'):
+                # sourceless compiled file
+                modules[name[:-4]] = entry.path
+    if bytecode and has_cache:
+        suffix = '.{0}.pyc'.format(sys.implementation.cache_tag)
+        with os.scandir(os.path.join(directory, '__pycache__')) as entries:
+            for entry in entries:
+                if entry.name.endswith(suffix) and entry.name[:-len(suffix)] in modules:
+                    modules[entry.name[:-len(suffix)]] = entry.path
+    return [modules[name] for name in sorted(modules)], sorted(subdirectories)
+
+
+def find_sources(path, bytecode=False):
+    """Return the python source files within the directory.
+
+    Parameters
+    ----------
+    path : str
+        Source file or directory that is searched recursively.
+    bytecode : {bool, False}
+        True if the compiled files (in `__pycache__` for the current version of Python, or in place
+        of the source files) are returned in place of the source files, when they exist.
+        Default is False.
+
+    Returns
+    -------
+    sources : list of str
+        Paths to the source (or compiled) files, in sorted order within each directory.
+        Hidden directories and the directories whose names start with two underscores (e.g.
+        `__pycache__`) are skipped.
+
+    """
+    if not os.path.isdir(path):
+        return [path]
+    sources = []
+    stack = [path]
+    while stack:
+        files, subdirectories = _list_directory(stack.pop(), bytecode=bytecode)
+        sources.extend(files)
+        stack.extend(reversed(subdirectories))
+    return sources
+
+
+def scan_files(paths, jobs=1, parse=True, prefilter=False):
+    """Yield the docstrings in the given files.
+
+    Parameters
+    ----------
+    paths : list of str
+        Paths to the source files, compiled files, or wheel or zip archives.
+    jobs : {int, 1}
+        Number of processes that scan the files.
+        If 1, then the files are scanned in the current process.
+        Default is 1.
+    parse : {bool, True}
+        True if the docstrings are parsed with `parse_numpy`.
+        Default is True.
+    prefilter : {bool, False}
+        True if only the files that may contain structured docstrings are scanned.
+        See `has_structured_docstrings`.
+        Default is False.
+
+    Yields
+    ------
+    record : ScanRecord
+        Docstring in the files, in the order of the files and then the order in which they appear in
+        the file.
+
+    Raises
+    ------
+    ValueError
+        If `jobs` is not a positive integer.
+
+    Notes
+    -----
+    Each file is scanned by a single process, so the memory used by each process is bounded by the
+    docstrings of one file (or archive). Files that cannot be read or parsed are skipped.
+
+    """
+    _check_jobs(jobs)
+    if jobs == 1:
+        for path in paths:
+            yield from scan_file(path, parse=parse, prefilter=prefilter)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for records in pool.map(scan_file, paths, [parse] * len(paths), [prefilter] * len(paths),
+                                chunksize=max(1, len(paths) // (4 * jobs))):
+            yield from records
+
+
+def scan_package(path, jobs=1, parse=True, bytecode=False, prefilter=False):
+    """Yield the docstrings in the source files of the package.
+
+    Parameters
+    ----------
+    path : str
+        Directory of the package (or any directory, source file, or archive).
+    jobs : {int, 1}
+        Number of processes that parse the source files.
+        If 1, then the files are parsed in the current process.
+        Default is 1.
+    parse : {bool, True}
+        True if the docstrings are parsed with `parse_numpy`.
+        Default is True.
+    bytecode : {bool, False}
+        True if the docstrings are read from the compiled files, when they exist, rather than the
+        source files.
+        Default is False.
+    prefilter : {bool, False}
+        True if only the files that may contain structured docstrings are scanned.
+        See `has_structured_docstrings`.
+        Default is False.
+
+    Yields
+    ------
+    record : ScanRecord
+        Docstring in the source files, in the order of the files and then the order in which
+        they appear in the file.
+
+    Raises
+    ------
+    ValueError
+        If `jobs` is not a positive integer.
+
+    Notes
+    -----
+    The modules are never imported. Files that cannot be read or parsed are skipped.
+
+    """
+    yield from scan_files(find_sources(path, bytecode=bytecode), jobs=jobs, parse=parse,
+                          prefilter=prefilter)
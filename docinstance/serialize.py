@@ -0,0 +1,438 @@
+"""Compact serialization of the docstring and its contents.
+
+Docstrings are encoded as nested tuples that contain only strings and tuples so that they can be
+stored with `marshal` (or, after converting tuples to lists, with `json`). Each docstring or content
+is encoded as a tuple whose first element is the name of its class followed by its attributes:
+
+- Docstring: (class, default_style, sections)
+- DocSection: (class, header, contents)
+- DocDescription: (class, name, signature, types, descs)
+- DocEquation: (class, equations)
+
+where the contents of the sections and the descriptions are strings or encoded contents, and the
+types are strings or (module, qualified name) pairs of the classes. Classes defined in docinstance
+are encoded with their names, and other classes are encoded as 'module:qualified name'.
+
+"""
+import importlib
+import json
+import marshal
+from docinstance.docstring import Docstring
+from docinstance.content.base import ContentList
+from docinstance.content import section
+from docinstance.content.section import DocSection
+from docinstance.content.description import DocDescription
+from docinstance.content.equation import DocEquation
+from docinstance import frozen
+
+# version of the encoding
+FORMAT_VERSION = 1
+
+
+def _known_classes():
+    """Return the classes of docinstance that are encoded with their names.
+
+    Returns
+    -------
+    known_classes : dict of str to class
+        Name of the class to the class.
+
+    """
+    classes = [Docstring, DocDescription, DocEquation, frozen.FrozenDocstring,
+               frozen.FrozenSection, frozen.FrozenDescription, frozen.FrozenEquation]
+    classes += [i for i in vars(section).values()
+                if isinstance(i, type) and issubclass(i, DocSection)]
+    return {i.__name__: i for i in classes}
+
+
+_name_to_class = _known_classes()
+_class_to_name = {j: i for i, j in _name_to_class.items()}
+
+
+def _import_class(module_name, qualname):
+    """Return the class with the given module and qualified name.
+
+    Parameters
+    ----------
+    module_name : str
+        Name of the module in which the class is defined.
+    qualname : str
+        Qualified name of the class within the module.
+
+    Returns
+    -------
+    cls : class
+
+    Raises
+    ------
+    ValueError
+        If the class cannot be found.
+        If the object with the given name is not a class.
+
+    """
+    try:
+        obj = importlib.import_module(module_name)
+        for name in qualname.split('.'):
+            obj = getattr(obj, name)
+    except (ImportError, AttributeError):
+        raise ValueError('Cannot find the class {0} in module {1}.'.format(qualname, module_name))
+    if not isinstance(obj, type):
+        raise ValueError('{0} in module {1} is not a class.'.format(qualname, module_name))
+    return obj
+
+
+def _encode_class(cls):
+    """Return the encoded class of the docstring or its content.
+
+    Parameters
+    ----------
+    cls : class
+
+    Returns
+    -------
+    encoded_cls : str
+
+    Raises
+    ------
+    TypeError
+        If the class cannot be imported by its qualified name (e.g. it is defined locally).
+
+    """
+    try:
+        return _class_to_name[cls]
+    except KeyError:
+        return '{0}:{1}'.format(*_encode_type(cls))
+
+
+def _encode_known_class(cls):
+    """Return the encoded class, if it is a class of docinstance.
+
+    Parameters
+    ----------
+    cls : class
+
+    Returns
+    -------
+    encoded_cls : str
+
+    Raises
+    ------
+    TypeError
+        If the class is not one of the classes of docinstance (e.g. a subclass with additional
+        attributes), since the encoding would lose the attributes that it does not know about.
+
+    """
+    try:
+        return _class_to_name[cls]
+    except KeyError:
+        raise TypeError('Class {0} is not a class of docinstance.'.format(cls.__qualname__))
+
+
+def _encode_type(cls):
+    """Return the encoded class that is used as a type in a description.
+
+    Parameters
+    ----------
+    cls : class
+
+    Returns
+    -------
+    encoded_cls : 2-tuple of str
+        Module and qualified name of the class.
+
+    Raises
+    ------
+    TypeError
+        If the class cannot be imported by its qualified name (e.g. it is defined locally).
+
+    """
+    if '<locals>' in cls.__qualname__:
+        raise TypeError('Class {0} is defined locally and cannot be serialized.'
+                        ''.format(cls.__qualname__))
+    return (cls.__module__, cls.__qualname__)
+
+
+def _decode_class(encoded_cls):
+    """Return the class from its encoding.
+
+    Parameters
+    ----------
+    encoded_cls : str
+
+    Returns
+    -------
+    cls : class
+
+    Raises
+    ------
+    ValueError
+        If the class cannot be found.
+
+    """
+    try:
+        return _name_to_class[encoded_cls]
+    except KeyError:
+        pass
+    module_name, _, qualname = encoded_cls.partition(':')
+    if not qualname:
+        raise ValueError('Unknown class, {0}.'.format(encoded_cls))
+    return _import_class(module_name, qualname)
+
+
+def encode(obj):
+    """Encode the docstring or its content as nested tuples.
+
+    Parameters
+    ----------
+    obj : {Docstring, DocSection, DocDescription, DocEquation, str}
+        Docstring or its content.
+
+    Returns
+    -------
+    encoded : {tuple, str}
+        Nested tuples of strings that can be stored with `marshal`.
+
+    Raises
+    ------
+    TypeError
+        If the object is not a docstring, one of its contents, or a string.
+        If the types of a description contain a class that cannot be imported by its qualified
+        name.
+
+    """
+    return _encode(obj, _encode_class)
+
+
+def _encode(obj, encode_class):
+    """Encode the docstring or its content as nested tuples with the given encoding of classes.
+
+    Parameters
+    ----------
+    obj : {Docstring, DocSection, DocDescription, DocEquation, str}
+        Docstring or its content.
+    encode_class : function
+        Function that returns the encoded class of the docstring and its contents.
+
+    Returns
+    -------
+    encoded : {tuple, str}
+        Nested tuples of strings.
+
+    Raises
+    ------
+    TypeError
+        If the object is not a docstring, one of its contents, or a string.
+        If the types of a description contain a class that cannot be imported by its qualified
+        name.
+        If `encode_class` cannot encode the class of the object or of its contents.
+
+    """
+    if isinstance(obj, str):
+        return obj
+    cls = encode_class(type(obj))
+    if isinstance(obj, Docstring):
+        return (cls, obj.default_style, tuple(_encode(i, encode_class) for i in obj.sections))
+    if isinstance(obj, DocSection):
+        return (cls, obj.header, tuple(_encode(i, encode_class) for i in obj.contents))
+    if isinstance(obj, DocDescription):
+        types = tuple(i if isinstance(i, str) else _encode_type(i) for i in obj.types)
+        return (cls, obj.name, obj.signature, types,
+                tuple(_encode(i, encode_class) for i in obj.descs))
+    if isinstance(obj, DocEquation):
+        return (cls, tuple(obj.equations))
+    raise TypeError('Only Docstring, DocContent instances, and strings can be serialized.')
+
+
+def _new_equation(cls, equations):
+    """Return an equation without initializing it.
+
+    Parameters
+    ----------
+    cls : class
+        Class of the equation.
+    equations : list of str
+        Lines of the equation.
+
+    Returns
+    -------
+    equation : cls
+
+    Notes
+    -----
+    Frozen equations are initialized normally because their hashes need to be computed.
+
+    """
+    if getattr(cls, '_mutable', True) is False:
+        return cls('\n'.join(equations))
+    equation = cls.__new__(cls)
+    object.__setattr__(equation, 'equations', ContentList(equations))
+    return equation
+
+
+def decode(encoded):
+    """Decode the docstring or its content from nested tuples.
+
+    Parameters
+    ----------
+    encoded : {tuple, list, str}
+        Nested tuples (or lists) of strings created by `encode`.
+
+    Returns
+    -------
+    obj : {Docstring, DocSection, DocDescription, DocEquation, str}
+        Docstring or its content.
+
+    Raises
+    ------
+    ValueError
+        If the encoding is not recognized.
+
+    """
+    if isinstance(encoded, str):
+        return encoded
+    cls = _decode_class(encoded[0])
+    # pylint: disable=W0212
+    if issubclass(cls, Docstring):
+        return cls._from_parts(ContentList([decode(i) for i in encoded[2]]), encoded[1])
+    if issubclass(cls, DocSection):
+        return cls._from_parts(encoded[1], ContentList([decode(i) for i in encoded[2]]))
+    if issubclass(cls, DocDescription):
+        types = ContentList([i if isinstance(i, str) else _import_class(*i) for i in encoded[3]])
+        return cls._from_parts(encoded[1], encoded[2], types,
+                               ContentList([decode(i) for i in encoded[4]]))
+    if issubclass(cls, DocEquation):
+        return _new_equation(cls, encoded[1])
+    raise ValueError('Unknown class, {0}.'.format(encoded[0]))
+
+
+def dumps(obj):
+    """Return the bytes that represent the docstring or its content.
+
+    Parameters
+    ----------
+    obj : {Docstring, DocSection, DocDescription, DocEquation}
+        Docstring or its content.
+
+    Returns
+    -------
+    data : bytes
+        Marshalled encoding of the object.
+        Format of `marshal` may change between the versions of Python, so the bytes should only be
+        loaded by the same version of Python.
+
+    """
+    return marshal.dumps((FORMAT_VERSION, encode(obj)))
+
+
+def loads(data):
+    """Return the docstring or its content from its bytes.
+
+    Parameters
+    ----------
+    data : bytes
+        Bytes created by `dumps`.
+
+    Returns
+    -------
+    obj : {Docstring, DocSection, DocDescription, DocEquation}
+        Docstring or its content.
+
+    Raises
+    ------
+    ValueError
+        If the data was created with a different version of the encoding.
+
+    """
+    return _decode_versioned(*marshal.loads(data))
+
+
+def dumps_json(obj):
+    """Return the JSON string that represents the docstring or its content.
+
+    Parameters
+    ----------
+    obj : {Docstring, DocSection, DocDescription, DocEquation}
+        Docstring or its content.
+
+    Returns
+    -------
+    data : str
+        JSON of the encoding of the object.
+
+    """
+    return json.dumps([FORMAT_VERSION, encode(obj)], separators=(',', ':'))
+
+
+def loads_json(data):
+    """Return the docstring or its content from its JSON string.
+
+    Parameters
+    ----------
+    data : str
+        JSON string created by `dumps_json`.
+
+    Returns
+    -------
+    obj : {Docstring, DocSection, DocDescription, DocEquation}
+        Docstring or its content.
+
+    Raises
+    ------
+    ValueError
+        If the data was created with a different version of the encoding.
+
+    """
+    return _decode_versioned(*json.loads(data))
+
+
+def _decode_versioned(version, encoded):
+    """Return the docstring or its content from its encoding with the given version.
+
+    Parameters
+    ----------
+    version : int
+        Version of the encoding.
+    encoded : {tuple, list}
+        Nested tuples (or lists) of strings created by `encode`.
+
+    Returns
+    -------
+    obj : {Docstring, DocSection, DocDescription, DocEquation}
+        Docstring or its content.
+
+    Raises
+    ------
+    ValueError
+        If the data was created with a different version of the encoding.
+
+    """
+    if version != FORMAT_VERSION:
+        raise ValueError('Data was serialized with an unsupported format, {0}.'.format(version))
+    return decode(encoded)
+
+
+def _reduce(obj):
+    """Return the compact reduction of the docstring or its content for pickling and copying.
+
+    Parameters
+    ----------
+    obj : {Docstring, DocSection, DocDescription, DocEquation}
+        Docstring or its content.
+
+    Returns
+    -------
+    reduced : 2-tuple
+        Function that reconstructs the object and its arguments, i.e. the version and the encoding
+        of the object.
+        Encoding is given as plain tuples (rather than the bytes of `dumps`) so that the pickles do
+        not depend on the version of Python.
+
+    Raises
+    ------
+    TypeError
+        If the object or its contents are not instances of the classes of docinstance (e.g. custom
+        contents or subclasses with additional attributes), or the types of a description contain
+        a class that cannot be imported by its qualified name.
+
+    """
+    return (_decode_versioned, (FORMAT_VERSION, _encode(obj, _encode_known_class)))
@@ -0,0 +1,130 @@
+"""Test docinstance.bake."""
+import ast
+import importlib
+import sys
+import pytest
+from docinstance import bake
+from docinstance.__main__ import main
+
+SOURCE = '''"""This will be replaced."""
+# comment that is kept
+from docinstance.docstring import Docstring
+from docinstance.content.section import DocSection
+from docinstance.content.description import DocDescription
+
+_docinstance = Docstring(['Dummy module.'])
+
+
+class DummyClass:
+    """This too will be replaced."""
+
+    _docinstance = Docstring([
+        'Class for testing.',
+        DocSection('attributes', DocDescription('x', types=str, descs='Example \\\\alpha.'))
+    ])
+
+    def f(self):
+        """Not replaced."""
+
+
+class NoLiteral:
+    _docinstance = Docstring(['No literal.'])
+'''
+
+
+def make_package(tmp_path, name):
+    """Create a package with a module that has Docstring instances."""
+    package = tmp_path / name
+    package.mkdir()
+    (package / '__init__.py').write_text('')
+    (package / 'dummy.py').write_text(SOURCE)
+    return package
+
+
+def test_make_literal():
+    """Test docinstance.bake._make_literal."""
+    for doc in ['Summary.', 'a \\b', 'a """ \\b', 'a\\', 'quote"', 'a \\b"']:
+        literal = bake._make_literal(doc)
+        assert ast.literal_eval(literal) == doc
+    assert bake._make_literal('a \\b') == 'r"""a \\b"""'
+
+
+def test_bake(tmp_path):
+    """Test docinstance.bake.bake."""
+    package = make_package(tmp_path, 'bake_pkg')
+    try:
+        results = bake.bake([str(package)])
+        assert [(i.baked, i.skipped, i.changed) for i in results] == [
+            (0, (), False), (2, ('NoLiteral',), True)
+        ]
+        source = (package / 'dummy.py').read_text()
+        assert source.startswith('"""Dummy module."""\n# comment that is kept\n')
+        assert ('class DummyClass:\n'
+                '    r"""Class for testing.\n\n'
+                '    Attributes\n'
+                '    ----------\n'
+                '    x : str\n'
+                '        Example \\alpha.\n\n'
+                '    """\n' in source)
+        assert '"""Not replaced."""' in source
+
+        # docstrings are the same as the rendered ones
+        module = sys.modules['bake_pkg.dummy']
+        module = importlib.reload(module)
+        assert module.__doc__ == 'Dummy module.'
+        assert module.DummyClass.__doc__ == module.DummyClass._docinstance.make_docstring(
+            width=100, indent_level=1, tabsize=4
+        )
+
+        # baking again does not change anything
+        assert [i.changed for i in bake.bake([str(package / 'dummy.py')])] == [False]
+    finally:
+        for name in ['bake_pkg', 'bake_pkg.dummy']:
+            sys.modules.pop(name, None)
+        sys.path.remove(str(tmp_path))
+
+    with pytest.raises(ValueError):
+        bake.bake([str(package)], jobs=0)
+
+
+def test_bake_same_name(tmp_path):
+    """Test docinstance.bake.bake with modules that share their names with other modules."""
+    template = ('from docinstance.docstring import Docstring\n\n\n'
+                'class C:\n'
+                '    """Old."""\n\n'
+                '    _docinstance = Docstring([{0!r}])\n')
+    paths = []
+    for directory, name in [('a', 'bake_same'), ('b', 'bake_same'), ('c', 'inspect')]:
+        (tmp_path / directory).mkdir()
+        path = tmp_path / directory / '{0}.py'.format(name)
+        path.write_text(template.format('New {0}.'.format(directory)))
+        paths.append(str(path))
+    modules = set(sys.modules)
+    try:
+        results = bake.bake(paths)
+    finally:
+        for name in set(sys.modules) - modules:
+            del sys.modules[name]
+        for directory in ['a', 'b', 'c']:
+            sys.path.remove(str(tmp_path / directory))
+    assert [(i.path, i.baked, i.changed) for i in results] == [(i, 1, True) for i in paths]
+    for path, directory in zip(paths, ['a', 'b', 'c']):
+        with open(path) as source_file:
+            assert '    """New {0}."""\n'.format(directory) in source_file.read()
+
+
+def test_main(tmp_path, capsys):
+    """Test docinstance.__main__.main."""
+    package = make_package(tmp_path, 'bake_pkg_main')
+    try:
+        assert main(['bake', '--width', '80', str(package)]) == 0
+    finally:
+        for name in ['bake_pkg_main', 'bake_pkg_main.dummy']:
+            sys.modules.pop(name, None)
+        sys.path.remove(str(tmp_path))
+    out, err = capsys.readouterr()
+    assert out == 'baked {0} (2 docstrings)\n'.format(package / 'dummy.py')
+    assert err == 'skipped {0}: NoLiteral has no docstring literal\n'.format(package / 'dummy.py')
+    assert (package / 'dummy.py').read_text().startswith('"""Dummy module."""\n')
+    with pytest.raises(SystemExit):
+        main([])
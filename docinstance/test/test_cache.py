@@ -0,0 +1,115 @@
+"""Test docinstance.cache."""
+import pytest
+from docinstance.cache import RenderCache, render_cache
+from docinstance.docstring import Docstring
+from docinstance.content.base import DocContent
+from docinstance.content.section import DocSection, Parameters
+from docinstance.content.description import DocDescription
+
+
+def test_render_cache_init():
+    """Test RenderCache.__init__."""
+    with pytest.raises(TypeError):
+        RenderCache(1.0)
+    with pytest.raises(ValueError):
+        RenderCache(-1)
+    test = RenderCache(2)
+    assert test.maxsize == 2
+    assert test.info() == {'hits': 0, 'misses': 0, 'hit_rate': 0.0, 'maxsize': 2, 'size': 0}
+
+
+def test_render_cache_render():
+    """Test RenderCache.render."""
+    test = RenderCache(2)
+    section1 = DocSection('raises', DocDescription('ValueError', descs='Always.'))
+    section2 = DocSection('raises', DocDescription('ValueError', descs='Always.'))
+    assert (test.render(section1, 'make_numpy_docstring', 100, 0, 4) ==
+            section1.make_numpy_docstring(100, 0, 4))
+    assert test.info() == {'hits': 0, 'misses': 1, 'hit_rate': 0.0, 'maxsize': 2, 'size': 1}
+    assert (test.render(section2, 'make_numpy_docstring', 100, 0, 4) ==
+            section1.make_numpy_docstring(100, 0, 4))
+    assert test.info() == {'hits': 1, 'misses': 1, 'hit_rate': 0.5, 'maxsize': 2, 'size': 1}
+    # different parameters
+    assert (test.render(section1, 'make_numpy_docstring', 100, 1, 4) ==
+            section1.make_numpy_docstring(100, 1, 4))
+    assert (test.render(section1, 'make_google_docstring', 100, 0, 4) ==
+            section1.make_google_docstring(100, 0, 4))
+    assert test.info()['size'] == 2
+    assert test.misses == 3
+    # least recently used is evicted
+    test.render(section1, 'make_numpy_docstring', 100, 0, 4)
+    assert test.misses == 4
+    # mutated content is rendered again
+    section1.contents[0].descs = ['Sometimes.']
+    assert (test.render(section1, 'make_numpy_docstring', 100, 0, 4) ==
+            'Raises\n------\nValueError\n    Sometimes.\n\n')
+    assert test.misses == 5
+    # mutated list is rendered again
+    section1.contents[0].descs.append('Always.')
+    assert (test.render(section1, 'make_numpy_docstring', 100, 0, 4) ==
+            'Raises\n------\nValueError\n    Sometimes.\n    Always.\n\n')
+    # classes are distinguished
+    test.render(Parameters(DocDescription('x')), 'make_numpy_docstring', 100, 0, 4)
+    misses = test.misses
+    test.render(DocSection('parameters', DocDescription('x')), 'make_numpy_docstring', 100, 0, 4)
+    assert test.misses == misses + 1
+    # errors are not stored
+    with pytest.raises(ValueError):
+        test.render(DocSection('quite long header', 'a'), 'make_google_docstring', 10, 0, 4)
+    # disabled
+    test = RenderCache(0)
+    assert (test.render(section1, 'make_numpy_docstring', 100, 0, 4) ==
+            section1.make_numpy_docstring(100, 0, 4))
+    test.render(section1, 'make_numpy_docstring', 100, 0, 4)
+    assert test.info() == {'hits': 0, 'misses': 0, 'hit_rate': 0.0, 'maxsize': 0, 'size': 0}
+
+
+class DictContent(DocContent):
+    """Content whose values are stored in a dictionary."""
+
+    __slots__ = ('values',)
+
+    def __init__(self, values):
+        """Initialize."""
+        self.values = values
+
+    def make_numpy_docstring(self, width, indent_level, tabsize):
+        """Return the values."""
+        return ', '.join(sorted(self.values))
+
+
+def test_render_cache_untracked():
+    """Test RenderCache.render with contents whose modifications are not tracked."""
+    test = RenderCache(2)
+    content = DictContent({'a': 1})
+    assert test.render(content, 'make_numpy_docstring', 100, 0, 4) == 'a'
+    content.values['b'] = 2
+    assert test.render(content, 'make_numpy_docstring', 100, 0, 4) == 'a, b'
+
+
+def test_render_cache_clear():
+    """Test RenderCache.clear."""
+    test = RenderCache()
+    test.render(DocSection('notes', 'Something.'), 'make_rst_docstring', 100, 0, 4)
+    test.clear()
+    assert test.info() == {'hits': 0, 'misses': 0, 'hit_rate': 0.0, 'maxsize': 4096, 'size': 0}
+
+
+def test_render_cache_docstring(monkeypatch):
+    """Test that the sections of Docstring are rendered through the render_cache."""
+    assert render_cache.maxsize == 0
+    render_cache.clear()
+    Docstring(['Summary.']).make_docstring()
+    assert render_cache.info()['misses'] == 0
+
+    monkeypatch.setattr(render_cache, 'maxsize', 4096)
+    raises = DocSection('raises', DocDescription('ValueError', descs='Always.'))
+    doc1 = Docstring(['Summary 1.', raises])
+    doc2 = Docstring(['Summary 2.', DocSection('raises', DocDescription('ValueError',
+                                                                        descs='Always.'))])
+    doc1.make_docstring()
+    misses = render_cache.misses
+    assert doc2.make_docstring() == 'Summary 2.\n\nRaises\n------\nValueError\n    Always.\n\n'
+    assert render_cache.misses == misses
+    assert render_cache.hits > 0
+    render_cache.clear()
@@ -0,0 +1,98 @@
+"""Test docinstance.diff."""
+import copy
+import pytest
+from docinstance.diff import diff, patch
+from docinstance.docstring import Docstring
+from docinstance.content.section import DocSection, Summary, ExtendedSummary, Parameters, Returns
+from docinstance.content.description import DocDescription
+
+
+def make_docstring():
+    """Return a docstring with a few sections."""
+    return Docstring([Summary('Summary.'), ExtendedSummary('Extended summary.'),
+                      Parameters([DocDescription('x', types=int, descs='Example 1.'),
+                                  DocDescription('y', types=str, descs='Example 2.')]),
+                      Returns(DocDescription('z', types=float)),
+                      DocSection('notes', 'Note.')])
+
+
+def check_patch(old, new):
+    """Check that the patched docstring is equal to the new docstring."""
+    edits = diff(old, new)
+    patched = patch(copy.deepcopy(old), edits)
+    assert patched == new
+    assert [type(i) for i in patched.sections] == [type(i) for i in new.sections]
+    return edits
+
+
+def test_diff_equal():
+    """Test docinstance.diff.diff with equal docstrings."""
+    assert diff(make_docstring(), make_docstring()) == []
+    docstring = make_docstring()
+    assert patch(docstring, []) is docstring
+    assert docstring == make_docstring()
+
+
+def test_diff_description():
+    """Test docinstance.diff.diff with modified descriptions."""
+    old = make_docstring()
+    new = make_docstring()
+    new.sections[2].contents[1].descs = ['Modified.']
+    edits = check_patch(old, new)
+    assert edits == [('replace_description', ('parameters', 0), ('y', 0),
+                      new.sections[2].contents[1])]
+
+    new = make_docstring()
+    del new.sections[2].contents[0]
+    new.sections[2].contents.append(DocDescription('w'))
+    edits = check_patch(old, new)
+    assert edits == [('remove_description', ('parameters', 0), ('x', 0)),
+                     ('add_description', ('parameters', 0), 1, ('w', 0), DocDescription('w'))]
+
+    new = make_docstring()
+    new.sections[2].contents.reverse()
+    edits = check_patch(old, new)
+    assert edits == [('reorder_descriptions', ('parameters', 0), [('y', 0), ('x', 0)])]
+
+    new = make_docstring()
+    new.sections[2].contents.insert(0, DocDescription('x', types=bool))
+    edits = check_patch(old, new)
+    assert [edit[0] for edit in edits] == ['replace_description', 'add_description']
+
+
+def test_diff_section():
+    """Test docinstance.diff.diff with modified sections."""
+    old = make_docstring()
+    new = make_docstring()
+    new.sections[1].contents = ['Modified.']
+    edits = check_patch(old, new)
+    assert edits == [('replace_section', ('', 1), new.sections[1])]
+
+    new = make_docstring()
+    del new.sections[1]
+    new.sections.insert(2, DocSection('examples', 'Example.'))
+    edits = check_patch(old, new)
+    assert [edit[0] for edit in edits] == ['remove_section', 'add_section']
+
+    new = make_docstring()
+    new.sections[3], new.sections[4] = new.sections[4], new.sections[3]
+    new.default_style = 'google'
+    edits = check_patch(old, new)
+    assert edits[0] == ('set_default_style', 'google')
+    assert edits[1][0] == 'reorder_sections'
+
+    new = Docstring(['Other summary.', DocSection('returns', 'Something.')])
+    check_patch(old, new)
+    check_patch(new, old)
+
+
+def test_patch_errors():
+    """Test docinstance.diff.patch with invalid edits."""
+    with pytest.raises(KeyError):
+        patch(make_docstring(), [('remove_section', ('references', 0))])
+    with pytest.raises(KeyError):
+        patch(make_docstring(), [('remove_description', ('references', 0), ('x', 0))])
+    with pytest.raises(KeyError):
+        patch(make_docstring(), [('replace_description', ('parameters', 0), ('a', 0), 'x')])
+    with pytest.raises(ValueError):
+        patch(make_docstring(), [('rename_section', ('parameters', 0), 'x')])
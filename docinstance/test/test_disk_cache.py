@@ -0,0 +1,53 @@
+"""Test docinstance.disk_cache."""
+import os
+import docinstance
+from docinstance import disk_cache
+
+
+def test_cache_path():
+    """Test docinstance.disk_cache.cache_path."""
+    assert (disk_cache.cache_path(os.path.join('a', 'b.py')) ==
+            os.path.join('a', '__docinstance_cache__', 'b.py.json'))
+
+
+def test_load_save(tmp_path):
+    """Test docinstance.disk_cache.load and docinstance.disk_cache.save."""
+    source = tmp_path / "dummy.py"
+    source.write_text('"""Dummy."""\n')
+    params = {'width': 100, 'tabsize': 4}
+    docs = {'': 'Module.', 'Class': 'Class.\n\n    '}
+    assert disk_cache.load(str(source), params) is None
+
+    assert disk_cache.save(str(source), params, docs)
+    assert os.path.isfile(disk_cache.cache_path(str(source)))
+    assert os.listdir(str(tmp_path / '__docinstance_cache__')) == ['dummy.py.json']
+    assert disk_cache.load(str(source), params) == docs
+    # different parameters
+    assert disk_cache.load(str(source), {'width': 80, 'tabsize': 4}) is None
+    # different version
+    version = docinstance.__version__
+    try:
+        disk_cache.__version__ = 'x'
+        assert disk_cache.load(str(source), params) is None
+    finally:
+        disk_cache.__version__ = version
+    # modified source
+    source.write_text('"""Modified dummy."""\n')
+    assert disk_cache.load(str(source), params) is None
+    # corrupt cache
+    disk_cache.save(str(source), params, docs)
+    with open(disk_cache.cache_path(str(source)), 'w') as cache_file:
+        cache_file.write('{')
+    assert disk_cache.load(str(source), params) is None
+
+
+def test_save_unwritable(tmp_path):
+    """Test docinstance.disk_cache.save when the cache cannot be written."""
+    source = tmp_path / "dummy.py"
+    source.write_text('"""Dummy."""\n')
+    # file in place of the cache directory
+    (tmp_path / '__docinstance_cache__').write_text('')
+    assert not disk_cache.save(str(source), {}, {'': 'Dummy.'})
+    assert disk_cache.load(str(source), {}) is None
+    # missing source
+    assert not disk_cache.save(str(tmp_path / "missing.py"), {}, {})
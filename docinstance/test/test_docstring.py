@@ -1,6 +1,9 @@
 """Test docinstance.docstring."""
+import subprocess
+import sys
 import pytest
 from docinstance.docstring import Docstring
+from docinstance.content.base import ContentList
 from docinstance.content.section import DocSection
 from docinstance.content.description import DocDescription
 
@@ -52,6 +55,14 @@ def test_init():
     assert test.default_style == 'rst'
 
 
+def test_from_parts():
+    """Test Docstring._from_parts."""
+    test = Docstring._from_parts([DocSection('', 'summary')], 'rst')
+    assert test == Docstring('summary', 'rst')
+    assert isinstance(test.sections, ContentList)
+    assert Docstring._from_parts(test.sections).default_style == 'numpy'
+
+
 def test_make_docstring():
     """Test Docstring.make_docstring."""
     test = Docstring(['summary', 'extended summary', DocSection('parameters', '')])
@@ -151,3 +162,75 @@ def test_check_section_order():
     test = Docstring(['summary', 'extended', DocSection('warns', ''), DocSection('parameters', ''),
                       DocSection('asdfdsaf', '')])
     assert test.check_section_order('random') is True
+
+
+def test_eq():
+    """Test Docstring.__eq__ and Docstring.__ne__."""
+    assert not hasattr(Docstring('some text'), '__dict__')
+    assert Docstring('some text') == Docstring('some text')
+    assert Docstring(['summary', DocSection('x', DocDescription('y'))]) == Docstring(
+        ['summary', DocSection('x', DocDescription('y'))])
+    assert Docstring('some text') != Docstring('other text')
+    assert Docstring('some text') != Docstring('some text', 'google')
+    assert Docstring('some text') != DocSection('', 'some text')
+    # hashed by identity
+    test = Docstring('some text')
+    assert hash(test) == hash(test)
+    assert len({test, Docstring('some text')}) == 2
+
+
+def test_fingerprint():
+    """Test Docstring.fingerprint."""
+    test1 = Docstring(['summary', DocSection('x', DocDescription('y', types=int))])
+    test2 = Docstring(['summary', DocSection('x', DocDescription('y', types=int))])
+    assert test1.fingerprint == test2.fingerprint
+    assert test1.fingerprint != Docstring(['summary', DocSection('x', DocDescription('z'))])
+    assert test1.fingerprint != Docstring(['summary', DocSection('x', DocDescription('y'))],
+                                          'rst').fingerprint
+    # nested modifications
+    test1.sections[1].contents[0].types.append(str)
+    assert test1.fingerprint != test2.fingerprint
+    assert test1 != test2
+    test2.sections[1].contents[0].types = [int, str]
+    assert test1.fingerprint == test2.fingerprint
+    test2.sections.append(DocSection('z', 'something'))
+    assert test1.fingerprint != test2.fingerprint
+    # stable across processes
+    code = ("from docinstance.docstring import Docstring;"
+            "from docinstance.content.section import DocSection;"
+            "from docinstance.content.description import DocDescription;"
+            "print(Docstring(['summary', DocSection('x', DocDescription('y', types=[int, str]))])"
+            ".fingerprint)")
+    output = subprocess.check_output([sys.executable, '-c', code], universal_newlines=True,
+                                     env={'PYTHONHASHSEED': '1', 'PYTHONPATH': ':'.join(sys.path)})
+    assert output.strip() == test1.fingerprint
+
+
+def test_getitem():
+    """Test Docstring.__getitem__ and Docstring.__contains__."""
+    docstring = Docstring(['summary', DocSection('parameters', [DocDescription('x'),
+                                                                DocDescription('y')]),
+                           DocSection('notes', 'first'), DocSection('Notes', 'second')])
+    assert docstring['parameters'] is docstring.sections[1]
+    assert docstring['Parameters'] is docstring.sections[1]
+    assert docstring['notes'] is docstring.sections[2]
+    assert docstring[''] is docstring.sections[0]
+    assert docstring['parameters']['y'] is docstring.sections[1].contents[1]
+    assert 'notes' in docstring
+    assert 'returns' not in docstring
+    with pytest.raises(KeyError):
+        docstring['returns']  # pylint: disable=W0104
+    # index is updated with the modifications
+    docstring.sections.insert(1, DocSection('returns', DocDescription('z')))
+    assert docstring['returns']['z'] is docstring.sections[1].contents[0]
+    del docstring.sections[3]
+    assert docstring['notes'].contents == ['second']
+    docstring.sections[1].contents[0].name = 'w'
+    assert 'w' in docstring['returns']
+    assert 'z' not in docstring['returns']
+    # keys must be strings and the docstring is not iterable
+    with pytest.raises(TypeError):
+        docstring[0]  # pylint: disable=W0104
+    assert None not in docstring
+    with pytest.raises(TypeError):
+        iter(docstring)
@@ -0,0 +1,180 @@
+"""Test docinstance.frozen."""
+import gc
+import threading
+import pytest
+from docinstance import frozen
+from docinstance.frozen import (FrozenEquation, FrozenDescription, FrozenSection, FrozenDocstring,
+                                freeze, thaw)
+from docinstance.docstring import Docstring
+from docinstance.content.section import DocSection, Parameters
+from docinstance.content.description import DocDescription
+from docinstance.content.equation import DocEquation
+
+
+def test_frozen_equation():
+    """Test docinstance.frozen.FrozenEquation."""
+    test = FrozenEquation('a + b\nc + d\n')
+    assert test.equations == ('a + b', 'c + d')
+    assert test == DocEquation('a + b\nc + d')
+    assert DocEquation('a + b\nc + d') == test
+    assert test != DocEquation('a + b')
+    assert hash(test) == hash(FrozenEquation('a + b\nc + d'))
+    assert (test.make_numpy_docstring(100, 0, 4) ==
+            DocEquation('a + b\nc + d').make_numpy_docstring(100, 0, 4))
+    with pytest.raises(AttributeError):
+        test.equations = ('x',)
+    with pytest.raises(AttributeError):
+        del test.equations
+    with pytest.raises(TypeError):
+        FrozenEquation(1)
+
+
+def test_frozen_description():
+    """Test docinstance.frozen.FrozenDescription."""
+    test = FrozenDescription('x', '(a, b)', [int, 'list of str'],
+                             ['Example.', DocEquation('a + b')])
+    assert test.types == (int, 'list of str')
+    assert test.descs == ('Example.', FrozenEquation('a + b'))
+    assert isinstance(test.descs[1], FrozenEquation)
+    desc = DocDescription('x', '(a, b)', [int, 'list of str'], ['Example.', DocEquation('a + b')])
+    assert test == desc
+    assert desc == test
+    assert test != DocDescription('y', '(a, b)', [int, 'list of str'])
+    assert hash(test) == hash(FrozenDescription('x', '(a, b)', (int, 'list of str'),
+                                                ('Example.', DocEquation('a + b'))))
+    # names and types are interned
+    name = ''.join(['n', 'a', 'm', 'e'])
+    assert FrozenDescription(name).name is FrozenDescription('name').name
+    assert (FrozenDescription('x', types=''.join(['i', 'n', 't'])).types[0] is
+            FrozenDescription('y', types='int').types[0])
+    test = FrozenDescription('x', '(a, b)', [int, 'list of str'], ['Example 1.', 'Example 2.'])
+    desc = DocDescription('x', '(a, b)', [int, 'list of str'], ['Example 1.', 'Example 2.'])
+    for func in ['make_numpy_docstring', 'make_numpy_docstring_signature',
+                 'make_google_docstring', 'make_rst_docstring']:
+        assert getattr(test, func)(100, 1, 4) == getattr(desc, func)(100, 1, 4)
+    with pytest.raises(AttributeError):
+        test.name = 'y'
+    with pytest.raises(TypeError):
+        FrozenDescription(1)
+
+
+def test_frozen_section():
+    """Test docinstance.frozen.FrozenSection."""
+    desc = DocDescription('x', types=int, descs='Example.')
+    test = FrozenSection('parameters', [desc])
+    assert test.contents == (desc,)
+    assert isinstance(test.contents[0], FrozenDescription)
+    assert test == Parameters(desc)
+    assert Parameters(desc) == test
+    assert test != DocSection('parameters', DocDescription('y'))
+    assert hash(test) == hash(FrozenSection('parameters', desc))
+    assert (test.make_numpy_docstring(100, 0, 4) ==
+            Parameters(desc).make_numpy_docstring(100, 0, 4))
+    with pytest.raises(AttributeError):
+        test.header = 'returns'
+    with pytest.raises(TypeError):
+        FrozenSection('parameters', ['x', desc])
+
+
+def test_frozen_docstring():
+    """Test docinstance.frozen.FrozenDocstring."""
+    docstring = Docstring(['Summary.', 'Extended.',
+                           DocSection('parameters', DocDescription('x', types=int,
+                                                                   descs='Example.'))])
+    test = FrozenDocstring(docstring.sections)
+    assert isinstance(test.sections, tuple)
+    assert all(isinstance(i, FrozenSection) for i in test.sections)
+    assert test == docstring
+    assert docstring == test
+    assert test != Docstring('Summary.')
+    assert hash(test) == hash(FrozenDocstring(docstring.sections))
+    assert {test: 1}[FrozenDocstring(docstring.sections)] == 1
+    for style in ['numpy', 'numpy with signature', 'google', 'rst']:
+        assert (test.make_docstring(width=100, indent_level=1, tabsize=4, style=style) ==
+                docstring.make_docstring(width=100, indent_level=1, tabsize=4, style=style))
+    assert test.fingerprint == docstring.fingerprint
+    fingerprint = test._fingerprint
+    docstring.sections.append(DocSection('notes', 'Modified.'))
+    assert test._fingerprint is fingerprint
+    assert test.fingerprint == fingerprint
+    with pytest.raises(AttributeError):
+        test.sections = ()
+    with pytest.raises(ValueError):
+        FrozenDocstring([])
+
+
+def test_freeze():
+    """Test docinstance.frozen.freeze."""
+    doc1 = Docstring(['Summary 1.', Parameters([DocDescription('self'),
+                                                DocDescription('tabsize', types=int,
+                                                               descs=DocEquation('x'))])])
+    doc2 = Docstring(['Summary 2.', Parameters([DocDescription('self'),
+                                                DocDescription('tabsize', types=int,
+                                                               descs=DocEquation('x'))])])
+    frozen1 = freeze(doc1)
+    frozen2 = freeze(doc2)
+    assert isinstance(frozen1, FrozenDocstring)
+    assert frozen1 == doc1
+    assert frozen2 == doc2
+    # identical contents are shared
+    assert frozen1.sections[1] is frozen2.sections[1]
+    assert frozen1.sections[1].contents[0] is frozen2.sections[1].contents[0]
+    assert frozen1.sections[0] is not frozen2.sections[0]
+    assert freeze(doc1) is frozen1
+    assert freeze(frozen1) is frozen1
+    assert freeze(FrozenDocstring(doc1.sections)) is frozen1
+    assert freeze(DocDescription('self')) is frozen1.sections[1].contents[0]
+    assert freeze(DocEquation('x')) is frozen1.sections[1].contents[1].descs[0]
+    assert freeze('x') == 'x'
+    with pytest.raises(TypeError):
+        freeze(1)
+
+    # unused instances are released
+    num_frozen = len(frozen._consing_table)
+    test = freeze(DocDescription('unused_name'))
+    assert len(frozen._consing_table) == num_frozen + 1
+    del test
+    gc.collect()
+    assert len(frozen._consing_table) == num_frozen
+
+    # shared between threads
+    results = []
+
+    def target():
+        """Freeze docstring."""
+        results.append(freeze(doc1))
+
+    threads = [threading.Thread(target=target) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(i is frozen1 for i in results)
+
+
+def test_thaw():
+    """Test docinstance.frozen.thaw."""
+    docstring = Docstring(['Summary.', DocSection('parameters',
+                                                  DocDescription('x', types=int,
+                                                                 descs=DocEquation('a')))])
+    test = thaw(freeze(docstring))
+    assert type(test) is Docstring
+    assert type(test.sections[1].contents[0]) is DocDescription
+    assert type(test.sections[1].contents[0].descs[0]) is DocEquation
+    assert isinstance(test.sections[1].contents[0].types, list)
+    assert test == docstring
+    test.sections[1].contents[0].name = 'y'
+    assert test != docstring
+    assert thaw('x') == 'x'
+    with pytest.raises(TypeError):
+        thaw(1)
+
+
+def test_from_parts():
+    """Test that the frozen variants are checked and frozen in _from_parts."""
+    test = FrozenSection._from_parts('parameters', [DocDescription('x')])
+    assert isinstance(test.contents[0], FrozenDescription)
+    assert hash(test) == hash(FrozenSection('parameters', DocDescription('x')))
+    assert isinstance(FrozenDocstring._from_parts([test]).sections, tuple)
+    with pytest.raises(TypeError):
+        FrozenDescription._from_parts(1, '', [], [])
@@ -0,0 +1,242 @@
+"""Test docinstance.scan."""
+import ast
+import importlib.util
+import os
+import py_compile
+import zipfile
+import pytest
+from docinstance import scan
+from docinstance.docstring import Docstring
+
+SOURCE = '''"""Module.
+
+Parameters
+----------
+x : int
+    X.
+
+"""
+import os
+
+
+class A:
+    r"""Class with \\alpha."""
+
+    def f(self):
+        """Method."""
+        def g():
+            """Local function."""
+
+    def h(self):
+        pass
+
+
+if os.name:
+    async def k():
+        """Summary
+        not followed by a blank line.
+        -----
+        """
+'''
+
+
+def make_package(tmp_path):
+    """Create a package with subpackages and files that are not scanned."""
+    package = tmp_path / 'scan_pkg'
+    (package / 'sub').mkdir(parents=True)
+    (package / '__pycache__').mkdir()
+    (package / '.hidden').mkdir()
+    (package / '__init__.py').write_text('"""Package."""\n')
+    (package / 'mod.py').write_text(SOURCE)
+    (package / 'sub' / '__init__.py').write_text('')
+    (package / 'sub' / 'b.py').write_text('def f():\n    """Function in b."""\n')
+    (package / 'sub' / 'broken.py').write_text('def f(:\n')
+    (package / 'sub' / 'data.txt').write_text('"""Not python."""\n')
+    (package / '__pycache__' / 'x.py').write_text('"""Cached."""\n')
+    (package / '.hidden' / 'y.py').write_text('"""Hidden."""\n')
+    return package
+
+
+def test_module_name(tmp_path):
+    """Test docinstance.scan._module_name."""
+    package = make_package(tmp_path)
+    assert scan._module_name(str(package / 'sub' / 'b.py')) == ('scan_pkg.sub.b', str(tmp_path))
+    assert scan._module_name(str(package / '__init__.py')) == ('scan_pkg', str(tmp_path))
+
+
+def test_docstring_nodes():
+    """Test docinstance.scan._docstring_nodes."""
+    nodes = scan._docstring_nodes(ast.parse(SOURCE))
+    assert nodes[''][0].value.startswith('Module.')
+    assert nodes[''][1] == 0
+    assert nodes['A'][0].value == 'Class with \\alpha.'
+    assert nodes['A'][1] == 1
+    assert nodes['A.f'][1] == 2
+    assert nodes['A.f.<locals>.g'][0].value == 'Local function.'
+    assert nodes['A.h'] == (None, 2)
+    assert nodes['k'][1] == 1
+
+
+def test_scan_source():
+    """Test docinstance.scan.scan_source."""
+    records = scan.scan_source(SOURCE, 'mod', path='mod.py')
+    assert [(i.qualname, i.lineno) for i in records] == [
+        ('mod', 1), ('mod.A', 13), ('mod.A.f', 16), ('mod.A.f.<locals>.g', 18), ('mod.k', 26)
+    ]
+    assert [i.header for i in records[0].docstring.sections] == ['', 'parameters']
+    assert records[0].docstring.sections[1].contents[0].name == 'x'
+    assert records[1].docstring == Docstring(['Class with \\alpha.'])
+    assert records[1].text == 'Class with \\alpha.'
+    assert records[1].path == 'mod.py'
+    # cannot be parsed
+    assert records[4].docstring is None
+    assert all(i.docstring is None for i in scan.scan_source(SOURCE, 'mod', parse=False))
+    with pytest.raises(SyntaxError):
+        scan.scan_source('def f(:\n', 'mod')
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_scan_package(tmp_path, jobs):
+    """Test docinstance.scan.scan_package."""
+    package = make_package(tmp_path)
+    records = list(scan.scan_package(str(package), jobs=jobs))
+    assert [i.qualname for i in records] == [
+        'scan_pkg', 'scan_pkg.mod', 'scan_pkg.mod.A', 'scan_pkg.mod.A.f',
+        'scan_pkg.mod.A.f.<locals>.g', 'scan_pkg.mod.k', 'scan_pkg.sub.b.f'
+    ]
+    assert records[-1].path == str(package / 'sub' / 'b.py')
+    assert records[-1].lineno == 2
+    assert records[-1].docstring == Docstring(['Function in b.'])
+    assert [i.qualname for i in scan.scan_package(str(package / 'sub' / 'b.py'))] == [
+        'scan_pkg.sub.b.f'
+    ]
+    assert list(scan.scan_package(str(tmp_path / 'missing.py'))) == []
+    with pytest.raises(ValueError):
+        list(scan.scan_package(str(package), jobs=0))
+
+
+def test_scan_pyc(tmp_path):
+    """Test docinstance.scan.scan_pyc."""
+    package = make_package(tmp_path)
+    source = str(package / 'mod.py')
+    cached = py_compile.compile(source, cfile=importlib.util.cache_from_source(source))
+    records = scan.scan_pyc(cached)
+    expected = scan.scan_source(SOURCE, 'scan_pkg.mod')
+    assert [(i.qualname, i.text, i.docstring) for i in records] == [
+        (i.qualname, i.text, i.docstring) for i in expected
+    ]
+    assert [i.lineno for i in records] == [1, 12, 15, 17, 25]
+    assert records[0].path == cached
+    assert all(i.docstring is None for i in scan.scan_pyc(cached, parse=False))
+
+    # different version of python
+    with open(cached, 'rb') as pyc_file:
+        data = pyc_file.read()
+    with open(cached, 'wb') as pyc_file:
+        pyc_file.write(b'\0\0\0\0' + data[4:])
+    with pytest.raises(ValueError):
+        scan.scan_pyc(cached)
+    assert scan.scan_file(cached) == []
+
+
+def test_scan_package_bytecode(tmp_path):
+    """Test docinstance.scan.scan_package with the compiled files."""
+    package = make_package(tmp_path)
+    source = str(package / 'mod.py')
+    cached = py_compile.compile(source, cfile=importlib.util.cache_from_source(source))
+    # sourceless module
+    sourceless = py_compile.compile(str(package / 'sub' / 'b.py'),
+                                    cfile=str(package / 'sub' / 'c.pyc'))
+    assert scan.find_sources(str(package), bytecode=True) == [
+        str(package / '__init__.py'), cached, str(package / 'sub' / '__init__.py'),
+        str(package / 'sub' / 'b.py'), str(package / 'sub' / 'broken.py'), sourceless
+    ]
+    assert os.path.basename(os.path.dirname(cached)) == '__pycache__'
+    records = list(scan.scan_package(str(package), bytecode=True))
+    assert [i.qualname for i in records] == [
+        'scan_pkg', 'scan_pkg.mod', 'scan_pkg.mod.A', 'scan_pkg.mod.A.f',
+        'scan_pkg.mod.A.f.<locals>.g', 'scan_pkg.mod.k', 'scan_pkg.sub.b.f', 'scan_pkg.sub.c.f'
+    ]
+
+
+def make_wheel(path):
+    """Create a wheel with source files that are and are not installed as modules."""
+    with zipfile.ZipFile(str(path), 'w', zipfile.ZIP_DEFLATED) as wheel:
+        wheel.writestr('whl_pkg/__init__.py', '"""Package."""\n')
+        wheel.writestr('whl_pkg/mod.py', SOURCE)
+        wheel.writestr('whl_pkg/broken.py', 'def f(:\n')
+        wheel.writestr('whl_pkg/big.py', '"""Big."""\n' + '#' * 10000)
+        wheel.writestr('whl_pkg-1.0.data/purelib/extra.py', '"""Extra."""\n')
+        wheel.writestr('whl_pkg-1.0.data/scripts/run.py', '"""Script."""\n')
+        wheel.writestr('whl_pkg-1.0.dist-info/METADATA', 'Name: whl_pkg\n')
+    return str(path)
+
+
+def test_archive_module_name():
+    """Test docinstance.scan._archive_module_name."""
+    assert scan._archive_module_name('a/b/c.py') == 'a.b.c'
+    assert scan._archive_module_name('a/__init__.py') == 'a'
+    assert scan._archive_module_name('a-1.0.data/platlib/a/b.py') == 'a.b'
+    assert scan._archive_module_name('a-1.0.data/scripts/b.py') is None
+    assert scan._archive_module_name('__init__.py') is None
+
+
+def test_scan_archive(tmp_path):
+    """Test docinstance.scan.scan_archive."""
+    wheel = make_wheel(tmp_path / 'whl_pkg-1.0-py3-none-any.whl')
+    records = scan.scan_archive(wheel, max_size=5000)
+    assert [i.qualname for i in records] == [
+        'extra', 'whl_pkg', 'whl_pkg.mod', 'whl_pkg.mod.A', 'whl_pkg.mod.A.f',
+        'whl_pkg.mod.A.f.<locals>.g', 'whl_pkg.mod.k'
+    ]
+    assert records[2].path == os.path.join(wheel, 'whl_pkg/mod.py')
+    assert records[2].docstring == scan.scan_source(SOURCE, 'mod')[0].docstring
+    assert 'whl_pkg.big' in [i.qualname for i in scan.scan_archive(wheel, parse=False)]
+    assert not os.path.exists(str(tmp_path / 'whl_pkg'))
+
+    (tmp_path / 'bad.zip').write_text('not a zip archive')
+    with pytest.raises(zipfile.BadZipFile):
+        scan.scan_archive(str(tmp_path / 'bad.zip'))
+    assert scan.scan_file(str(tmp_path / 'bad.zip')) == []
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_scan_files(tmp_path, jobs):
+    """Test docinstance.scan.scan_files."""
+    wheel = make_wheel(tmp_path / 'whl_pkg-1.0-py3-none-any.whl')
+    with zipfile.ZipFile(str(tmp_path / 'other.zip'), 'w') as archive:
+        archive.writestr('other.py', 'def f():\n    """Other."""\n')
+    records = list(scan.scan_files([wheel, str(tmp_path / 'other.zip')], jobs=jobs))
+    assert [i.qualname for i in records][-2:] == ['whl_pkg.mod.k', 'other.f']
+    assert [i.qualname for i in scan.scan_package(wheel)] == [i.qualname for i in records[:-1]]
+    with pytest.raises(ValueError):
+        list(scan.scan_files([wheel], jobs=0))
+
+
+def test_has_structured_docstrings(tmp_path):
+    """Test docinstance.scan.has_structured_docstrings."""
+    contents = {'numpy.py': SOURCE, 'math.py': '"""Equation.\n\n.. math::\n\n    x\n"""\n',
+                'summary.py': '"""Summary."""\n# ----------\n', 'empty.py': '',
+                'crlf.py': '"""Summary.\r\n\r\n    Returns\r\n    -------\r\n"""\r\n'}
+    for name, content in contents.items():
+        with open(str(tmp_path / name), 'w', newline='') as source_file:
+            source_file.write(content)
+    assert scan.has_structured_docstrings(str(tmp_path / 'numpy.py'))
+    assert scan.has_structured_docstrings(str(tmp_path / 'math.py'))
+    assert scan.has_structured_docstrings(str(tmp_path / 'crlf.py'))
+    assert not scan.has_structured_docstrings(str(tmp_path / 'summary.py'))
+    assert not scan.has_structured_docstrings(str(tmp_path / 'empty.py'))
+    assert not scan.has_structured_docstrings(str(tmp_path / 'missing.py'))
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_scan_prefilter(tmp_path, jobs):
+    """Test docinstance.scan.scan_package with the prefilter."""
+    package = make_package(tmp_path)
+    records = list(scan.scan_package(str(package), jobs=jobs, prefilter=True))
+    assert set(i.path for i in records) == {str(package / 'mod.py')}
+    assert len(records) == len(scan.scan_file(str(package / 'mod.py')))
+
+    wheel = make_wheel(tmp_path / 'whl_pkg-1.0-py3-none-any.whl')
+    records = scan.scan_archive(wheel, prefilter=True)
+    assert set(i.path for i in records) == {os.path.join(wheel, 'whl_pkg/mod.py')}
@@ -0,0 +1,191 @@
+"""Test docinstance.serialize."""
+import copy
+import marshal
+import pickle
+from collections import OrderedDict
+import pytest
+from docinstance import serialize
+from docinstance.docstring import Docstring
+from docinstance.frozen import freeze, FrozenDocstring, FrozenDescription
+from docinstance.content.base import DocContent
+from docinstance.content.section import DocSection, Summary, Parameters, SeeAlso
+from docinstance.content.description import DocDescription
+from docinstance.content.equation import DocEquation
+
+
+class CustomContent(DocContent):
+    """Content that cannot be serialized."""
+
+    __slots__ = ('text',)
+
+    def __init__(self, text):
+        """Initialize."""
+        self.text = text
+
+
+class DefaultDescription(DocDescription):
+    """Description with an additional attribute."""
+
+    __slots__ = ('default',)
+
+    def __init__(self, name, default, **kwargs):
+        """Initialize."""
+        super().__init__(name, **kwargs)
+        self.default = default
+
+
+def make_docstring():
+    """Return a docstring that uses every type of content."""
+    return Docstring([Summary('Summary.'), 'Extended summary.', DocEquation('a + b\nc'),
+                      Parameters([DocDescription('x', '(a, b)', [int, 'list of str'],
+                                                 ['Example.', DocEquation('x = 1')]),
+                                  DocDescription('y', types=OrderedDict)]),
+                      SeeAlso('something'),
+                      DocSection('custom header', ['a', 'b'])], default_style='google')
+
+
+def assert_same(obj1, obj2):
+    """Assert that the two objects have the same classes and the same contents."""
+    assert type(obj1) is type(obj2)
+    if isinstance(obj1, Docstring):
+        assert obj1.default_style == obj2.default_style
+        assert len(obj1.sections) == len(obj2.sections)
+        for i, j in zip(obj1.sections, obj2.sections):
+            assert_same(i, j)
+    elif isinstance(obj1, DocSection):
+        assert obj1.header == obj2.header
+        assert len(obj1.contents) == len(obj2.contents)
+        for i, j in zip(obj1.contents, obj2.contents):
+            assert_same(i, j)
+    elif isinstance(obj1, DocDescription):
+        assert obj1.name == obj2.name
+        assert obj1.signature == obj2.signature
+        assert obj1.types == obj2.types
+        assert all(i is j for i, j in zip(obj1.types, obj2.types) if isinstance(i, type))
+        for i, j in zip(obj1.descs, obj2.descs):
+            assert_same(i, j)
+    else:
+        assert obj1 == obj2
+
+
+def test_encode_decode():
+    """Test docinstance.serialize.encode and docinstance.serialize.decode."""
+    docstring = make_docstring()
+    encoded = serialize.encode(docstring)
+    assert encoded[:2] == ('Docstring', 'google')
+    assert encoded[2][0] == ('Summary', '', ('Summary.',))
+    assert encoded[2][3][2][0][3] == (('builtins', 'int'), 'list of str')
+    assert marshal.loads(marshal.dumps(encoded)) == encoded
+    assert_same(serialize.decode(encoded), docstring)
+    assert serialize.decode(encoded).fingerprint == docstring.fingerprint
+    assert serialize.encode('x') == 'x'
+    # frozen
+    frozen = freeze(docstring)
+    assert_same(serialize.decode(serialize.encode(frozen)), frozen)
+    assert isinstance(serialize.decode(serialize.encode(frozen)).sections[3].contents[0],
+                      FrozenDescription)
+    assert hash(serialize.decode(serialize.encode(frozen))) == hash(frozen)
+    # decoded lists are tracked
+    decoded = serialize.decode(encoded)
+    fingerprint = decoded.fingerprint
+    decoded.sections[3].contents[0].descs.append('More.')
+    assert decoded.fingerprint != fingerprint
+
+    class Local:
+        """Locally defined class."""
+
+    with pytest.raises(TypeError):
+        serialize.encode(DocDescription('x', types=Local))
+    with pytest.raises(TypeError):
+        serialize.encode(1)
+    with pytest.raises(ValueError):
+        serialize.decode(('Unknown', 'x', ()))
+    with pytest.raises(ValueError):
+        serialize.decode(('docinstance.docstring:Unknown', 'x', ()))
+    with pytest.raises(ValueError):
+        serialize.decode(('collections:OrderedDict', 'x', ()))
+    with pytest.raises(ValueError):
+        serialize.decode(('DocDescription', 'x', '', (('not_a_module', 'x'),), ()))
+    with pytest.raises(ValueError):
+        serialize.decode(('DocDescription', 'x', '', (('os', 'sep'),), ()))
+    with pytest.raises(ValueError):
+        serialize.decode(('os:path', 'x', ()))
+
+
+def test_dumps_loads():
+    """Test docinstance.serialize.dumps and docinstance.serialize.loads."""
+    docstring = make_docstring()
+    assert_same(serialize.loads(serialize.dumps(docstring)), docstring)
+    assert_same(serialize.loads(serialize.dumps(docstring.sections[3])), docstring.sections[3])
+    with pytest.raises(ValueError):
+        serialize.loads(marshal.dumps((serialize.FORMAT_VERSION + 1, ('Docstring', 'numpy', ()))))
+
+
+def test_dumps_loads_json():
+    """Test docinstance.serialize.dumps_json and docinstance.serialize.loads_json."""
+    docstring = make_docstring()
+    assert_same(serialize.loads_json(serialize.dumps_json(docstring)), docstring)
+    with pytest.raises(ValueError):
+        serialize.loads_json('[{0}, "x"]'.format(serialize.FORMAT_VERSION + 1))
+
+
+def test_docstring_methods():
+    """Test Docstring.to_bytes, from_bytes, to_json, from_json, and pickling."""
+    docstring = make_docstring()
+    assert_same(Docstring.from_bytes(docstring.to_bytes()), docstring)
+    assert_same(Docstring.from_json(docstring.to_json()), docstring)
+    frozen = freeze(docstring)
+    assert_same(FrozenDocstring.from_bytes(frozen.to_bytes()), frozen)
+    assert_same(FrozenDocstring.from_json(frozen.to_json()), frozen)
+    with pytest.raises(TypeError):
+        FrozenDocstring.from_bytes(docstring.to_bytes())
+    with pytest.raises(TypeError):
+        FrozenDocstring.from_json(docstring.to_json())
+    with pytest.raises(TypeError):
+        Docstring.from_bytes(serialize.dumps(docstring.sections[0]))
+
+    for obj in [docstring, frozen, docstring.sections[3], docstring.sections[3].contents[0],
+                DocEquation('a')]:
+        assert_same(pickle.loads(pickle.dumps(obj)), obj)
+        assert_same(copy.deepcopy(obj), obj)
+    assert len(pickle.dumps(docstring)) < len(pickle.dumps(serialize.encode(docstring))) * 2
+    # reduced to plain tuples (not marshal) so that the pickles do not depend on Python version
+    function, (version, encoded) = docstring.__reduce_ex__(2)
+    assert version == serialize.FORMAT_VERSION
+    assert encoded == serialize.encode(docstring)
+    assert_same(function(version, encoded), docstring)
+    # copies are shallow
+    for obj in [docstring, frozen, docstring.sections[3], docstring.sections[3].contents[0]]:
+        copied = copy.copy(obj)
+        assert type(copied) is type(obj)
+        assert copied == obj
+        assert copied is not obj
+        assert all(copied._fields()[i] is j for i, j in obj._fields().items())
+
+    # subclasses with additional attributes use the default reduction
+    description = DefaultDescription('x', 1, types=int)
+    section = Parameters([description])
+    for obj, copied in [(description, pickle.loads(pickle.dumps(description))),
+                        (description, copy.deepcopy(description)),
+                        (description, copy.copy(description)),
+                        (section, pickle.loads(pickle.dumps(section))),
+                        (section, copy.deepcopy(section))]:
+        assert type(copied) is type(obj)
+        assert copied == obj
+        assert (copied if obj is description else copied.contents[0]).default == 1
+    assert copy.copy(section).contents is section.contents
+
+    # objects that cannot be serialized are pickled and copied with the default reduction
+    docstring.sections.append(DocSection('custom content', [CustomContent('x')]))
+    assert pickle.loads(pickle.dumps(docstring)) == docstring
+    assert copy.deepcopy(docstring) == docstring
+    assert (copy.deepcopy(docstring).sections[-1].contents[0] is not
+            docstring.sections[-1].contents[0])
+
+    class Local:
+        """Locally defined class."""
+
+    description = DocDescription('x', types=Local)
+    docstring = Docstring([Parameters([description]), DocSection('x', [CustomContent('x')])])
+    assert copy.deepcopy(docstring).sections[0].contents[0].types == [Local]
+    assert copy.deepcopy(freeze(docstring.sections[0])) == docstring.sections[0]
@@ -0,0 +1,50 @@
+"""Test docinstance.type_expr."""
+import pytest
+from docinstance.type_expr import (TypeName, TypeChoice, TypeContainer, TypeMapping, parse_type,
+                                   is_valid_type)
+
+
+def test_parse_type():
+    """Test docinstance.type_expr.parse_type."""
+    assert parse_type('int') == TypeName('int')
+    assert parse_type(' array like ') == TypeName('array like')
+    assert parse_type('np.ndarray') == TypeName('np.ndarray')
+    assert parse_type('{int, 100}') == TypeChoice((TypeName('int'), TypeName('100')))
+    assert parse_type("{'a','b'}") == TypeChoice((TypeName("'a'"), TypeName("'b'")))
+    assert parse_type('int/float') == TypeChoice((TypeName('int'), TypeName('float')))
+    assert parse_type('list/tuple of str') == TypeContainer(('list', 'tuple'), TypeName('str'))
+    assert parse_type('list of list of int') == TypeContainer(
+        ('list',), TypeContainer(('list',), TypeName('int')))
+    assert parse_type('list of {str, int}') == TypeContainer(
+        ('list',), TypeChoice((TypeName('str'), TypeName('int'))))
+    assert parse_type('dict of str to object') == TypeMapping(('dict',), TypeName('str'),
+                                                              TypeName('object'))
+    assert parse_type('dict of str to list of int') == TypeMapping(
+        ('dict',), TypeName('str'), TypeContainer(('list',), TypeName('int')))
+    assert parse_type('{None, dict of str to int}') == TypeChoice(
+        (TypeName('None'), TypeMapping(('dict',), TypeName('str'), TypeName('int'))))
+    # memoized
+    assert parse_type('list/tuple of str') is parse_type('list/tuple of str')
+
+    for text in ['', '{int', '{int,}', 'int}', 'list of', 'of int', 'int to str', 'list/ of int',
+                 '{int str', 'int, str']:
+        with pytest.raises(ValueError):
+            parse_type(text)
+    with pytest.raises(TypeError):
+        parse_type(int)
+
+
+def test_str():
+    """Test the string representations of the type expressions."""
+    for text in ['int', 'array like', '{int, 100}', 'list/tuple of str', 'dict of str to object',
+                 'list of {str, dict of str to list of int}']:
+        assert str(parse_type(text)) == text
+    assert str(parse_type('int/float')) == '{int, float}'
+    assert str(parse_type('{ a,b }')) == '{a, b}'
+
+
+def test_is_valid_type():
+    """Test docinstance.type_expr.is_valid_type."""
+    assert is_valid_type('list of str')
+    assert not is_valid_type('list of')
+    assert not is_valid_type(1)
@@ -84,3 +84,78 @@ def test_extract_members():
         h = pytest
 
     assert docinstance.utils.extract_members(Test) == {'f': Test.f, 'g': Test.g}
+
+
+def test_extract_members_no_stat(monkeypatch, tmp_path):
+    """Test that docinstance.utils.extract_members does not access the same files repeatedly."""
+    class Test:  # pragma: no cover
+        """Test class."""
+        def f(self):
+            """Test function."""
+
+    calls = []
+    orig_stat = docinstance.utils.os.stat
+
+    def stat(*args, **kwargs):
+        """Record the access to the file system."""
+        calls.append(args)
+        return orig_stat(*args, **kwargs)
+
+    # identities of the files of the imported modules are cached
+    docinstance.utils.extract_members(docinstance.utils)
+    monkeypatch.setattr(docinstance.utils.os, 'stat', stat)
+    test_members = docinstance.utils.extract_members(Test)
+    utils_members = docinstance.utils.extract_members(docinstance.utils)
+    monkeypatch.undo()
+    assert test_members == {'f': Test.f}
+    assert utils_members['wrap'] is docinstance.utils.wrap
+    assert calls == []
+
+    # files with different names are compared by their devices and inodes
+    path = tmp_path / 'test.py'
+    path.write_text('')
+    link = tmp_path / 'link.py'
+    link.symlink_to(path)
+    assert docinstance.utils._same_file(str(path), str(link))
+    assert not docinstance.utils._same_file(str(path), __file__)
+    with pytest.raises(TypeError):
+        docinstance.utils._same_file(None, str(path))
+    # source files that are not found from the attributes
+    assert docinstance.utils._source_file(pytest.raises) == pytest.raises.__code__.co_filename
+    with pytest.raises(TypeError):
+        docinstance.utils._source_file(1)
+
+
+def test_check_jobs():
+    """Test docinstance.utils._check_jobs."""
+    docinstance.utils._check_jobs(1)
+    docinstance.utils._check_jobs(4)
+    for jobs in [0, -1, 1.0, '2', None]:
+        with pytest.raises(ValueError):
+            docinstance.utils._check_jobs(jobs)
+
+
+@pytest.mark.parametrize('use_numpy', [True, False])
+def test_wrap_many(monkeypatch, use_numpy):
+    """Test docinstance.utils.wrap_many."""
+    if use_numpy:
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(docinstance.utils, 'np', None)
+    texts = ['Text that will be wrapped into different lines such that each line is indented and '
+             'is less than the given length.',
+             'a b c d e', '', 'hyphen-ated words are wrapped with textwrap', '  leading whitespace',
+             'multiple   spaces', 'new\nline', 'short', 'abc abcd abcde abcdef',
+             'first-long-word-goes-alone then short']
+    for width, indent_level, tabsize in [(30, 0, 4), (24, 1, 4), (16, 1, 2), (100, 0, 4)]:
+        assert (docinstance.utils.wrap_many(texts, width=width, indent_level=indent_level,
+                                            tabsize=tabsize, batch_size=3) ==
+                [docinstance.utils.wrap(text, width=width, indent_level=indent_level,
+                                        tabsize=tabsize) for text in texts])
+    assert docinstance.utils.wrap_many([]) == []
+    # too much indentation
+    with pytest.raises(ValueError):
+        docinstance.utils.wrap_many(['hello my name is'], width=5, indent_level=3, tabsize=4)
+    # long words
+    with pytest.raises(ValueError):
+        docinstance.utils.wrap_many(['hello my name is'], width=5, indent_level=1, tabsize=1)
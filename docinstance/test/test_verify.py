@@ -0,0 +1,42 @@
+"""Test docinstance.verify."""
+import pytest
+from docinstance.verify import normalize, Verifier, VerifyRecord
+
+
+def test_normalize():
+    """Test docinstance.verify.normalize."""
+    assert normalize('Summary.\n\n    Extended.  \n\n    ') == 'Summary.\n\nExtended.'
+    assert normalize('\n    Summary.\n    ') == 'Summary.'
+
+
+def test_verifier_init():
+    """Test docinstance.verify.Verifier.__init__."""
+    with pytest.raises(TypeError):
+        Verifier(1.0)
+    with pytest.raises(ValueError):
+        Verifier(0)
+    verifier = Verifier(3)
+    assert verifier.sample == 3
+    assert verifier.records == []
+
+
+def test_verifier_sample_next():
+    """Test docinstance.verify.Verifier.sample_next."""
+    verifier = Verifier(3)
+    assert [verifier.sample_next() for _ in range(7)] == [True, False, False, True, False, False,
+                                                          True]
+    verifier = Verifier()
+    assert all(verifier.sample_next() for _ in range(3))
+
+
+def test_verifier_verify():
+    """Test docinstance.verify.Verifier.verify."""
+    verifier = Verifier()
+    record = verifier.verify('f', 'Summary.\n\n    Extended.\n    ', 'Summary.\n\nExtended.\n')
+    assert record == VerifyRecord('f', True, ())
+    record = verifier.verify('g', 'Summary.\n\n    Old.\n    ', 'Summary.\n\n    New.\n    ')
+    assert not record.matched
+    assert record.diff == ('--- original-docstring', '+++ generated-docstring', '@@ -1,3 +1,3 @@',
+                           ' Summary.', ' ', '-Old.', '+New.')
+    assert verifier.records[0].name == 'f'
+    assert verifier.mismatches == [record]
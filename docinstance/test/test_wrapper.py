@@ -1,10 +1,15 @@
 """Test docinstance.wrapper."""
 import importlib
+import importlib.util
 import os
 import sys
+import types
 import pytest
 from docinstance.wrapper import (kwarg_wrapper, docstring, docstring_recursive,
-                                 docstring_current_module)
+                                 collect_members_recursive, docstring_current_module, LazyDoc,
+                                 LazyDocModule, DocstringFinder, DocstringLoader, wrap_module)
+from docinstance import wrapper, disk_cache
+from docinstance.verify import Verifier
 from docinstance.docstring import Docstring
 from docinstance.content.section import DocSection
 from docinstance.content.description import DocDescription
@@ -283,6 +288,325 @@ def test_wrapper_docstring_recursive_on_class():
     assert Test.f._docinstance == docinstance2
 
 
+def test_docstring_recursive_cycles():
+    """Test docinstance.wrapper.docstring_recursive on objects that reference one another."""
+    class Test1:  # pragma: no cover
+        """Test class."""
+        _docinstance = Docstring('Class 1.')
+
+        def f(self):
+            """Test function."""
+        f._docinstance = Docstring(['Test function.', DocSection('returns', 'nothing')])
+
+        @property
+        def g(self):
+            """Test property."""
+
+    class Test2:  # pragma: no cover
+        """Test class."""
+        _docinstance = Docstring('Class 2.')
+        other = Test1
+        alias = Test1.f
+
+    # reference cycle and aliases
+    Test1.other = Test2
+    Test1.alias = Test1.f
+
+    members = collect_members_recursive(Test2, indent_level=1)
+    assert [(i.__name__ if hasattr(i, '__name__') else i, j) for i, j in members] == [
+        ('Test2', 1), ('Test1', 1), ('f', 2), (Test1.g, 2)
+    ]
+    docstring_recursive(Test2, indent_level=1)
+    assert Test2.__doc__ == 'Class 2.' + ' ' * 4
+    assert Test1.__doc__ == 'Class 1.' + ' ' * 4
+    # rendered at the indentation of its definition
+    assert Test1.f.__doc__ == ('Test function.\n\n'
+                               '        Returns\n'
+                               '        -------\n'
+                               '        nothing\n\n'
+                               '        ')
+
+
+def test_collect_members_recursive_alias(tmp_path, monkeypatch):
+    """Test docinstance.wrapper.collect_members_recursive with aliases in the module."""
+    path = tmp_path / 'dummy_alias.py'
+    path.write_text('def h():\n'
+                    '    """Function."""\n\n\n'
+                    'class A:\n'
+                    '    """Class."""\n\n'
+                    '    def f(self):\n'
+                    '        """Method."""\n\n'
+                    '    class B:\n'
+                    '        """Nested class."""\n\n'
+                    '        alias = h\n\n\n'
+                    'g = A.f\n'
+                    'C = A.B\n')
+    spec = importlib.util.spec_from_file_location('dummy_alias', str(path))
+    module = importlib.util.module_from_spec(spec)
+    monkeypatch.setitem(sys.modules, 'dummy_alias', module)
+    spec.loader.exec_module(module)
+
+    levels = {wrapper._member_key(i): j for i, j in collect_members_recursive(module)}
+    assert levels == {'': 0, 'h': 1, 'A': 1, 'A.f': 2, 'A.B': 2}
+    levels = {wrapper._member_key(i): j for i, j in collect_members_recursive(module.A.B, 2)}
+    assert levels == {'A.B': 2, 'h': 1}
+
+
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+def test_docstring_recursive_jobs(executor):
+    """Test docinstance.wrapper.docstring_recursive with multiple jobs."""
+    def make_class():
+        """Return a class with docinstances."""
+        class Test:  # pragma: no cover
+            """Test class."""
+            _docinstance = Docstring(['Test class.',
+                                      DocSection('attributes',
+                                                 DocDescription('x', types=int, descs='X.'))])
+
+            def f(self):
+                """Test function."""
+            f._docinstance = Docstring(['Test function.', DocSection('returns', 'nothing')])
+
+            def g(self):
+                """Not replaced."""
+
+        return Test
+
+    expected = docstring_recursive(make_class(), indent_level=1)
+    test = docstring_recursive(make_class(), indent_level=1, jobs=2, executor=executor)
+    assert test.__doc__ == expected.__doc__
+    assert test.f.__doc__ == expected.f.__doc__
+    assert test.g.__doc__ == 'Not replaced.'
+    with pytest.raises(ValueError):
+        docstring_recursive(make_class(), jobs=0)
+    with pytest.raises(ValueError):
+        docstring_recursive(make_class(), jobs=2, executor='fork')
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_docstring_recursive_parse(jobs):
+    """Test docinstance.wrapper.docstring_recursive with parsing of the existing docstrings."""
+    def make_class():
+        """Return a class with numpy docstrings."""
+        class Test:  # pragma: no cover
+            """Test class.
+
+            Attributes
+            ----------
+            x : int
+                X.
+
+            """
+
+            def f(self):
+                """Test function.
+
+                Returns
+                -------
+                y : str
+                    Y.
+
+                """
+
+            def g(self):
+                """Test function.
+
+                Returns
+                -------
+                y : str
+                    Y.
+
+                """
+
+            def h(self):
+                """Not parsed because the summary is not followed by a blank line.
+                Next line.
+                ----------
+                """
+
+            def i(self):
+                """Not rendered because the summary is too long for the given width."""
+
+        return Test
+
+    test = docstring_recursive(make_class(), jobs=jobs)
+    assert test.__doc__.startswith('Test class.\n\n            Attributes')
+
+    wrapper._parse_doc.cache_clear()
+    test = docstring_recursive(make_class(), indent_level=1, jobs=jobs, parse=True,
+                               style='google', width=60)
+    assert test.__doc__ == ('Test class.\n\n'
+                            '    Attributes:\n'
+                            '        x (int): X.\n\n'
+                            '    ')
+    assert test.f.__doc__ == ('Test function.\n\n'
+                              '        Returns:\n'
+                              '            y (str): Y.\n\n'
+                              '        ')
+    assert test.g.__doc__ == test.f.__doc__
+    assert test.h.__doc__.startswith('Not parsed')
+    assert test.i.__doc__ == 'Not rendered because the summary is too long for the given width.'
+    # same docstrings are parsed only once
+    assert wrapper._parse_doc.cache_info().hits == 1
+    assert not hasattr(test, '_docinstance')
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_docstring_recursive_parse_untouched(jobs, capsys):
+    """Test docinstance.wrapper.docstring_recursive with docstrings that are not rendered again."""
+    class Test:  # pragma: no cover
+        """Test class.
+
+        Args:
+            x (int): X.
+                More on x.
+
+        """
+
+        def f(self):
+            """Test function.
+
+            Examples
+            --------
+            >>> f(1)
+            2
+
+            """
+
+        def g(self):
+            """Test function.
+
+            Returns
+            -------
+            y : str
+                Description that is wrapped
+                differently from the renderer.
+
+            """
+
+    docs = [Test.__doc__, Test.f.__doc__, Test.g.__doc__]
+    test = docstring_recursive(Test, jobs=jobs, parse=True, style='google')
+    assert [test.__doc__, test.f.__doc__, test.g.__doc__] == docs
+    assert capsys.readouterr().out == ''
+
+    def func():  # pragma: no cover
+        """Test function.
+
+        Args:
+            x (int): X.
+
+        """
+
+    doc = func.__doc__
+    assert docstring(func, parse=True).__doc__ == doc
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_docstring_recursive_verify(jobs):
+    """Test docinstance.wrapper.docstring_recursive with verification."""
+    def make_class():
+        """Return a class with docinstances."""
+        class Test:  # pragma: no cover
+            """Test class.
+
+            Attributes
+            ----------
+            x : int
+                X.
+
+            """
+            _docinstance = Docstring(['Test class.',
+                                      DocSection('attributes',
+                                                 DocDescription('x', types=int, descs='X.'))])
+
+            def f(self):
+                """Old function."""
+            f._docinstance = Docstring(['Test function.'])
+
+            def g(self):
+                """Not verified."""
+            g._docinstance = Docstring(['Other function.'])
+
+        return Test
+
+    verifier = Verifier()
+    test = docstring_recursive(make_class(), jobs=jobs, lazy=True, verify=verifier)
+    assert isinstance(test.__dict__['__doc__'], str)
+    assert verifier.records[0].name.endswith('.test_docstring_recursive_verify.<locals>.'
+                                             'make_class.<locals>.Test')
+    assert verifier.records[1].name == verifier.records[0].name + '.f'
+    assert [record.name.rsplit('.', 1)[-1] for record in verifier.records] == ['Test', 'f', 'g']
+    assert [record.matched for record in verifier.records] == [True, False, False]
+    assert verifier.mismatches[0].diff[-2:] == ('-Old function.', '+Test function.')
+
+    # sampling
+    verifier = Verifier(2)
+    docstring_recursive(make_class(), jobs=jobs, verify=verifier)
+    assert [record.name.rsplit('.', 1)[-1] for record in verifier.records] == ['Test', 'g']
+
+
+def test_docstring_lazy(monkeypatch):
+    """Test docinstance.wrapper.docstring_recursive with lazy rendering."""
+    calls = []
+    make_docstring = Docstring.make_docstring
+
+    def counted_make_docstring(self, *args, **kwargs):
+        """Record the rendering."""
+        calls.append(self)
+        return make_docstring(self, *args, **kwargs)
+
+    monkeypatch.setattr(Docstring, 'make_docstring', counted_make_docstring)
+
+    class Test:  # pragma: no cover
+        """Test class."""
+        _docinstance = Docstring(['Test class.', DocSection('attributes',
+                                                            DocDescription('x', types=int))])
+
+        def f(self):
+            """Test function."""
+        f._docinstance = Docstring('Test function.')
+
+    module = types.ModuleType('dummy', 'To be replaced.')
+    module._docinstance = Docstring(['Test module.', 'Extended.'])
+    module.Test = Test
+
+    docstring_recursive(Test, lazy=True)
+    # functions are rendered immediately
+    assert calls == [Test.f._docinstance]
+    assert isinstance(Test.__dict__['__doc__'], LazyDoc)
+    assert Test.__doc__ == ('Test class.\n\n'
+                            'Attributes\n'
+                            '----------\n'
+                            'x : int\n\n')
+    assert Test().__doc__ == Test.__doc__
+    assert calls == [Test.f._docinstance, Test._docinstance]
+
+    docstring(module, lazy=True)
+    assert isinstance(module, LazyDocModule)
+    assert LazyDocModule.__doc__ == ('Module whose docstring is rendered when it is accessed for '
+                                     'the first time.')
+    assert len(calls) == 2
+    assert module.__doc__ == 'Test module.\n\nExtended.\n\n'
+    assert module.__doc__ == 'Test module.\n\nExtended.\n\n'
+    assert len(calls) == 3
+    module.__doc__ = 'New.'
+    assert module.__doc__ == 'New.'
+
+    # with multiple jobs
+    class Test2:  # pragma: no cover
+        """Test class."""
+        _docinstance = Docstring('Test class 2.')
+
+        def f(self):
+            """Test function."""
+        f._docinstance = Docstring('Test function 2.')
+
+    docstring_recursive(Test2, lazy=True, jobs=2)
+    assert Test2.f.__doc__ == 'Test function 2.' + ' ' * 4
+    assert isinstance(Test2.__dict__['__doc__'], LazyDoc)
+    assert Test2.__doc__ == 'Test class 2.'
+
+
 def test_docstring_current_module():
     """Test docinstance.wrapper.docstring_current_module on the current module."""
     global test_docstring_current_module
@@ -366,13 +690,17 @@ class DummyClass:
             '    x : str\n'
             '        Example.\n\n'
             '    ')
-    assert (importlib._bootstrap_external.SourceFileLoader.exec_module.special_cases ==
-            set([os.path.dirname(dummy1.__file__)]))
+    assert isinstance(test.__spec__.loader, DocstringLoader)
+    finder = wrapper._docstring_finder
+    assert sys.meta_path[0] is finder
+    assert os.path.normcase(os.path.dirname(dummy1.__file__)) in finder.directories
 
     # check that multiple function calls does not change anything
+    directories = finder.directories
     import dummy3
-    assert (importlib._bootstrap_external.SourceFileLoader.exec_module.special_cases ==
-            set([os.path.dirname(dummy3.__file__)]))
+    assert sys.meta_path.count(finder) == 1
+    assert finder.directories == directories
+    assert dummy3.__spec__.loader is not None
 
     # import package outside current directory
     import docinstance.utils
@@ -381,3 +709,99 @@ class DummyClass:
     # check that the objects within docinstance.utils has not been touched by wrapper.
     with pytest.raises(AttributeError):
         docinstance.utils._docinstance
+    assert not isinstance(docinstance.utils.__spec__.loader, DocstringLoader)
+
+
+def test_docstring_finder(tmp_path):
+    """Test docinstance.wrapper.DocstringFinder."""
+    finder = DocstringFinder()
+    outer = tmp_path / "outer"
+    inner = outer / "inner"
+    inner.mkdir(parents=True)
+    (inner / "dummy_finder.py").write_text('"""Dummy."""\n')
+    assert finder.lookup(str(inner)) is None
+    assert finder.find_spec('dummy_finder', [str(inner)]) is None
+
+    finder.register(str(outer), {'width': 100, 'tabsize': 4, 'lazy': False})
+    assert finder.lookup(str(outer)) == {'width': 100, 'tabsize': 4, 'lazy': False}
+    assert finder.lookup(str(inner)) == {'width': 100, 'tabsize': 4, 'lazy': False}
+    assert finder.lookup(str(tmp_path)) is None
+    # innermost directory takes precedence
+    finder.register(str(inner), {'width': 80, 'tabsize': 2, 'lazy': True})
+    assert finder.lookup(str(inner)) == {'width': 80, 'tabsize': 2, 'lazy': True}
+    assert finder.lookup(str(outer)) == {'width': 100, 'tabsize': 4, 'lazy': False}
+    assert finder.directories == {os.path.normcase(str(outer)), os.path.normcase(str(inner))}
+
+    spec = finder.find_spec('dummy_finder', [str(inner)])
+    assert isinstance(spec.loader, DocstringLoader)
+    assert spec.loader.settings == {'width': 80, 'tabsize': 2, 'lazy': True}
+    assert finder.find_spec('nonexistent_module', [str(inner)]) is None
+    finder.invalidate_caches()
+    assert finder.lookup(str(inner)) == {'width': 80, 'tabsize': 2, 'lazy': True}
+
+
+def test_wrap_module_cache(tmp_path, monkeypatch):
+    """Test docinstance.wrapper.wrap_module with the on-disk cache."""
+    path = tmp_path / "dummy_cache.py"
+    path.write_text(
+        '''"""This will be replaced."""
+from docinstance.docstring import Docstring
+from docinstance.content.section import DocSection
+from docinstance.content.description import DocDescription
+
+_docinstance = Docstring(['Dummy module.'])
+
+
+class DummyClass:
+    """This too will be replaced."""
+
+    _docinstance = Docstring([
+        'Class for testing.',
+        DocSection('attributes', DocDescription('x', types=str, descs='Example.'))
+    ])
+
+    @property
+    def x(self):
+        """This too will be replaced."""
+        return 1
+''')
+
+    def load_module():
+        """Execute the dummy module in a new module object."""
+        spec = importlib.util.spec_from_file_location('dummy_cache', str(path))
+        module = importlib.util.module_from_spec(spec)
+        monkeypatch.setitem(sys.modules, 'dummy_cache', module)
+        spec.loader.exec_module(module)
+        return module
+
+    expected_class_doc = ('Class for testing.\n\n'
+                          '    Attributes\n'
+                          '    ----------\n'
+                          '    x : str\n'
+                          '        Example.\n\n'
+                          '    ')
+    # without cache
+    module = wrap_module(load_module())
+    assert module.__doc__ == 'Dummy module.'
+    assert module.DummyClass.__doc__ == expected_class_doc
+    assert not os.path.exists(disk_cache.cache_path(str(path)))
+
+    # first import renders and stores
+    module = wrap_module(load_module(), cache=True)
+    assert module.__doc__ == 'Dummy module.'
+    assert module.DummyClass.__doc__ == expected_class_doc
+    assert (disk_cache.load(str(path), {'width': 100, 'tabsize': 4}) ==
+            {'': 'Dummy module.', 'DummyClass': expected_class_doc})
+
+    # second import only loads
+    def fail(*args, **kwargs):
+        """Fail if anything is rendered."""
+        raise AssertionError('Docstring was rendered.')
+
+    monkeypatch.setattr(Docstring, 'make_docstring', fail)
+    module = wrap_module(load_module(), cache=True, lazy=True)
+    assert module.__doc__ == 'Dummy module.'
+    assert module.DummyClass.__doc__ == expected_class_doc
+    # different parameters are rendered again
+    with pytest.raises(AssertionError):
+        wrap_module(load_module(), width=80, cache=True)
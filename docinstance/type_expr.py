@@ -0,0 +1,261 @@
+"""Structured representation of the types given as strings in the docstring.
+
+Types of a described object are often given as strings, e.g. `{int, 100}`, `list/tuple of str`,
+and `dict of str to object`. These strings are parsed into the following (immutable) expressions:
+
+- TypeName: a single type or value, e.g. `int`, `100`, or `array like`
+- TypeChoice: one of the given types, e.g. `{int, 100}` or `list/tuple`
+- TypeContainer: containers of the given type, e.g. `list/tuple of str`
+- TypeMapping: mappings from one type to another, e.g. `dict of str to object`
+
+Since the same type strings are used repeatedly, each distinct string is parsed only once.
+
+"""
+from collections import namedtuple
+from functools import lru_cache
+import re
+
+# tokens of the type strings: braces, commas, slashes, and words
+_re_token = re.compile(r'\s*([{},/]|[^\s{},/]+)')
+_keywords = ('of', 'to')
+
+
+class TypeName(namedtuple('TypeName', ['name'])):
+    """Single type (or value) within a type expression.
+
+    Attributes
+    ----------
+    name : str
+        Name of the type (or the value).
+
+    """
+
+    __slots__ = ()
+
+    def __str__(self):
+        """Return the type expression as a string."""
+        return self.name
+
+
+class TypeChoice(namedtuple('TypeChoice', ['options'])):
+    """Choice between multiple types within a type expression.
+
+    Attributes
+    ----------
+    options : tuple of {TypeName, TypeChoice, TypeContainer, TypeMapping}
+        Allowed types.
+
+    """
+
+    __slots__ = ()
+
+    def __str__(self):
+        """Return the type expression as a string."""
+        return '{{{0}}}'.format(', '.join(str(i) for i in self.options))
+
+
+class TypeContainer(namedtuple('TypeContainer', ['containers', 'items'])):
+    """Containers of a type within a type expression.
+
+    Attributes
+    ----------
+    containers : tuple of str
+        Allowed types of the container.
+    items : {TypeName, TypeChoice, TypeContainer, TypeMapping}
+        Type of the items within the container.
+
+    """
+
+    __slots__ = ()
+
+    def __str__(self):
+        """Return the type expression as a string."""
+        return '{0} of {1}'.format('/'.join(self.containers), self.items)
+
+
+class TypeMapping(namedtuple('TypeMapping', ['containers', 'keys', 'values'])):
+    """Mapping from a type to another within a type expression.
+
+    Attributes
+    ----------
+    containers : tuple of str
+        Allowed types of the mapping.
+    keys : {TypeName, TypeChoice, TypeContainer, TypeMapping}
+        Type of the keys.
+    values : {TypeName, TypeChoice, TypeContainer, TypeMapping}
+        Type of the values.
+
+    """
+
+    __slots__ = ()
+
+    def __str__(self):
+        """Return the type expression as a string."""
+        return '{0} of {1} to {2}'.format('/'.join(self.containers), self.keys, self.values)
+
+
+def _tokenize(text):
+    """Return the tokens of the type string.
+
+    Parameters
+    ----------
+    text : str
+        Type string.
+
+    Returns
+    -------
+    tokens : list of str
+        Braces, commas, slashes, and words of the type string.
+
+    """
+    return _re_token.findall(text)
+
+
+def _parse_name(tokens, index, text):
+    """Parse the name that starts at the given token.
+
+    Consecutive words that are not keywords are joined by a space to form a single name, e.g.
+    `array like`.
+
+    Parameters
+    ----------
+    tokens : list of str
+        Tokens of the type string.
+    index : int
+        Index of the first token of the name.
+    text : str
+        Type string.
+
+    Returns
+    -------
+    name : str
+        Name of the type.
+    index : int
+        Index of the token after the name.
+
+    Raises
+    ------
+    ValueError
+        If the token is not a word.
+
+    """
+    words = []
+    while index < len(tokens) and tokens[index] not in '{},/' and tokens[index] not in _keywords:
+        words.append(tokens[index])
+        index += 1
+    if not words:
+        raise ValueError('Expected the name of a type in {0!r}.'.format(text))
+    return ' '.join(words), index
+
+
+def _parse_expr(tokens, index, text):
+    """Parse the type expression that starts at the given token.
+
+    Parameters
+    ----------
+    tokens : list of str
+        Tokens of the type string.
+    index : int
+        Index of the first token of the expression.
+    text : str
+        Type string.
+
+    Returns
+    -------
+    expr : {TypeName, TypeChoice, TypeContainer, TypeMapping}
+        Type expression.
+    index : int
+        Index of the token after the expression.
+
+    Raises
+    ------
+    ValueError
+        If the tokens do not form a type expression.
+
+    Notes
+    -----
+    The keyword `to` is bound to the innermost `of`, e.g. `dict of list of str to int` is parsed
+    as a dictionary of mappings.
+
+    """
+    if index < len(tokens) and tokens[index] == '{':
+        options = []
+        index += 1
+        while True:
+            option, index = _parse_expr(tokens, index, text)
+            options.append(option)
+            if index >= len(tokens):
+                raise ValueError('Unbalanced braces in {0!r}.'.format(text))
+            if tokens[index] == '}':
+                return TypeChoice(tuple(options)), index + 1
+            if tokens[index] != ',':
+                raise ValueError('Expected a comma or a closing brace in {0!r}.'.format(text))
+            index += 1
+
+    name, index = _parse_name(tokens, index, text)
+    names = [name]
+    while index < len(tokens) and tokens[index] == '/':
+        name, index = _parse_name(tokens, index + 1, text)
+        names.append(name)
+
+    if index < len(tokens) and tokens[index] == 'of':
+        items, index = _parse_expr(tokens, index + 1, text)
+        if index < len(tokens) and tokens[index] == 'to':
+            values, index = _parse_expr(tokens, index + 1, text)
+            return TypeMapping(tuple(names), items, values), index
+        return TypeContainer(tuple(names), items), index
+    if len(names) > 1:
+        return TypeChoice(tuple(TypeName(i) for i in names)), index
+    return TypeName(names[0]), index
+
+
+@lru_cache(maxsize=8192)
+def parse_type(text):
+    """Parse the type string into a type expression.
+
+    Parameters
+    ----------
+    text : str
+        Type string, e.g. `{int, 100}`, `list/tuple of str`, or `dict of str to object`.
+
+    Returns
+    -------
+    expr : {TypeName, TypeChoice, TypeContainer, TypeMapping}
+        Type expression.
+        Expressions are immutable and are shared between the calls with the same string.
+
+    Raises
+    ------
+    TypeError
+        If the type is not given as a string.
+    ValueError
+        If the string is not a valid type expression.
+
+    """
+    if not isinstance(text, str):
+        raise TypeError('Type must be given as a string.')
+    tokens = _tokenize(text)
+    expr, index = _parse_expr(tokens, 0, text)
+    if index != len(tokens):
+        raise ValueError('Unexpected {0!r} in {1!r}.'.format(tokens[index], text))
+    return expr
+
+
+def is_valid_type(text):
+    """Check if the type string is a valid type expression.
+
+    Parameters
+    ----------
+    text : str
+        Type string.
+
+    Returns
+    -------
+    bool
+
+    """
+    try:
+        parse_type(text)
+    except (TypeError, ValueError):
+        return False
+    return True
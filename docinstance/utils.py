@@ -1,8 +1,16 @@
 """Utility functions for handling strings and attributes of an object."""
+from functools import lru_cache
+import re
+import sys
 import textwrap
 import inspect
 import os
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
 
 def wrap(text, width=100, indent_level=0, tabsize=4, **kwargs):
     """Wrap a text with the given line length and indentations.
@@ -107,6 +115,234 @@ def wrap_indent_subsequent(text, width=100, indent_level=0, tabsize=4):
     return output
 
 
+# paragraphs that consist only of words separated by single spaces are wrapped by textwrap without
+# any special treatment (no hyphenation, no whitespace handling), so they can be wrapped in bulk
+_re_simple_paragraph = re.compile(r'^[^\s-]+(?: [^\s-]+)*\Z')
+
+
+def wrap_many(texts, width=100, indent_level=0, tabsize=4, batch_size=65536):
+    """Wrap many texts with the given line length and indentations.
+
+    If NumPy is installed, the line breaks of the paragraphs that consist only of words separated by
+    single spaces are computed for all of the paragraphs at once. Otherwise (and for all other
+    paragraphs), each text is wrapped with `wrap`.
+
+    Parameters
+    ----------
+    texts : list of str
+        Texts that will be wrapped.
+    width : int
+        Maximum number of characters allowed in each line.
+    indent_level : int
+        Number of indents (tabs) that are needed for the docstring.
+    tabsize : int
+        Number of spaces that corresponds to a tab.
+    batch_size : int
+        Number of texts that are wrapped at once when NumPy is used.
+        Used to limit the memory used by the arrays.
+
+    Returns
+    -------
+    output : list of list of str
+        Wrapped lines of each text.
+        Lines are identical to the output of `wrap` for the same text.
+
+    Raises
+    ------
+    ValueError
+        If the the amount indented is greater than the maximum width.
+        If is a word plus its indentation is longer than the width.
+
+    """
+    if np is None:
+        return [wrap(text, width=width, indent_level=indent_level, tabsize=tabsize)
+                for text in texts]
+    if width <= tabsize * indent_level:
+        raise ValueError('Amount of indentation must be less than the maximum width.')
+
+    output = [None] * len(texts)
+    simple_indices = []
+    for i, text in enumerate(texts):
+        if _re_simple_paragraph.match(text):
+            simple_indices.append(i)
+        else:
+            output[i] = wrap(text, width=width, indent_level=indent_level, tabsize=tabsize)
+
+    for start in range(0, len(simple_indices), batch_size):
+        indices = simple_indices[start:start + batch_size]
+        lines = _wrap_simple_numpy([texts[i] for i in indices], width - tabsize * indent_level)
+        for i, paragraph in zip(indices, lines):
+            output[i] = [' ' * tabsize * indent_level + line for line in paragraph]
+    return output
+
+
+def _wrap_simple_numpy(texts, width):
+    """Wrap paragraphs that consist only of words separated by single spaces using NumPy.
+
+    Parameters
+    ----------
+    texts : list of str
+        Nonempty paragraphs without newlines, hyphens, or repeated, leading, or trailing whitespace.
+    width : int
+        Maximum number of characters allowed in each line (excluding the indentation).
+
+    Returns
+    -------
+    output : list of list of str
+        Wrapped lines of each text.
+
+    Raises
+    ------
+    ValueError
+        If a word is longer than the width.
+
+    """
+    # concatenate all of the paragraphs so that the words can be found at once
+    joined = '\n'.join(texts)
+    chars = np.frombuffer(joined.encode('utf-32-le'), dtype=np.uint32)
+    boundaries = np.flatnonzero((chars == ord(' ')) | (chars == ord('\n')))
+    # position of the first character and the position after the last character of each word
+    starts = np.concatenate(([0], boundaries + 1))
+    ends = np.concatenate((boundaries, [chars.size]))
+    if np.any(ends - starts > width):
+        raise ValueError('There cannot be any word (after indentation) that exceeds the maximum '
+                         'width')
+    # index of the last word of each paragraph
+    last_words = np.concatenate((np.flatnonzero(chars[boundaries] == ord('\n')),
+                                 [starts.size - 1]))
+    first_words = np.concatenate(([0], last_words[:-1] + 1))
+
+    # greedily find the last word of each line for all paragraphs at the same time
+    paragraphs = np.arange(len(texts))
+    line_starts = first_words
+    breaks = [[] for _ in texts]
+    while paragraphs.size:
+        line_ends = np.searchsorted(ends, starts[line_starts] + width, side='right') - 1
+        line_ends = np.minimum(line_ends, last_words[paragraphs])
+        for paragraph, i, j in zip(paragraphs.tolist(), starts[line_starts].tolist(),
+                                   ends[line_ends].tolist()):
+            breaks[paragraph].append((i, j))
+        not_done = line_ends < last_words[paragraphs]
+        paragraphs = paragraphs[not_done]
+        line_starts = line_ends[not_done] + 1
+
+    return [[joined[i:j] for i, j in paragraph] for paragraph in breaks]
+
+
+def _source_file(obj):
+    """Return the name of the file in which the object is defined.
+
+    Parameters
+    ----------
+    obj : object
+        Any python object.
+
+    Returns
+    -------
+    filename : {str, None}
+        Name of the source file of the object.
+        None if the source file cannot be found.
+
+    Raises
+    ------
+    TypeError
+        If the object is not a module, class, method, function, traceback, frame, or code object.
+
+    Notes
+    -----
+    The file is found from the attributes of the object (`__file__` of the module, `__module__` of
+    the class, or `__code__` of the function) without accessing the file system. If the file is not
+    a python source file (e.g. it is compiled or it is not a real file), then
+    `inspect.getsourcefile` is used.
+
+    """
+    if inspect.ismodule(obj):
+        filename = getattr(obj, '__file__', None)
+    elif inspect.isclass(obj):
+        filename = getattr(sys.modules.get(obj.__module__), '__file__', None)
+    elif inspect.ismethod(obj) and inspect.isfunction(obj.__func__):
+        filename = obj.__func__.__code__.co_filename
+    elif inspect.isfunction(obj):
+        filename = obj.__code__.co_filename
+    else:
+        filename = None
+    if isinstance(filename, str) and filename.endswith('.py') and os.path.isabs(filename):
+        return filename
+    return inspect.getsourcefile(obj)
+
+
+@lru_cache(maxsize=1024)
+def _file_identity(filename):
+    """Return the device and the inode of the file.
+
+    Parameters
+    ----------
+    filename : str
+        Absolute path of the file.
+
+    Returns
+    -------
+    identity : 2-tuple of int
+        Device and inode of the file.
+
+    """
+    stat = os.stat(filename)
+    return (stat.st_dev, stat.st_ino)
+
+
+def _same_file(filename1, filename2):
+    """Check if the two files are the same.
+
+    Parameters
+    ----------
+    filename1 : str
+        Name of the first file.
+    filename2 : str
+        Name of the second file.
+
+    Returns
+    -------
+    bool
+
+    Raises
+    ------
+    TypeError
+        If either file name is not a string.
+
+    Notes
+    -----
+    Files with the same name are the same without accessing the file system. Otherwise, the files
+    are compared by their devices and inodes (like `os.path.samefile`), which are cached for the
+    absolute paths.
+
+    """
+    if not (isinstance(filename1, str) and isinstance(filename2, str)):
+        raise TypeError('File names must be given as strings.')
+    if filename1 == filename2:
+        return True
+    if os.path.isabs(filename1) and os.path.isabs(filename2):
+        return _file_identity(filename1) == _file_identity(filename2)
+    return os.path.samefile(filename1, filename2)
+
+
+def _check_jobs(jobs):
+    """Check that the number of jobs is a positive integer.
+
+    Parameters
+    ----------
+    jobs : int
+        Number of processes (or threads) in which the work is done.
+
+    Raises
+    ------
+    ValueError
+        If `jobs` is not a positive integer.
+
+    """
+    if not (isinstance(jobs, int) and jobs > 0):
+        raise ValueError('Number of jobs must be a positive integer.')
+
+
 def extract_members(module):
     """Extract all members of a module that are defined in the same file.
 
@@ -122,14 +358,14 @@ def extract_members(module):
 
     """
     # get file location
-    filename = inspect.getsourcefile(module)
+    filename = _source_file(module)
     # find objects that are defined in the provided module
     output = {}
     for name, member in module.__dict__.items():
         try:
-            # NOTE: inspect.getsourcefile only works on a module, class, method, function,
-            # traceback, frame, or code objects. Not properties.
-            if os.path.samefile(inspect.getsourcefile(member), filename):
+            # NOTE: source file can be found only for a module, class, method, function, traceback,
+            # frame, or code objects. Not properties.
+            if _same_file(_source_file(member), filename):
                 output[name] = member
         except TypeError:
             if isinstance(member, property):
@@ -0,0 +1,151 @@
+"""Verification of the generated docstrings against the original docstrings.
+
+When the docstrings are wrapped, the docstring generated from the Docstring instance can be compared
+with the docstring written in the source code, e.g. to check that the two have not diverged. The
+docstrings are normalized (indentation and trailing whitespace are removed) and compared directly,
+and the differences are computed with `difflib` only if the normalized docstrings do not match.
+
+"""
+from collections import namedtuple
+import difflib
+import inspect
+import threading
+
+
+class VerifyRecord(namedtuple('VerifyRecord', ['name', 'matched', 'diff'])):
+    """Result of comparing the generated docstring with the original docstring.
+
+    Attributes
+    ----------
+    name : str
+        Name of the object whose docstring was compared.
+    matched : bool
+        True if the normalized docstrings are the same.
+    diff : tuple of str
+        Lines of the unified diff from the original docstring to the generated docstring.
+        Empty if the docstrings match.
+
+    """
+
+    __slots__ = ()
+
+
+def normalize(doc):
+    """Return the docstring without its indentation and trailing whitespace.
+
+    Parameters
+    ----------
+    doc : str
+        Docstring.
+
+    Returns
+    -------
+    normalized_doc : str
+
+    """
+    return '\n'.join(line.rstrip() for line in inspect.cleandoc(doc).split('\n')).strip()
+
+
+class Verifier:
+    """Collector of the comparisons between the generated and the original docstrings.
+
+    Attributes
+    ----------
+    sample : int
+        One out of every `sample` objects is verified.
+    records : list of VerifyRecord
+        Results of the comparisons, in the order in which they were made.
+    mismatches : list of VerifyRecord
+        Results of the comparisons in which the docstrings do not match.
+
+    Methods
+    -------
+    __init__(self, sample=1)
+        Initialize.
+    sample_next(self)
+        Return True if the next object should be verified.
+    verify(self, name, original, generated)
+        Compare the generated docstring with the original docstring.
+
+    """
+
+    def __init__(self, sample=1):
+        """Initialize.
+
+        Parameters
+        ----------
+        sample : {int, 1}
+            One out of every `sample` objects is verified, starting with the first object.
+            Default is 1 (every object is verified).
+
+        Raises
+        ------
+        TypeError
+            If sample is not an integer.
+        ValueError
+            If sample is not positive.
+
+        """
+        if not isinstance(sample, int):
+            raise TypeError('Sampling interval must be given as an integer.')
+        if sample <= 0:
+            raise ValueError('Sampling interval must be greater than zero.')
+        self.sample = sample
+        self.records = []
+        self._count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def mismatches(self):
+        """Return the records of the docstrings that do not match.
+
+        Returns
+        -------
+        mismatches : list of VerifyRecord
+
+        """
+        return [record for record in self.records if not record.matched]
+
+    def sample_next(self):
+        """Return True if the next object should be verified.
+
+        Returns
+        -------
+        bool
+
+        """
+        with self._lock:
+            count = self._count
+            self._count += 1
+        return count % self.sample == 0
+
+    def verify(self, name, original, generated):
+        """Compare the generated docstring with the original docstring.
+
+        Parameters
+        ----------
+        name : str
+            Name of the object.
+        original : str
+            Docstring written in the source code.
+        generated : str
+            Docstring generated from the Docstring instance.
+
+        Returns
+        -------
+        record : VerifyRecord
+            Result of the comparison, which is also stored in `records`.
+
+        """
+        original = normalize(original)
+        generated = normalize(generated)
+        if original == generated:
+            record = VerifyRecord(name, True, ())
+        else:
+            diff = difflib.unified_diff(original.split('\n'), generated.split('\n'),
+                                        fromfile='original-docstring',
+                                        tofile='generated-docstring', lineterm='')
+            record = VerifyRecord(name, False, tuple(diff))
+        with self._lock:
+            self.records.append(record)
+        return record
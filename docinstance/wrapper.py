@@ -1,9 +1,20 @@
 """Functions for wrapping a python object to utilize the docinstance object."""
 import inspect
 import os
-from functools import wraps
-import importlib
-from docinstance.utils import extract_members
+import sys
+from functools import wraps, lru_cache
+import importlib.abc
+import importlib.machinery
+from types import ModuleType
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from docinstance.utils import extract_members, _check_jobs
+from docinstance import disk_cache
+from docinstance.frozen import freeze
+from docinstance.content.description import DocDescription
+from docinstance.parser.detect import detect_style
+from docinstance.parser.numpy import _try_parse_numpy
+from docinstance.verify import normalize
 
 
 def kwarg_wrapper(wrapper):
@@ -39,11 +50,291 @@ def kwarg_wrapper(wrapper):
     return new_wrapper
 
 
+class LazyDoc:
+    """Descriptor that renders the docstring when it is accessed for the first time.
+
+    The docstring of a class is looked up in the `__dict__` of the class and the `__get__` of the
+    stored object is called if it exists. So, this descriptor can be stored as the `__doc__` of a
+    class. Modules need to be instances of `LazyDocModule` to do the same.
+
+    Attributes
+    ----------
+    docinst : Docstring
+        Docstring instance that is rendered.
+    width : int
+        Maximum number of characters allowed in each line.
+    indent_level : int
+        Number of indents (tabs) that the docstring uses.
+    tabsize : int
+        Number of spaces that corresponds to one tab.
+    style : {str, None}
+        Style of the docstring.
+        If None, then the default style of the Docstring instance is used.
+
+    Methods
+    -------
+    __init__(self, docinst, width, indent_level, tabsize, style=None)
+        Initialize.
+    __get__(self, instance, owner=None)
+        Return the (cached) docstring.
+
+    """
+
+    __slots__ = ('docinst', 'width', 'indent_level', 'tabsize', 'style', '_doc')
+
+    def __init__(self, docinst, width, indent_level, tabsize, style=None):
+        """Initialize.
+
+        Parameters
+        ----------
+        docinst : Docstring
+            Docstring instance that is rendered.
+        width : int
+            Maximum number of characters allowed in each line.
+        indent_level : int
+            Number of indents (tabs) that the docstring uses.
+        tabsize : int
+            Number of spaces that corresponds to one tab.
+        style : {str, None}
+            Style of the docstring.
+            If None, then the default style of the Docstring instance is used.
+
+        """
+        self.docinst = docinst
+        self.width = width
+        self.indent_level = indent_level
+        self.tabsize = tabsize
+        self.style = style
+        self._doc = None
+
+    def __get__(self, instance, owner=None):
+        """Return the (cached) docstring.
+
+        Parameters
+        ----------
+        instance : object
+            Instance through which the docstring is accessed.
+        owner : class
+            Class through which the docstring is accessed.
+
+        Returns
+        -------
+        doc : str
+            Docstring in the given style.
+
+        """
+        if self._doc is None:
+            self._doc = _render(self.docinst, self.width, self.indent_level, self.tabsize,
+                                style=self.style)
+        return self._doc
+
+
+def _get_module_doc(module):
+    """Return the docstring of the module, rendering it if necessary.
+
+    Parameters
+    ----------
+    module : LazyDocModule
+
+    Returns
+    -------
+    doc : {str, None}
+
+    """
+    doc = module.__dict__.get('__doc__')
+    if isinstance(doc, LazyDoc):
+        doc = doc.__get__(module, type(module))
+        module.__dict__['__doc__'] = doc
+    return doc
+
+
+def _set_module_doc(module, doc):
+    """Set the docstring of the module.
+
+    Parameters
+    ----------
+    module : LazyDocModule
+    doc : {str, LazyDoc, None}
+
+    """
+    module.__dict__['__doc__'] = doc
+
+
+class _ModuleDoc:
+    """Descriptor of the module docstring that gives the class docstring when accessed by the class.
+
+    Attributes
+    ----------
+    class_doc : str
+        Docstring of the class.
+
+    Methods
+    -------
+    __init__(self, class_doc)
+        Initialize.
+    __get__(self, instance, owner=None)
+        Return the docstring of the module, or the docstring of the class.
+    __set__(self, instance, doc)
+        Set the docstring of the module.
+
+    Notes
+    -----
+    The docstring of a class is looked up in the `__doc__` of the class, so a property would
+    replace the docstring of the class with the property itself.
+
+    """
+
+    def __init__(self, class_doc):
+        """Initialize.
+
+        Parameters
+        ----------
+        class_doc : str
+            Docstring of the class.
+
+        """
+        self.class_doc = class_doc
+
+    def __get__(self, instance, owner=None):
+        """Return the docstring of the module, or the docstring of the class.
+
+        Parameters
+        ----------
+        instance : {LazyDocModule, None}
+            Module through which the docstring is accessed.
+            None if the docstring is accessed through the class.
+        owner : class
+            Class through which the docstring is accessed.
+
+        Returns
+        -------
+        doc : {str, None}
+
+        """
+        if instance is None:
+            return self.class_doc
+        return _get_module_doc(instance)
+
+    def __set__(self, instance, doc):
+        """Set the docstring of the module.
+
+        Parameters
+        ----------
+        instance : LazyDocModule
+        doc : {str, LazyDoc, None}
+
+        """
+        _set_module_doc(instance, doc)
+
+
+class LazyDocModule(ModuleType):
+    """Module whose docstring is rendered when it is accessed for the first time."""
+
+
+# NOTE: module stores its docstring in its __dict__, which takes precedence over the class
+# attributes unless they are data descriptors. The descriptor is attached after the class is defined
+# so that it does not replace the docstring of the class.
+LazyDocModule.__doc__ = _ModuleDoc(LazyDocModule.__doc__)
+
+
+def _can_be_lazy(obj):
+    """Check if the docstring of the object can be rendered lazily.
+
+    Parameters
+    ----------
+    obj : object
+
+    Returns
+    -------
+    bool
+
+    Notes
+    -----
+    The docstrings of functions and properties are stored in the objects themselves (not in a
+    dictionary) so they cannot be replaced by a descriptor.
+
+    """
+    # pylint: disable=C0123
+    return isinstance(obj, type) or type(obj) in [ModuleType, LazyDocModule]
+
+
+@lru_cache(maxsize=4096)
+def _parse_doc(doc):
+    """Return the Docstring instance of the cleaned docstring.
+
+    Parameters
+    ----------
+    doc : str
+        Docstring after removing its indentation (see `inspect.cleandoc`).
+
+    Returns
+    -------
+    docinst : {FrozenDocstring, None}
+        Docstring instance parsed from the numpy docstring.
+        Since the same instance is returned for the same docstring, it is frozen so that it cannot
+        be modified through one of the objects that share it.
+        None if the docstring is not in numpy style (e.g. google docstrings or docstrings without
+        any sections) or cannot be parsed.
+        None if a description has a signature (e.g. `>>> f(1)` in the examples), since the
+        signatures are not rendered in numpy style.
+
+    """
+    if detect_style(doc) != 'numpy':
+        return None
+    docinst = _try_parse_numpy(doc)
+    if docinst is None or any(isinstance(content, DocDescription) and content.signature
+                              for section in docinst.sections for content in section.contents):
+        return None
+    return freeze(docinst)
+
+
 # FIXME: change name
 # FIXME: doesn't work on standalone functions because we cannot assign attributes of a function
 # within the definition of a function
+
+
+def _get_docinstance(obj, parse=False):
+    """Return the Docstring instance of the object.
+
+    Parameters
+    ----------
+    obj : object
+        Object whose Docstring instance is returned.
+    parse : {bool, False}
+        True if the existing docstring is parsed when the object does not have `_docinstance`.
+        Default is False.
+
+    Returns
+    -------
+    docinst : {Docstring, None}
+        Docstring instance stored in `_docinstance` or, if `parse` is True, parsed from the
+        existing docstring.
+        None if the object does not have a Docstring instance.
+    is_parsed : bool
+        True if the Docstring instance was parsed from the existing docstring.
+
+    Notes
+    -----
+    Docstrings are parsed only once for each distinct content (after removing their indentation),
+    so the docstrings that are shared between multiple objects (e.g. inherited or copied
+    docstrings) are parsed only once.
+
+    """
+    try:
+        # pylint: disable=W0212
+        return obj._docinstance, False
+    except AttributeError:
+        pass
+    doc = getattr(obj, '__doc__', None)
+    if not parse or not isinstance(doc, str):
+        return None, False
+    docinst = _parse_doc(inspect.cleandoc(doc))
+    return docinst, docinst is not None
+
+
 @kwarg_wrapper
-def docstring(obj, width=100, indent_level=0, tabsize=4):
+def docstring(obj, width=100, indent_level=0, tabsize=4, lazy=False, parse=False, style=None,
+              verify=None):
     """Wrap given object such that _docinstance is used to overwrite __docstring__.
 
     Parameters
@@ -59,6 +350,27 @@ def docstring(obj, width=100, indent_level=0, tabsize=4):
     tabsize : {int, 4}
         Number of spaces that corresponds to one tab.
         Default is 4.
+    lazy : {bool, False}
+        True if the docstring is rendered when it is accessed for the first time.
+        Only the docstrings of classes and modules can be rendered lazily. Others are rendered
+        immediately.
+        Default is False.
+    parse : {bool, False}
+        True if the existing docstring (in numpy style) is parsed and rendered again when the object
+        does not have `_docinstance`.
+        Docstrings that are not in numpy style, or cannot be parsed or rendered, are left untouched.
+        Docstrings are also left untouched if rendering the parsed docstring in numpy style does not
+        give back the original docstring (except for its indentation and trailing whitespace),
+        since some of its contents would be lost. Parsed docstrings are always rendered
+        immediately.
+        Default is False.
+    style : {'numpy', 'google', 'rst', 'numpy with signature', None}
+        Style of the docstring.
+        Default is the `default_style` of the Docstring instance.
+    verify : {docinstance.verify.Verifier, None}
+        Verifier with which the generated docstring is compared to the original docstring.
+        Docstrings that are verified are always rendered immediately.
+        Default is None (no verification).
 
     Raises
     ------
@@ -66,32 +378,90 @@ def docstring(obj, width=100, indent_level=0, tabsize=4):
         If the obj's __doc__ is neither str nor Docstring instance.
 
     """
-    # TODO: if there is a parser, parse the docstring into docinstance
-    if not hasattr(obj, '_docinstance'):
+    docinst, is_parsed = _get_docinstance(obj, parse=parse)
+    if docinst is None:
+        return obj
+    original = getattr(obj, '__doc__', None)
+    if verify is not None and not (isinstance(original, str) and verify.sample_next()):
+        verify = None
+    if lazy and _can_be_lazy(obj) and not is_parsed and verify is None:
+        lazy_doc = LazyDoc(docinst, width, indent_level, tabsize, style=style)
+        if isinstance(obj, type):
+            obj.__doc__ = lazy_doc
+        else:
+            obj.__dict__['__doc__'] = lazy_doc
+            obj.__class__ = LazyDocModule
         return obj
     # generate new docstring from docinstance
-    # pylint: disable=W0212
-    docinst = obj._docinstance
-    new_doc = docinst.make_docstring(width=width, indent_level=indent_level, tabsize=tabsize)
-    # TODO: following can be used to check that the parsed docstring matches with the original
-    # # compare to original if original exists
-    # if obj.__doc__ is not None:
-    #     diff = list(difflib.context_diff(obj.__doc__.strip().split('\n'),
-    #                                      new_doc.strip().split('\n'),
-    #                                      fromfile='original-docstring',
-    #                                      tofile='generated-docstring'))
-    #     if len(diff) != 0:
-    #         print('WARNING: docstring generated from _docinstance is different from the
-    #               original.')
-    #         print('\n'.join(diff))
+    new_doc = _render(docinst, width, indent_level, tabsize, style=style,
+                      original=original if is_parsed else None)
+    if new_doc is None:
+        return obj
+    if verify is not None:
+        verify.verify(_object_name(obj), original, new_doc)
     # overwrite docstring
     obj.__doc__ = new_doc
 
     return obj
 
 
+def _render(docinst, width, indent_level, tabsize, style=None, original=None):
+    """Return the docstring of the Docstring instance.
+
+    Parameters
+    ----------
+    docinst : Docstring
+        Docstring instance that is rendered.
+    width : int
+        Maximum number of characters allowed in each line.
+    indent_level : int
+        Number of indents (tabs) that the docstring uses.
+    tabsize : int
+        Number of spaces that corresponds to one tab.
+    style : {str, None}
+        Style of the docstring.
+        If None, then the default style of the Docstring instance is used.
+    original : {str, None}
+        Docstring from which the Docstring instance was parsed.
+        If given, then the Docstring instance is first rendered in numpy style and compared to the
+        original docstring (see `docinstance.verify.normalize`), and None is returned (instead of
+        raising an error) if they do not match or the docstring cannot be rendered (e.g. the
+        summary is too long).
+        Default is None.
+
+    Returns
+    -------
+    doc : {str, None}
+        Docstring in the given style.
+        None if the docstring cannot be rendered or does not match the original docstring, and
+        `original` is given.
+
+    Notes
+    -----
+    Defined at the module level so that it can be used in a process pool.
+
+    """
+    try:
+        if original is None:
+            return docinst.make_docstring(width=width, indent_level=indent_level,
+                                          tabsize=tabsize, style=style)
+        doc = docinst.make_docstring(width=width, indent_level=indent_level, tabsize=tabsize,
+                                     style='numpy')
+        if normalize(doc) != normalize(original):
+            return None
+        if style in [None, 'numpy']:
+            return doc
+        return docinst.make_docstring(width=width, indent_level=indent_level, tabsize=tabsize,
+                                      style=style)
+    except ValueError:
+        if original is None:
+            raise
+        return None
+
+
 @kwarg_wrapper
-def docstring_recursive(obj, width=100, indent_level=0, tabsize=4):
+def docstring_recursive(obj, width=100, indent_level=0, tabsize=4, jobs=1, executor='thread',
+                        lazy=False, parse=False, style=None, verify=None):
     """Wrap given object and its attributes such that __docstring__ is overwritten.
 
     This wrapper recursively converts every member of the object (and their members) if their
@@ -107,6 +477,32 @@ def docstring_recursive(obj, width=100, indent_level=0, tabsize=4):
         Number of indents (tabs) that are needed for the docstring.
     tabsize : {int, 4}
         Number of spaces that corresponds to a tab.
+    jobs : {int, 1}
+        Number of workers that render the docstrings.
+        If 1, then the docstrings are rendered one after another in the current thread.
+        Default is 1.
+    executor : {'thread', 'process'}
+        Type of the pool in which the docstrings are rendered, if `jobs` is greater than 1.
+        Threads avoid copying the Docstring instances, but they can only scale on free-threaded
+        builds of Python. Processes need the Docstring instances to be pickled (e.g. classes used
+        as types must be importable).
+        Default is 'thread'.
+    lazy : {bool, False}
+        True if the docstrings of the classes and modules are rendered when they are accessed for
+        the first time.
+        Default is False.
+    parse : {bool, False}
+        True if the existing docstrings (in numpy style) of the objects without `_docinstance` are
+        parsed and rendered again.
+        See `docstring`.
+        Default is False.
+    style : {'numpy', 'google', 'rst', 'numpy with signature', None}
+        Style of the docstrings.
+        Default is the `default_style` of each Docstring instance.
+    verify : {docinstance.verify.Verifier, None}
+        Verifier with which the generated docstrings are compared to the original docstrings.
+        See `docstring`.
+        Default is None (no verification).
 
     Returns
     -------
@@ -114,25 +510,164 @@ def docstring_recursive(obj, width=100, indent_level=0, tabsize=4):
         Wrapped object where the docstring is in the selected format and the corresponding Docstring
         instance is stored in `_docstring`.
 
+    Raises
+    ------
+    ValueError
+        If `jobs` is not a positive integer.
+        If `executor` is not one of 'thread' and 'process'.
+
     Notes
     -----
+    Each object is wrapped only once, with the indentation that corresponds to the nesting of its
+    qualified name. See `collect_members_recursive`.
+
     A package and its contents can be wrapped using this decorator, but the contents of the package
     must be accessible through the __init__.py of the package. This would mean that the __init__.py
     would need to explicitly import the desired modules. In fact, all of the __init__.py (for each
     directory in the package) will need to import the modules that contains contents to be wrapped.
 
     """
-    # wrap self
-    obj = docstring(obj, width=width, indent_level=indent_level, tabsize=tabsize)
-    # wrap members
-    for member in extract_members(obj).values():
-        # recurse for all members of member
-        docstring_recursive(member, width=width, indent_level=indent_level+1, tabsize=tabsize)
+    _check_jobs(jobs)
+    if executor not in ['thread', 'process']:
+        raise ValueError("Executor must be one of 'thread' and 'process'.")
+
+    members = collect_members_recursive(obj, indent_level=indent_level)
+    if jobs == 1:
+        for member, member_indent_level in members:
+            docstring(member, width=width, indent_level=member_indent_level, tabsize=tabsize,
+                      lazy=lazy, parse=parse, style=style, verify=verify)
+        return obj
+
+    # parse (and assign the lazy docstrings) in the current thread
+    renders = []
+    for member, member_indent_level in members:
+        docinst, is_parsed = _get_docinstance(member, parse=parse)
+        if docinst is None:
+            continue
+        original = getattr(member, '__doc__', None)
+        is_verified = verify is not None and isinstance(original, str) and verify.sample_next()
+        if lazy and _can_be_lazy(member) and not is_parsed and not is_verified:
+            docstring(member, width=width, indent_level=member_indent_level, tabsize=tabsize,
+                      lazy=True, style=style)
+        else:
+            renders.append((member, docinst, member_indent_level, original if is_parsed else None,
+                            original if is_verified else None))
+    pool_class = ThreadPoolExecutor if executor == 'thread' else ProcessPoolExecutor
+    with pool_class(max_workers=jobs) as pool:
+        docs = pool.map(_render, [i[1] for i in renders], [width] * len(renders),
+                        [i[2] for i in renders], [tabsize] * len(renders),
+                        [style] * len(renders), [i[3] for i in renders],
+                        chunksize=max(1, len(renders) // (4 * jobs)))
+        # assign in the current thread
+        for (member, *_, verified), doc in zip(renders, docs):
+            if doc is None:
+                continue
+            if verified is not None:
+                verify.verify(_object_name(member), verified, doc)
+            member.__doc__ = doc
 
     return obj
 
 
-def docstring_current_module(width=100, tabsize=4):
+def collect_members_recursive(obj, indent_level=0):
+    """Return the object and its members (and their members) that are defined in the same file.
+
+    Members are traversed in breadth-first order and each object is visited only once, even if it
+    is referenced multiple times (e.g. aliases or classes that reference one another). Each object
+    is indented by the number of objects in which it is defined (i.e. the nesting of its qualified
+    name), regardless of where it is referenced, so that the indentation matches the source code.
+
+    Parameters
+    ----------
+    obj : function, module, class, property
+        Object whose members are collected.
+    indent_level : {int, 0}
+        Number of indents (tabs) that are needed for the docstring of the given object.
+
+    Returns
+    -------
+    members : list of 2-tuple
+        Each object and the number of indents needed for its docstring.
+        The first object is the given object, with the given number of indents. Other objects are
+        indented relative to the given object by the nesting of their qualified names. Objects
+        without qualified names are indented one level deeper than the object in which they are
+        found.
+
+    """
+    obj_depth = _nesting_depth(obj)
+    visited = {id(obj)}
+    members = []
+    queue = deque([(obj, indent_level)])
+    while queue:
+        member, member_indent_level = queue.popleft()
+        members.append((member, member_indent_level))
+        # objects without __dict__ (e.g. properties) do not have members
+        if not hasattr(member, '__dict__'):
+            continue
+        for submember in extract_members(member).values():
+            if id(submember) in visited:
+                continue
+            visited.add(id(submember))
+            depth = _nesting_depth(submember)
+            if depth is None or obj_depth is None:
+                submember_indent_level = member_indent_level + 1
+            else:
+                submember_indent_level = max(indent_level + depth - obj_depth, 0)
+            queue.append((submember, submember_indent_level))
+    return members
+
+
+def _nesting_depth(obj):
+    """Return the number of objects in which the object is defined.
+
+    Parameters
+    ----------
+    obj : function, module, class, property
+
+    Returns
+    -------
+    depth : {int, None}
+        Number of the classes and functions in which the object is defined, plus one, as given by
+        its qualified name (e.g. 1 for the functions of the module and 2 for the methods of its
+        classes). Modules have a depth of zero.
+        None if the object does not have a qualified name.
+
+    """
+    key = _member_key(obj)
+    if key is None:
+        return None
+    if key == '':
+        return 0
+    return sum(part != '<locals>' for part in key.split('.'))
+
+
+def _caller_frame(depth=1):
+    """Return the frame of the module code that called the function.
+
+    Parameters
+    ----------
+    depth : {int, 1}
+        Number of frames between this function and the function whose caller is returned.
+        Default is 1.
+
+    Returns
+    -------
+    frame : frame
+
+    Notes
+    -----
+    Frames of the code that do not belong to a source file (e.g. `<frozen importlib._bootstrap>`)
+    are skipped. Unlike `inspect.stack`, the source code of the frames is not read.
+
+    """
+    # pylint: disable=W0212
+    frame = sys._getframe(depth + 1)
+    while frame.f_back is not None and frame.f_code.co_filename.startswith('<'):
+        frame = frame.f_back
+    return frame
+
+
+def docstring_current_module(width=100, tabsize=4, lazy=False, cache=False, verify=None):
     """Wrap the docstrings of all objects defined within the current module.
 
     Call this function within the module whose objects will be wrapped.
@@ -145,6 +680,17 @@ def docstring_current_module(width=100, tabsize=4):
     tabsize : {int, 4}
         Number of spaces that corresponds to one tab.
         Default is 4.
+    lazy : {bool, False}
+        True if the docstrings of the classes and modules are rendered when they are accessed for
+        the first time.
+        Default is False.
+    cache : {bool, False}
+        True if the rendered docstrings are stored in (and loaded from) `__docinstance_cache__`.
+        See `wrap_module`.
+        Default is False.
+    verify : {docinstance.verify.Verifier, None}
+        Verifier with which the generated docstrings are compared to the original docstrings.
+        Default is None (no verification).
 
     Notes
     -----
@@ -153,89 +699,379 @@ def docstring_current_module(width=100, tabsize=4):
 
     """
     # get the module that called this function
-    module = next(inspect.getmodule(i[0]) for i in inspect.stack()[1:]  # pragma: no branch
-                  if inspect.getmodule(i[0]) is not None)
-    # recursively convert
-    # NOTE: docstring for the module will always not be indented
-    docstring_recursive(module, width=width, indent_level=0, tabsize=tabsize)
+    module = sys.modules[_caller_frame().f_globals['__name__']]
+    wrap_module(module, width=width, tabsize=tabsize, lazy=lazy, cache=cache, verify=verify)
 
 
-# TODO: make this function work for built in packages as well?
-# FIXME: doesn't work if the module has already been imported. If so, then the module needs to be
-# reloaded (importlib.reload(module))
-def docstring_modify_import(width=100, tabsize=4):
-    """Modify import behaviour to wrap the docstrings of related objects after the import.
+def _member_key(member):
+    """Return the key that identifies the object within its module in the on-disk cache.
 
-    This function should be placed in the __init__.py of the package to ensure that the import
-    behaviour is different only for the given package. It is assumed that the package is organized
-    by directories where the __init__.py of the package is the parent directory in which all of the
-    modules are located. For example, it is assumed that there are no soft-links to directories
-    outside of this package.
+    Parameters
+    ----------
+    member : function, module, class, property
+        Object within the module (or the module itself).
+
+    Returns
+    -------
+    key : {str, None}
+        Qualified name of the object. Properties are identified by their getters and the module is
+        identified by an empty string.
+        None if the object cannot be identified.
+
+    """
+    if isinstance(member, ModuleType):
+        return ''
+    if isinstance(member, property):
+        member = member.fget
+    return getattr(member, '__qualname__', None)
+
+
+def _object_name(obj):
+    """Return the name of the object that is used in the verification records.
+
+    Parameters
+    ----------
+    obj : function, module, class, property
+
+    Returns
+    -------
+    name : str
+        Name of the module, or the qualified name of the object with the name of its module.
+
+    """
+    if isinstance(obj, ModuleType):
+        return obj.__name__
+    key = _member_key(obj)
+    if key is None:
+        return repr(obj)
+    module = getattr(obj.fget if isinstance(obj, property) else obj, '__module__', None)
+    if module is None:
+        return key
+    return '{0}.{1}'.format(module, key)
+
+
+def wrap_module(module, width=100, tabsize=4, lazy=False, cache=False, verify=None):
+    """Wrap the docstrings of the module and of the objects defined within it.
 
     Parameters
     ----------
+    module : module
+        Module whose objects are wrapped.
     width : {int, 100}
         Maximum number of characters allowed in each line.
         Default is 100.
     tabsize : {int, 4}
         Number of spaces that corresponds to one tab.
         Default is 4.
+    lazy : {bool, False}
+        True if the docstrings of the classes and modules are rendered when they are accessed for
+        the first time.
+        Ignored if the cache is used, since all of the docstrings are then loaded (or rendered and
+        stored) immediately.
+        Default is False.
+    cache : {bool, False}
+        True if the rendered docstrings are stored in (and loaded from) `__docinstance_cache__`.
+        Default is False.
+    verify : {docinstance.verify.Verifier, None}
+        Verifier with which the generated (or cached) docstrings are compared to the original
+        docstrings.
+        Default is None (no verification).
+
+    Returns
+    -------
+    module : module
+        Given module.
 
     Notes
     -----
-    This function modifies some pretty low level code, so it should be used with caution.
+    The cached docstrings are used only if the source file of the module is unchanged (same
+    modification time and size), so the Docstring instances must be determined by the source code
+    of the module. Docstring instances that depend on anything else (e.g. environment variables or
+    other files) should not be cached.
 
-    Since the modified loader is the SourceFileLoader, this function does not affect the import of
-    built-in packages.
+    Modules without a python source file are never cached.
 
     """
-    # find the location from which this function is called
-    parentfile = next(inspect.getsourcefile(i[0]) for i in inspect.stack()[1:]  # pragma: no branch
-                      if inspect.getmodule(i[0]) is not None)
-    parentdir = os.path.dirname(parentfile)
+    source_path = getattr(module, '__file__', None)
+    if not (cache and isinstance(source_path, str) and source_path.endswith('.py')):
+        # NOTE: docstring for the module will always not be indented
+        return docstring_recursive(module, width=width, indent_level=0, tabsize=tabsize,
+                                   lazy=lazy, verify=verify)
+
+    params = {'width': width, 'tabsize': tabsize}
+    cached = disk_cache.load(source_path, params)
+    docs = {}
+    is_stale = cached is None
+    is_cacheable = True
+    for member, member_indent_level in collect_members_recursive(module, indent_level=0):
+        if not hasattr(member, '_docinstance'):
+            continue
+        key = _member_key(member)
+        if key is None or key in docs:
+            is_cacheable = False
+        if cached is not None and key in cached:
+            original = member.__doc__
+            member.__doc__ = cached[key]
+            if verify is not None and isinstance(original, str) and verify.sample_next():
+                verify.verify(_object_name(member), original, member.__doc__)
+        else:
+            is_stale = True
+            docstring(member, width=width, indent_level=member_indent_level, tabsize=tabsize,
+                      verify=verify)
+        docs[key] = member.__doc__
+    if is_stale and is_cacheable:
+        disk_cache.save(source_path, params, docs)
+    return module
+
 
-    def pandora_box(old_import):
-        """Change the import behaviour.
+def _path_parts(path):
+    """Return the components of the normalized absolute path.
+
+    Parameters
+    ----------
+    path : str
+
+    Returns
+    -------
+    parts : list of str
+
+    """
+    return os.path.normcase(os.path.abspath(path)).split(os.sep)
+
+
+class DocstringLoader(importlib.machinery.SourceFileLoader):
+    """Loader of the python source files that wraps the docstrings after the module is executed.
+
+    Attributes
+    ----------
+    name : str
+        Name of the module.
+    path : str
+        Path to the source file.
+    settings : dict
+        Keyword arguments of `wrap_module`.
+
+    Methods
+    -------
+    __init__(self, fullname, path, settings)
+        Initialize.
+    exec_module(self, module)
+        Execute the module and wrap its docstrings.
+
+    """
+
+    def __init__(self, fullname, path, settings):
+        """Initialize.
+
+        Parameters
+        ----------
+        fullname : str
+            Name of the module.
+        path : str
+            Path to the source file.
+        settings : dict
+            Keyword arguments of `wrap_module`.
+
+        """
+        super().__init__(fullname, path)
+        self.settings = settings
+
+    def exec_module(self, module):
+        """Execute the module and wrap its docstrings.
+
+        Parameters
+        ----------
+        module : module
+
+        """
+        super().exec_module(module)
+        wrap_module(module, **self.settings)
+
+
+class DocstringFinder(importlib.abc.MetaPathFinder):
+    """Finder of the modules within the registered directories whose docstrings are wrapped.
+
+    Directories are stored in a trie of their path components so that a path can be checked
+    against all of the registered directories at once. Modules outside of the registered
+    directories are left to the other finders.
+
+    Methods
+    -------
+    __init__(self)
+        Initialize.
+    register(self, directory, settings)
+        Register the directory whose modules will be wrapped.
+    lookup(self, directory)
+        Return the settings of the registered directory that contains the given directory.
+    find_spec(self, fullname, path, target=None)
+        Return the spec of the module that is loaded with DocstringLoader.
+    invalidate_caches(self)
+        Clear the cached results of the lookup.
+
+    """
+
+    def __init__(self):
+        """Initialize."""
+        self._trie = {}
+        self._lookup_cache = {}
+
+    def register(self, directory, settings):
+        """Register the directory whose modules will be wrapped.
 
         Parameters
         ----------
-        old_import : importlib._bootstrap_external.SourceFileLoader.exec_module
-            Function that is executed when a module is imported.
-            This decorator is intended for the SourceFileLoader.exec_module and using it on other
-            functions may result in weird behaviour.
+        directory : str
+            Directory that contains the modules.
+        settings : dict
+            Keyword arguments of `wrap_module` used to wrap the modules.
+            If the directory was already registered, then its settings are replaced.
+
+        """
+        node = self._trie
+        for part in _path_parts(directory):
+            node = node.setdefault(part, {})
+        # NOTE: None cannot be a path component
+        node[None] = settings
+        self._lookup_cache.clear()
+
+    @property
+    def directories(self):
+        """Return the registered directories.
 
         Returns
         -------
-        new_import : function
-            Function that has been modified to wrap the docstrings of the objects of the module by
-            recursively scanning the __dict__.
+        directories : set of str
 
         """
-        if not hasattr(old_import, 'special_cases'):
-            old_import.special_cases = set()
-        old_import.special_cases.add(parentdir)
+        directories = set()
+        stack = [([], self._trie)]
+        while stack:
+            parts, node = stack.pop()
+            for part, child in node.items():
+                if part is None:
+                    directories.add(os.sep.join(parts))
+                else:
+                    stack.append((parts + [part], child))
+        return directories
 
-        def new_import(*args, **kwargs):
-            """Import and then overwrite __doc__ using _docinstance."""
-            old_import(*args, **kwargs)
+    def lookup(self, directory):
+        """Return the settings of the registered directory that contains the given directory.
 
-            # NOTE: the arguments to the function
-            # importlib._bootstrap_external.SourceFileLoader.exec_module is the SourceFileLoader
-            # instance (i.e. self) and the module that is executed. We are assuming here that this
-            # decorator will be applied only to `exc_module`.
-            module = args[1]
-            sourcefile = inspect.getsourcefile(module)
-            if any(os.path.commonpath([sourcefile, parent]) == parent
-                   for parent in old_import.special_cases):
-                docstring_recursive(module, width=width, indent_level=0, tabsize=tabsize)
+        Parameters
+        ----------
+        directory : str
 
-        new_import.special_cases = old_import.special_cases
+        Returns
+        -------
+        settings : {dict, None}
+            Settings of the innermost registered directory that contains the given directory.
+            None if the directory is not within any of the registered directories.
 
-        return new_import
+        """
+        try:
+            return self._lookup_cache[directory]
+        except KeyError:
+            pass
+        settings = None
+        node = self._trie
+        for part in _path_parts(directory):
+            node = node.get(part)
+            if node is None:
+                break
+            settings = node.get(None, settings)
+        self._lookup_cache[directory] = settings
+        return settings
 
-    # open the box
-    # pylint: disable=W0212
-    importlib._bootstrap_external.SourceFileLoader.exec_module = pandora_box(
-        # pylint: disable=W0212
-        importlib._bootstrap_external.SourceFileLoader.exec_module
-    )
+    def find_spec(self, fullname, path, target=None):
+        """Return the spec of the module that is loaded with DocstringLoader.
+
+        Parameters
+        ----------
+        fullname : str
+            Name of the module.
+        path : {list of str, None}
+            Directories in which the module is searched.
+            If None, then `sys.path` is used.
+        target : {module, None}
+            Module that is being reloaded.
+
+        Returns
+        -------
+        spec : {importlib.machinery.ModuleSpec, None}
+            Spec of the module.
+            None if the module cannot be within the registered directories.
+
+        """
+        search_path = sys.path if path is None else path
+        if not any(isinstance(i, str) and self.lookup(i) is not None for i in search_path):
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path, target)
+        # pylint: disable=C0123
+        if spec is None or type(spec.loader) is not importlib.machinery.SourceFileLoader:
+            return spec
+        settings = self.lookup(os.path.dirname(spec.origin))
+        if settings is not None:
+            spec.loader = DocstringLoader(fullname, spec.origin, settings)
+        return spec
+
+    def invalidate_caches(self):
+        """Clear the cached results of the lookup."""
+        self._lookup_cache.clear()
+
+
+# finder that is shared by all of the calls to docstring_modify_import
+_docstring_finder = DocstringFinder()
+
+
+# TODO: make this function work for built in packages as well?
+# FIXME: doesn't work if the module has already been imported. If so, then the module needs to be
+# reloaded (importlib.reload(module))
+def docstring_modify_import(width=100, tabsize=4, lazy=False, cache=False, verify=None):
+    """Modify import behaviour to wrap the docstrings of related objects after the import.
+
+    This function should be placed in the __init__.py of the package to ensure that the import
+    behaviour is different only for the given package. It is assumed that the package is organized
+    by directories where the __init__.py of the package is the parent directory in which all of the
+    modules are located. For example, it is assumed that there are no soft-links to directories
+    outside of this package.
+
+    Parameters
+    ----------
+    width : {int, 100}
+        Maximum number of characters allowed in each line.
+        Default is 100.
+    tabsize : {int, 4}
+        Number of spaces that corresponds to one tab.
+        Default is 4.
+    lazy : {bool, False}
+        True if the docstrings of the classes and modules are rendered when they are accessed for
+        the first time, rather than when the module is imported.
+        Default is False.
+    cache : {bool, False}
+        True if the rendered docstrings are stored in (and loaded from) `__docinstance_cache__`
+        so that they are not rendered again when the modules are imported in another process.
+        See `wrap_module`.
+        Default is False.
+    verify : {docinstance.verify.Verifier, None}
+        Verifier with which the generated docstrings of the imported modules are compared to the
+        original docstrings.
+        Default is None (no verification).
+
+    Notes
+    -----
+    A DocstringFinder is added to the start of `sys.meta_path`, and the directory of the module
+    that called this function is registered. The modules that are imported from this directory (and
+    its subdirectories) are loaded with DocstringLoader, which wraps the docstrings after the module
+    is executed. Imports from outside of the registered directories are not affected.
+
+    Since only the python source files are loaded by DocstringLoader, this function does not affect
+    the import of built-in packages.
+
+    """
+    # find the location from which this function is called
+    parentdir = os.path.dirname(os.path.abspath(_caller_frame().f_code.co_filename))
+
+    _docstring_finder.register(parentdir, {'width': width, 'tabsize': tabsize, 'lazy': lazy,
+                                           'cache': cache, 'verify': verify})
+    if _docstring_finder not in sys.meta_path:
+        sys.meta_path.insert(0, _docstring_finder)
@@ -1,13 +1,19 @@
 """Installation script for docinstance module."""
+import re
 import setuptools
 
 with open("README.md", "r") as fh:
     # pylint: disable=C0103
     long_description = fh.read()
 
+# NOTE: version is defined only in the package, and it is read without importing the package
+with open("docinstance/__init__.py", "r") as fh:
+    # pylint: disable=C0103
+    version = re.search(r"^__version__ = ['\"]([^'\"]+)['\"]", fh.read(), re.MULTILINE).group(1)
+
 setuptools.setup(
     name="docinstance",
-    version="0.0.1",
+    version=version,
     author="Taewon D. Kim",
     author_email="david.kim.91@gmail.com",
     description="Docstring using flexible objects rather than strings.",
@@ -15,6 +21,8 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url="https://github.com/kimt33/docinstance",
     packages=setuptools.find_packages(),
+    python_requires=">=3.8",
+    extras_require={"numpy": ["numpy"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: GNU General Public License v3 (GPLv3)",